@@ -1,7 +1,10 @@
 import sys
 import os
+import re
 import time
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageTk
@@ -16,15 +19,129 @@ from turtle_manager import TurtleManager
 # Initialize Manager
 manager = TurtleManager()
 
+# Image extensions the GUI reads, in preference order (compared lowercase)
+_IMG_EXTS = ('.jpg', '.jpeg', '.png')
+_IMG_EXTS_SET = frozenset(_IMG_EXTS)
+_IMG_EXT_RANK = {ext: i for i, ext in enumerate(_IMG_EXTS)}
+# Case-insensitive suffix test for the bulk scan; avoids a lowercased copy of every filename
+_IMG_NAME_RE = re.compile(r'\.(?:jpe?g|png)\Z', re.IGNORECASE)
+
+# Bulk test UI pacing: flush the log every N files or T seconds, preview at most once per interval
+BULK_LOG_BATCH_SIZE = 20
+BULK_LOG_FLUSH_SECONDS = 0.25
+BULK_PREVIEW_SECONDS = 1.0
+# Concurrent searches during a bulk test; GPU work is serialized inside the brain,
+# extra workers overlap image decode/preprocessing with inference.
+BULK_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Max PhotoImages kept alive per window; older ones are deleted from Tcl's image table
+PHOTO_CACHE_SIZE = 64
+# Thumbnail size used by match cards (their PhotoImages are released when results are cleared)
+CARD_IMAGE_SIZE = (500, 300)
+
+
+def _configure_card_styles(master):
+    """Named ttk styles for match cards, so fonts are resolved once per style instead of per label."""
+    style = ttk.Style(master)
+    style.configure("CardRank.TLabel", font=("Arial", 10, "bold"), foreground="#7f8c8d")
+    style.configure("CardId.TLabel", font=("Arial", 14, "bold"), foreground="#2c3e50")
+    style.configure("CardScore.TLabel", font=("Arial", 12, "bold"), foreground="black")
+    style.configure("CardScoreGood.TLabel", font=("Arial", 12, "bold"), foreground="green")
+    style.configure("CardScoreWeak.TLabel", font=("Arial", 12, "bold"), foreground="red")
+    style.configure("CardConf.TLabel", font=("Arial", 10), foreground="#7f8c8d")
+
+
+class MatchCard:
+    """One result card in the Identify window; built once and refilled for each search."""
+
+    # Shared grey backdrop for cards without a reference image (created on first use; needs a Tk root)
+    PLACEHOLDER_PHOTO = None
+
+    @classmethod
+    def placeholder_photo(cls):
+        if cls.PLACEHOLDER_PHOTO is None:
+            cls.PLACEHOLDER_PHOTO = ImageTk.PhotoImage(Image.new('RGB', CARD_IMAGE_SIZE, '#dadada'))
+        return cls.PLACEHOLDER_PHOTO
+
+    def __init__(self, parent, on_confirm):
+        self.result = None
+        self.frame = tk.Frame(parent, bd=2, relief="groove", padx=10, pady=10)
+
+        frame_info = ttk.Frame(self.frame)
+        frame_info.pack(side="left", fill="y", padx=10)
+
+        self.lbl_rank = ttk.Label(frame_info, style="CardRank.TLabel")
+        self.lbl_rank.pack(anchor="w")
+        self.lbl_id = ttk.Label(frame_info, style="CardId.TLabel")
+        self.lbl_id.pack(anchor="w")
+        self.lbl_score = ttk.Label(frame_info, style="CardScore.TLabel")
+        self.lbl_score.pack(anchor="w")
+        self.lbl_conf = ttk.Label(frame_info, style="CardConf.TLabel")
+        self.lbl_conf.pack(anchor="w")
+
+        frame_actions = ttk.Frame(self.frame)
+        frame_actions.pack(side="right", padx=10)
+
+        self.var_upgrade = tk.BooleanVar(value=False)
+        chk_upgrade = tk.Checkbutton(frame_actions, text="This is a better\nreference image", variable=self.var_upgrade,
+                                     justify="left")
+        chk_upgrade.pack(pady=5)
+
+        btn_confirm = tk.Button(frame_actions, text="✅ Confirm",
+                                command=lambda: on_confirm(self.result, self.var_upgrade.get()), bg="#2ecc71",
+                                fg="white", font=("Arial", 11, "bold"), width=15)
+        btn_confirm.pack(pady=5)
+
+        self.lbl_img = tk.Label(self.frame, text="Image not found", image=self.placeholder_photo(), compound="center",
+                                bg="#dadada")
+        self.lbl_img.pack(side="left", expand=True, fill="both", padx=20)
+
+    def show(self, result, rank):
+        self.result = result
+        score = result.get('score', 0)
+        confidence = result.get('confidence', 0.0)
+        tid = result.get('site_id', 'Unknown')
+
+        score_style = "CardScore.TLabel"
+        if score > 400:
+            score_style = "CardScoreGood.TLabel"
+        elif score < 50:
+            score_style = "CardScoreWeak.TLabel"
+
+        self.lbl_rank.config(text=f"Rank {rank}")
+        self.lbl_id.config(text=f"ID: {tid}")
+        self.lbl_score.config(text=f"Matches: {score}", style=score_style)
+        self.lbl_conf.config(text=f"Conf: {confidence:.2f}")
+        self.var_upgrade.set(False)
+        self.frame.pack(fill="x", pady=5)
+
+    def show_missing_image(self, text="Ref JPG Missing"):
+        self.lbl_img.config(image=self.placeholder_photo(), text=text)
+        self.lbl_img.image = None
+
+    def hide(self):
+        self.result = None
+        self.frame.pack_forget()
+        self.show_missing_image("Image not found")
+
 
 class IdentifyWindow:
-    def __init__(self, master, current_device):
+    def __init__(self, master, current_device, locations, on_data_changed=None):
         self.top = tk.Toplevel(master)
         self.top.title("Identify & Add Observation")
         self.top.geometry("1600x1000")
 
         self.query_path = None
         self.current_device = current_device
+        # Called after an observation is committed (lets the dashboard drop cached locations)
+        self.on_data_changed = on_data_changed
+        # (path, size) -> ImageTk.PhotoImage, least recently used first
+        self._img_cache = OrderedDict()
+        # dir -> {stem: image path}; rebuilt per results render so each dir is listed once
+        self._stem_maps = {}
+        # MatchCard widgets reused across searches (hidden, not destroyed, when results clear)
+        self._card_pool = []
+        _configure_card_styles(self.top)
 
         # --- LEFT PANEL: CONTROLS & LOG ---
         frame_left = tk.Frame(self.top, width=450, bg="#ecf0f1")
@@ -39,7 +156,7 @@ class IdentifyWindow:
         # 2. Location Filter
         tk.Label(frame_left, text="Search Location:", bg="#ecf0f1", font=("Arial", 10)).pack(pady=(15, 2), anchor="w")
 
-        locs = manager.get_all_locations()
+        locs = list(locations)
         if "All Locations" not in locs:
             locs.insert(0, "All Locations")
 
@@ -92,44 +209,109 @@ class IdentifyWindow:
 
         self.scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        # Holds status/error labels; swapped out wholesale on clear (cards are pooled separately)
+        self._message_frame = tk.Frame(self.scrollable_frame)
+        self._message_frame.pack(fill="x")
         canvas.configure(yscrollcommand=scrollbar.set)
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+    @staticmethod
+    def _format_log_line(status_icon, filename, note="", time_taken=None):
+        t_str = f"[{time_taken:.2f}s]" if time_taken is not None else ""
+        return f"{status_icon} {filename} {t_str} {note}"
+
     def log_message(self, status_icon, filename, note="", time_taken=None):
         """Adds a line to the Session History listbox with timing"""
-        t_str = f"[{time_taken:.2f}s]" if time_taken is not None else ""
-        msg = f"{status_icon} {filename} {t_str} {note}"
-        self.log_list.insert(0, msg)
+        self.log_list.insert(0, self._format_log_line(status_icon, filename, note, time_taken))
         self.log_list.see(0)
-        self.top.update()
+
+    def _flush_log_batch(self, batch):
+        """Inserts a batch of pre-formatted log lines (oldest first) in one listbox call."""
+        self.log_list.insert(0, *reversed(batch))
+        self.log_list.see(0)
+        # Redraw just the listbox once per batch; a full update() would also run input/timer events
+        self.log_list.update_idletasks()
+
+    def _post_log_batch(self, pending):
+        """Worker-side: hands the queued log lines to the Tk thread as a single callback."""
+        if pending:
+            batch = list(pending)
+            pending.clear()
+            self.top.after(0, self._flush_log_batch, batch)
 
     def browse_image(self):
         path = filedialog.askopenfilename(filetypes=[("Images", "*.jpg *.png *.jpeg")], parent=self.top)
         if path:
             self.query_path = path
             self.show_image(path, self.lbl_query_img, size=(300, 300))
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
+            self._clear_results()
 
-    def show_image(self, path, label_widget, size=(300, 300)):
+    def show_image(self, path, label_widget, size=(300, 300), preloaded=None):
+        """Shows ``path`` in ``label_widget``; ``preloaded`` is a thumbnail already decoded off the Tk thread."""
         try:
-            img = Image.open(path)
-            img.thumbnail(size)
-            img_tk = ImageTk.PhotoImage(img)
+            img_tk = self._get_photo(path, size, preloaded)
             label_widget.config(image=img_tk, text="")
             label_widget.image = img_tk
         except Exception as e:
             print(f"Error loading image: {e}")
 
+    @staticmethod
+    def _load_thumbnail(path, size):
+        """Decodes ``path`` into a PIL thumbnail. Safe to call from worker threads."""
+        with Image.open(path) as img:
+            # Let libjpeg decode at a reduced DCT scale; previews never need full resolution
+            if img.format == 'JPEG':
+                img.draft('RGB', size)
+            img.thumbnail(size, Image.Resampling.BILINEAR)
+            return img.copy()
+
+    def _get_photo(self, path, size, preloaded=None):
+        """Returns a cached PhotoImage for (path, size), decoding the file only on a miss."""
+        key = (path, tuple(size))
+        img_tk = self._img_cache.get(key)
+        if img_tk is not None:
+            self._img_cache.move_to_end(key)
+            return img_tk
+
+        img = preloaded if preloaded is not None else self._load_thumbnail(path, size)
+        img_tk = ImageTk.PhotoImage(img)
+
+        self._img_cache[key] = img_tk
+        while len(self._img_cache) > PHOTO_CACHE_SIZE:
+            # The LRU entry is never on screen: at most a handful of labels show an image at once
+            _, old = self._img_cache.popitem(last=False)
+            self._release_photo(old)
+        return img_tk
+
+    def _release_photo(self, img_tk):
+        """Deletes the Tcl image now instead of waiting for Python GC (leaks pixmaps on Windows)."""
+        try:
+            self.top.tk.call('image', 'delete', str(img_tk))
+        except tk.TclError:
+            pass
+
+    def _release_card_photos(self):
+        for key in [k for k in self._img_cache if k[1] == CARD_IMAGE_SIZE]:
+            self._release_photo(self._img_cache.pop(key))
+
+    def _clear_results(self):
+        """Empties the results panel and frees the match-card images it was showing."""
+        # One destroy tears down every status label at once instead of a per-widget loop
+        self._message_frame.destroy()
+        self._message_frame = tk.Frame(self.scrollable_frame)
+        self._message_frame.pack(fill="x")
+        for card in self._card_pool:
+            card.hide()
+        self._release_card_photos()
+
     # --- THREADED SINGLE SEARCH ---
     def run_search(self):
         if not self.query_path: return
         self.btn_search.config(state="disabled")
 
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_results()
 
         # Dispatch to background thread
         threading.Thread(target=self._thread_search, args=(self.query_path, self.combo_location.get()),
@@ -148,12 +330,12 @@ class IdentifyWindow:
     def _handle_search_error(self, fname, error_msg):
         self.btn_search.config(state="normal")
         self.log_message("💥", fname, f"Error: {error_msg}")
-        tk.Label(self.scrollable_frame, text=f"Search failed: {error_msg}", font=("Arial", 12), fg="red").pack(pady=20)
+        tk.Label(self._message_frame, text=f"Search failed: {error_msg}", font=("Arial", 12), fg="red").pack(pady=20)
 
     def _process_single_results(self, fname, results, time_taken):
         self.btn_search.config(state="normal")
         if not results:
-            tk.Label(self.scrollable_frame, text="No matches found.", font=("Arial", 12)).pack(pady=20)
+            tk.Label(self._message_frame, text="No matches found.", font=("Arial", 12)).pack(pady=20)
             self.log_message("❌", fname, "(No Matches)", time_taken)
             return
 
@@ -161,6 +343,7 @@ class IdentifyWindow:
         top_score = results[0]['score']
         self.log_message("✅", fname, f"-> {top_match_id} ({top_score})", time_taken)
 
+        self._stem_maps = {}
         for i, res in enumerate(results):
             self.create_match_card(res, i + 1)
 
@@ -177,11 +360,10 @@ class IdentifyWindow:
         self.btn_search.config(state="disabled")
 
         # 🚀 FIX: Destroy any lingering match cards so they can't be clicked
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_results()
 
         # Add a friendly indicator that the right panel is intentionally blank
-        tk.Label(self.scrollable_frame, text="🧪 Bulk Test Running...\nSee the Left Panel for live logs.",
+        tk.Label(self._message_frame, text="🧪 Bulk Test Running...\nSee the Left Panel for live logs.",
                  font=("Arial", 12, "bold"), fg="#7f8c8d").pack(pady=40)
 
         threading.Thread(target=self._thread_bulk, args=(folder_path, self.combo_location.get()), daemon=True).start()
@@ -189,41 +371,68 @@ class IdentifyWindow:
     def _thread_bulk(self, folder_path, loc_filter):
         BULK_THRESHOLD = 400
         try:
-            files = [f for f in os.listdir(folder_path) if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+            # scandir hands back name + path from one directory read (no per-file join/stat)
+            with os.scandir(folder_path) as it:
+                files = [(e.name, e.path) for e in it
+                         if _IMG_NAME_RE.search(e.name) and e.is_file()]
         except Exception as e:
             self.top.after(0, self._handle_bulk_error, str(e))
             return
 
         total = len(files)
         count_good = 0
-        total_time = 0.0
 
         self.top.after(0, self.log_message, "🧪", "TEST START", f"Testing {total} images...")
 
-        for filename in files:
-            file_path = os.path.join(folder_path, filename)
-
-            self.top.after(0, self.show_image, file_path, self.lbl_query_img, (300, 300))
-
-            try:
-                results, time_taken = manager.search_for_matches(file_path, location_filter=loc_filter)
-            except Exception as e:
-                self.top.after(0, self.log_message, "💥", filename, f"Error: {e}")
-                continue
-
-            total_time += time_taken
-
-            if results:
-                top_score = results[0]['score']
-                top_id = results[0]['site_id']
-
-                if top_score >= BULK_THRESHOLD:
-                    self.top.after(0, self.log_message, "✅", filename, f"-> {top_id} ({top_score})", time_taken)
-                    count_good += 1
+        # Log lines are queued on this worker and flushed in batches so the Tk thread
+        # gets one callback per batch instead of two per file.
+        pending = deque()
+        t_start_ns = time.perf_counter_ns()
+        last_flush = time.monotonic()
+        last_preview = 0.0
+
+        with ThreadPoolExecutor(max_workers=BULK_MAX_WORKERS) as pool:
+            futures = {
+                pool.submit(manager.search_for_matches, file_path, location_filter=loc_filter): (filename, file_path)
+                for filename, file_path in files
+            }
+            for future in as_completed(futures):
+                filename, file_path = futures[future]
+                now = time.monotonic()
+                if len(pending) >= BULK_LOG_BATCH_SIZE or now - last_flush >= BULK_LOG_FLUSH_SECONDS:
+                    self._post_log_batch(pending)
+                    last_flush = now
+                if now - last_preview >= BULK_PREVIEW_SECONDS:
+                    last_preview = now
+                    # Decode the preview here so the Tk thread only wraps pixels in a PhotoImage
+                    try:
+                        thumb = self._load_thumbnail(file_path, (300, 300))
+                    except Exception:
+                        thumb = None
+                    if thumb is not None:
+                        self.top.after(0, self.show_image, file_path, self.lbl_query_img, (300, 300), thumb)
+
+                try:
+                    results, time_taken = future.result()
+                except Exception as e:
+                    pending.append(self._format_log_line("💥", filename, f"Error: {e}"))
+                    continue
+
+                if results:
+                    top_score = results[0]['score']
+                    top_id = results[0]['site_id']
+
+                    if top_score >= BULK_THRESHOLD:
+                        pending.append(self._format_log_line("✅", filename, f"-> {top_id} ({top_score})", time_taken))
+                        count_good += 1
+                    else:
+                        pending.append(self._format_log_line("⚠️", filename, f"Weak Match ({top_score})", time_taken))
                 else:
-                    self.top.after(0, self.log_message, "⚠️", filename, f"Weak Match ({top_score})", time_taken)
-            else:
-                self.top.after(0, self.log_message, "❌", filename, "No Matches", time_taken)
+                    pending.append(self._format_log_line("❌", filename, "No Matches", time_taken))
+
+        # Searches overlap, so the benchmark records batch wall time rather than a per-file sum
+        total_time = (time.perf_counter_ns() - t_start_ns) / 1e9
+        self._post_log_batch(pending)
 
         try:
             manager.save_benchmark(self.current_device, total_time)
@@ -235,8 +444,7 @@ class IdentifyWindow:
     def _handle_bulk_error(self, error_msg):
         self.btn_bulk.config(state="normal")
         self.btn_search.config(state="normal")
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_results()
         self.log_message("💥", "BULK ERROR", error_msg)
 
     def _bulk_test_complete(self, count_good, total, total_time):
@@ -245,8 +453,7 @@ class IdentifyWindow:
         self.btn_search.config(state="normal")
 
         # Clear the placeholder text
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_results()
 
         self.log_message("🏁", "TEST DONE", f"Passing: {count_good}/{total} | Time: {total_time:.2f}s")
         messagebox.showinfo("Bulk Test Complete",
@@ -255,53 +462,40 @@ class IdentifyWindow:
 
     # --- FULLY RESTORED ORIGINAL LOGIC ---
     def create_match_card(self, result, rank):
-        frame_card = tk.Frame(self.scrollable_frame, bd=2, relief="groove", padx=10, pady=10)
-        frame_card.pack(fill="x", pady=5)
-
-        score = result.get('score', 0)
-        confidence = result.get('confidence', 0.0)
-        tid = result.get('site_id', 'Unknown')
-
-        score_color = "black"
-        if score > 400:
-            score_color = "green"
-        elif score < 50:
-            score_color = "red"
-
-        frame_info = tk.Frame(frame_card)
-        frame_info.pack(side="left", fill="y", padx=10)
-
-        tk.Label(frame_info, text=f"Rank {rank}", font=("Arial", 10, "bold"), fg="#7f8c8d").pack(anchor="w")
-        tk.Label(frame_info, text=f"ID: {tid}", font=("Arial", 14, "bold"), fg="#2c3e50").pack(anchor="w")
-        tk.Label(frame_info, text=f"Matches: {score}", font=("Arial", 12, "bold"), fg=score_color).pack(anchor="w")
-        tk.Label(frame_info, text=f"Conf: {confidence:.2f}", font=("Arial", 10), fg="#7f8c8d").pack(anchor="w")
-
-        frame_actions = tk.Frame(frame_card)
-        frame_actions.pack(side="right", padx=10)
-
-        var_upgrade = tk.BooleanVar(value=False)
-        chk_upgrade = tk.Checkbutton(frame_actions, text="This is a better\nreference image", variable=var_upgrade,
-                                     justify="left")
-        chk_upgrade.pack(pady=5)
-
-        btn_confirm = tk.Button(frame_actions, text="✅ Confirm",
-                                command=lambda r=result, v=var_upgrade: self.confirm_match(r, v.get()), bg="#2ecc71",
-                                fg="white", font=("Arial", 11, "bold"), width=15)
-        btn_confirm.pack(pady=5)
-
-        lbl_img = tk.Label(frame_card, text="Image not found", bg="#dadada")
-        lbl_img.pack(side="left", expand=True, fill="both", padx=20)
+        # Cards are pooled: reuse an existing widget tree and only build one when the pool runs out
+        if rank > len(self._card_pool):
+            self._card_pool.append(MatchCard(self.scrollable_frame, self.confirm_match))
+        card = self._card_pool[rank - 1]
+        card.show(result, rank)
 
         pt_path = result.get('file_path')
         if pt_path:
-            base = os.path.splitext(pt_path)[0]
-            found = False
-            for ext in ['.jpg', '.jpeg', '.png']:
-                if os.path.exists(base + ext):
-                    self.show_image(base + ext, lbl_img, size=(500, 300))
-                    found = True
-                    break
-            if not found: lbl_img.config(text="Ref JPG Missing")
+            img_path = self._image_next_to(pt_path)
+            if img_path:
+                self.show_image(img_path, card.lbl_img, size=CARD_IMAGE_SIZE)
+            else:
+                card.show_missing_image()
+
+    def _image_next_to(self, pt_path):
+        """Finds the reference image sharing ``pt_path``'s stem, listing each directory only once."""
+        dir_path, pt_name = os.path.split(pt_path)
+        stem_map = self._stem_maps.get(dir_path)
+        if stem_map is None:
+            stem_map = {}
+            try:
+                with os.scandir(dir_path or '.') as it:
+                    for e in it:
+                        stem, ext = os.path.splitext(e.name)
+                        ext = ext.lower()
+                        if ext not in _IMG_EXTS_SET:
+                            continue
+                        current = stem_map.get(stem)
+                        if current is None or _IMG_EXT_RANK[ext] < _IMG_EXT_RANK[os.path.splitext(current)[1].lower()]:
+                            stem_map[stem] = e.path
+            except OSError:
+                pass
+            self._stem_maps[dir_path] = stem_map
+        return stem_map.get(os.path.splitext(pt_name)[0])
 
     def confirm_match(self, result, upgrade_reference):
         turtle_id = result.get('site_id')
@@ -316,6 +510,8 @@ class IdentifyWindow:
                 replace_reference=upgrade_reference
             )
             if success:
+                if self.on_data_changed:
+                    self.on_data_changed()
                 messagebox.showinfo("Success", msg, parent=self.top)
                 self.top.destroy()
             else:
@@ -363,24 +559,54 @@ class AdminDashboard:
         tk.Label(root, textvariable=self.status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W).pack(side=tk.BOTTOM,
                                                                                                fill=tk.X)
 
+        # Location dropdown values, loaded off the UI thread; None until the first scan finishes
+        self._locations_cache = None
+        self._locations_generation = 0
+        self._refresh_locations_async()
+
+    def _refresh_locations_async(self):
+        threading.Thread(target=self._load_locations, args=(self._locations_generation,), daemon=True).start()
+
+    def _load_locations(self, generation):
+        locs = manager.get_all_locations()
+        # A later invalidation makes this scan stale; drop it instead of overwriting newer data
+        if generation == self._locations_generation:
+            self._locations_cache = locs
+
+    def get_locations(self):
+        """Returns the cached location list, scanning synchronously only if the cache is cold."""
+        locs = self._locations_cache
+        if locs is None:
+            locs = manager.get_all_locations()
+            self._locations_cache = locs
+        return list(locs)
+
+    def invalidate_locations_cache(self):
+        """Drops cached locations after data changes and rescans in the background."""
+        self._locations_generation += 1
+        self._locations_cache = None
+        self._refresh_locations_async()
+
     def change_device(self):
         mode = self.device_var.get()
         manager.set_device(mode)
         self.status_var.set(f"Device switched to {mode}")
-        self.root.update()
 
     # --- FULLY RESTORED ORIGINAL LOGIC ---
     def command_bulk_ingest(self):
         drive_path = filedialog.askdirectory(title="Select Flash Drive Root")
         if drive_path:
             self.status_var.set("Ingesting... See Console.")
-            self.root.update()
+            # Paint the status bar before the blocking ingest without re-entering pending input events
+            self.root.update_idletasks()
             manager.ingest_flash_drive(drive_path)
+            self.invalidate_locations_cache()
             messagebox.showinfo("Done", "Ingest Complete")
             self.status_var.set("System Ready")
 
     def open_identify_window(self):
-        IdentifyWindow(self.root, self.device_var.get())
+        IdentifyWindow(self.root, self.device_var.get(), self.get_locations(),
+                       on_data_changed=self.invalidate_locations_cache)
 
     def open_manual_upload_window(self):
         messagebox.showinfo("Info", "Feature in development.")
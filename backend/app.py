@@ -5,15 +5,19 @@ Handles photo uploads, matching, and review queue
 
 import os
 import sys
+import traceback
 
 # Import configuration first (sets up environment)
 import config
 
 # Import Flask and CORS
-from flask import Flask
+from flask import Flask, Response, request
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
+from auth import AuthRequest
+from json_provider import OrjsonProvider
+
 # Fix Unicode encoding issues on Windows
 if sys.platform == 'win32':
     try:
@@ -38,55 +42,85 @@ from routes.locations import register_locations_routes
 from routes.general_locations import register_general_location_routes
 from routes.admin_backup import register_admin_backup_routes
 
-# Create Flask app
-app = Flask(__name__)
-CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"], "allow_headers": ["Content-Type", "Authorization"]}})
-
-# Add after_request handler to ensure CORS headers are always set
-@app.after_request
-def after_request(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,POST,PUT,PATCH,DELETE,OPTIONS')
-    return response
-
-# Register all routes (Delegates logic to the /routes folder)
-register_health_routes(app)
-register_upload_routes(app)
-register_review_routes(app)
-register_image_routes(app)
-register_sheets_routes(app)
-register_turtle_routes(app)
-register_locations_routes(app)
-register_general_location_routes(app)
-register_admin_backup_routes(app)
-
-@app.errorhandler(HTTPException)
-def handle_http_exception(err: HTTPException):
-    """404/405/etc. must not be turned into 500 by the generic handler below."""
-    return (
-        {'error': err.description or err.name},
-        err.code,
-        {'Content-Type': 'application/json'},
-    )
-
-@app.errorhandler(Exception)
-def handle_exception(err):
-    """Log unhandled exceptions and return JSON (works in debug mode too)."""
-    import traceback
-    tb = traceback.format_exc()
-    prefix = "[UNHANDLED]"
-    sys.stderr.write(f"{prefix} {err}\n{tb}")
-    sys.stderr.flush()
-    try:
-        print(f"{prefix} {err}", flush=True)
-    except Exception:
-        pass
-    return (
-        {'error': f'Server error: {str(err)}', 'details': tb if app.debug else None},
-        500,
-        {'Content-Type': 'application/json'},
-    )
+_CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+_CORS_ALLOW_HEADERS = ("Content-Type", "Authorization")
+# Built once; browsers may cache the answer for a day (Chrome caps it at 2h) instead of
+# preflighting every candidate-image and API call.
+_PREFLIGHT_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', ', '.join(_CORS_METHODS)),
+    ('Access-Control-Allow-Headers', ', '.join(_CORS_ALLOW_HEADERS)),
+    ('Access-Control-Max-Age', '86400'),
+)
+
+
+def create_app():
+    """Build the configured Flask app (routes, CORS, JSON error handlers).
+
+    ``python app.py`` serves it with Flask's threaded dev server. For a production WSGI
+    server, use ONE process with threads -- TurtleManager, the GPU model and the approval
+    lock live in-process, so extra worker processes would each load the model and could
+    double-process review packets:
+
+        gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5000 app:app
+    """
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.request_class = AuthRequest  # request.user_full: every JWT claim, on demand
+    app.config['MAX_CONTENT_LENGTH'] = config.MAX_REQUEST_SIZE
+    app.config['USE_X_SENDFILE'] = config.USE_X_SENDFILE
+    # flask-cors is the single source of CORS headers on real responses (a second after_request
+    # hook used to .add() them again, producing duplicate Access-Control-* headers that
+    # browsers reject). It skips responses that already carry Access-Control-Allow-Origin.
+    # send_wildcard: answer "*" like the prebuilt preflight rather than echoing the Origin
+    CORS(app, resources={r"/api/*": {"origins": "*", "send_wildcard": True, "methods": list(_CORS_METHODS), "allow_headers": list(_CORS_ALLOW_HEADERS)}})
+
+    @app.before_request
+    def _answer_preflight():
+        """OPTIONS under /api/ gets the prebuilt preflight answer without routing or auth."""
+        if request.method == 'OPTIONS' and request.path.startswith('/api/'):
+            return Response(status=204, headers=_PREFLIGHT_HEADERS)
+
+    # Register all routes (Delegates logic to the /routes folder)
+    register_health_routes(app)
+    register_upload_routes(app)
+    register_review_routes(app)
+    register_image_routes(app)
+    register_sheets_routes(app)
+    register_turtle_routes(app)
+    register_locations_routes(app)
+    register_general_location_routes(app)
+    register_admin_backup_routes(app)
+
+    @app.errorhandler(HTTPException)
+    def handle_http_exception(err: HTTPException):
+        """404/405/etc. must not be turned into 500 by the generic handler below."""
+        return (
+            {'error': err.description or err.name},
+            err.code,
+            {'Content-Type': 'application/json'},
+        )
+
+    @app.errorhandler(Exception)
+    def handle_exception(err):
+        """Log unhandled exceptions and return JSON (works in debug mode too).
+
+        The traceback string is only built in debug mode, where it is sent back as ``details``;
+        otherwise the logging handler formats it once (and skips it entirely if ERROR is filtered).
+        """
+        tb = traceback.format_exc() if app.debug else None
+        app.logger.error("[UNHANDLED] %s: %s", type(err).__name__, err, exc_info=err)
+        return (
+            {'error': f'Server error: {str(err)}', 'details': tb},
+            500,
+            {'Content-Type': 'application/json'},
+        )
+
+    return app
+
+
+# Module-level app for `python app.py`, WSGI servers (app:app) and tests
+app = create_app()
 
 if __name__ == '__main__':
     debug_mode = os.environ.get('FLASK_DEBUG', 'true').lower() == 'true'
@@ -104,10 +138,10 @@ if __name__ == '__main__':
         sys.stdout.flush()
 
     try:
-        app.run(debug=debug_mode, host='0.0.0.0', port=port, use_reloader=False)
+        # Dev server; threaded so a slow upload/match does not block other requests
+        app.run(debug=debug_mode, host='0.0.0.0', port=port, use_reloader=False, threaded=True)
     except Exception as e:
         print(f"[ERROR] Exception during app.run(): {str(e)}", flush=True)
         sys.stdout.flush()
-        import traceback
         traceback.print_exc()
         sys.stderr.flush()
\ No newline at end of file
@@ -2,22 +2,89 @@
 JWT Authentication utilities and decorators
 """
 
+import hashlib
 import json
 import ssl
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import OrderedDict, namedtuple
 
 import jwt
 from functools import wraps
-from flask import request, jsonify
-from config import JWT_SECRET, AUTH_URL
+from flask import Request, g, request, jsonify
+from config import JWT_SECRET, AUTH_URL, JWT_CACHE_TTL_SEC, JWT_CACHE_MAXSIZE
+
+# The claims the backend actually reads (auth-backend signs id/email/role; tests use sub).
+# Cache entries keep only these, as a tuple, instead of the whole decoded payload.
+AuthCtx = namedtuple('AuthCtx', 'id sub email role exp')
+
+# Successfully verified tokens: sha256(token)[:16] -> (AuthCtx, expires_at), oldest first.
+# Failures are never cached, so a bad token is always re-checked.
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token):
+    return hashlib.sha256(token.encode('utf-8')).digest()[:16]
+
+
+def _auth_ctx(payload):
+    return AuthCtx(*(payload.get(field) for field in AuthCtx._fields))
+
+
+def _ctx_dict(ctx):
+    """``AuthCtx`` as the dict routes see in ``request.user`` (absent claims left out)."""
+    return {k: v for k, v in ctx._asdict().items() if v is not None}
+
+
+def _get_cached_payload(key, now):
+    """Cached claims for ``key`` as a fresh dict, or ``None`` on miss/expiry."""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        ctx, expires_at = entry
+        if now >= expires_at:
+            del _token_cache[key]
+            return None
+        _token_cache.move_to_end(key)
+    # A new dict each time, so a route mutating request.user cannot poison the cache
+    return _ctx_dict(ctx)
+
+
+def _cache_payload(key, ctx, now):
+    expires_at = now + JWT_CACHE_TTL_SEC
+    exp = ctx.exp
+    if isinstance(exp, (int, float)):
+        # Never serve a token past its own expiry
+        expires_at = min(expires_at, exp)
+    if expires_at <= now:
+        return
+    with _token_cache_lock:
+        _token_cache[key] = (ctx, expires_at)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > JWT_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+
+def clear_token_cache():
+    """Drop all cached token verifications (e.g. in tests or after rotating JWT_SECRET)."""
+    with _token_cache_lock:
+        _token_cache.clear()
 
 
 def verify_jwt_token(token):
     """
     Verify JWT token and return decoded payload.
     Returns (success: bool, payload: dict or None, error: str or None)
+
+    Verified tokens are cached for JWT_CACHE_TTL_SEC (clamped to the token's ``exp``). The
+    payload is always the ``AuthCtx`` claims, cached or not, so a route behaves the same on a
+    cold and a warm cache. Add a field to ``AuthCtx`` if routes need another claim often, or use
+    ``request.user_full`` (every claim, re-decoded on demand).
     """
     if not token:
         return False, None, 'No token provided'
@@ -27,8 +94,19 @@ def verify_jwt_token(token):
             token = token[7:]
         token = token.strip()
 
+        use_cache = JWT_CACHE_TTL_SEC > 0 and JWT_CACHE_MAXSIZE > 0
+        if use_cache:
+            key = _token_cache_key(token)
+            now = time.time()
+            cached = _get_cached_payload(key, now)
+            if cached is not None:
+                return True, cached, None
+
         decoded = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-        return True, decoded, None
+        ctx = _auth_ctx(decoded)
+        if use_cache:
+            _cache_payload(key, ctx, now)
+        return True, _ctx_dict(ctx), None
     except jwt.ExpiredSignatureError:
         return False, None, 'Token has expired'
     except jwt.InvalidTokenError as e:
@@ -44,13 +122,47 @@ def get_user_from_request():
     if not auth_header:
         return False, None, 'Authorization header required'
 
+    # Stacked decorators / route bodies share one verify per request
+    if g.get('_jwt_header') == auth_header:
+        return True, g._jwt_payload, None
+
     success, payload, error = verify_jwt_token(auth_header)
     if not success:
         return False, None, error
 
+    g._jwt_header = auth_header
+    g._jwt_payload = payload
     return True, payload, None
 
 
+def get_full_user_from_request():
+    """
+    Every claim of the request's JWT, not just ``AuthCtx`` (re-decoded once per request).
+    Returns the payload dict, or None when the request carries no valid token.
+    """
+    auth_header = request.headers.get('Authorization')
+    if not auth_header:
+        return None
+    if g.get('_jwt_full_header') == auth_header:
+        return g._jwt_full_payload
+    token = auth_header[7:] if auth_header.startswith('Bearer ') else auth_header
+    try:
+        payload = jwt.decode(token.strip(), JWT_SECRET, algorithms=['HS256'])
+    except jwt.InvalidTokenError:
+        payload = None
+    g._jwt_full_header = auth_header
+    g._jwt_full_payload = payload
+    return payload
+
+
+class AuthRequest(Request):
+    """Flask request with ``user_full``: the full JWT payload, decoded only when a route asks."""
+
+    @property
+    def user_full(self):
+        return get_full_user_from_request()
+
+
 def check_auth_revocation(auth_header):
     """
     Call auth service to enforce demotion revocation (tokens_valid_after).
@@ -132,7 +244,7 @@ def optional_auth(f):
         auth_header = request.headers.get('Authorization')
         if auth_header:
             try:
-                success, user_data, error = verify_jwt_token(auth_header)
+                success, user_data, error = get_user_from_request()
                 if success and user_data is not None:
                     request.user = user_data
             except Exception:
@@ -145,9 +257,6 @@ def require_admin(f):
     """Decorator to require staff or admin role (turtle records, release, sheets, review)."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if request.method == 'OPTIONS':
-            return jsonify({}), 200
-
         success, user_data, error = get_user_from_request()
         if not success:
             return jsonify({'error': error or 'Authentication required'}), 401
@@ -170,9 +279,6 @@ def require_admin_only(f):
     """Decorator: role must be admin (not staff) — e.g. full data backup download."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if request.method == 'OPTIONS':
-            return jsonify({}), 200
-
         success, user_data, error = get_user_from_request()
         if not success:
             return jsonify({'error': error or 'Authentication required'}), 401
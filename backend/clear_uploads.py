@@ -7,9 +7,10 @@ Clear all uploaded data from the server
 
 import os
 import shutil
-import tempfile
 from pathlib import Path
 
+from config import UPLOAD_FOLDER
+
 
 def clear_all_uploads():
     """Clear all uploaded data (Review Queue, Community Uploads, temp files)"""
@@ -63,7 +64,7 @@ def clear_all_uploads():
         print("👥 Community Uploads directory not found (already empty)\n")
     
     # 3. Clear temporary uploaded files (from temp directory)
-    temp_dir = tempfile.gettempdir()
+    temp_dir = UPLOAD_FOLDER
     print(f"📁 Clearing temporary files from: {temp_dir}")
     temp_count = 0
     
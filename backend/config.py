@@ -2,48 +2,60 @@
 Configuration and environment setup for PicTur Flask API
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
-
-from dotenv import load_dotenv
 import tempfile
 
 # Fix Unicode encoding issues on Windows
 if sys.platform == 'win32':
     try:
         if hasattr(sys.stdout, 'reconfigure'):
-            sys.stdout.reconfigure(encoding='utf-8')
+            sys.stdout.reconfigure(encoding='utf-8', errors='replace')
         if hasattr(sys.stderr, 'reconfigure'):
-            sys.stderr.reconfigure(encoding='utf-8')
+            sys.stderr.reconfigure(encoding='utf-8', errors='replace')
     except (AttributeError, ValueError, OSError):
         pass
 
+# One stdout handler for the whole backend, set up once (streams are UTF-8 by now, so log
+# lines need no per-call UnicodeEncodeError fallback). LOG_LEVEL=WARNING quiets info lines.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').strip().upper() or 'INFO'
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    format='%(asctime)s %(levelname)s [%(name)s] %(message)s',
+    stream=sys.stdout,
+)
+
 # Load project .env files. auth-backend is separate.
 #
 # With override=False, values already in the OS environment win over the file. Load root .env
 # first, then backend/.env with override=True so backend/.env overrides inherited/user JWT_SECRET
 # on Windows (common source of JWT mismatches with auth-backend).
+#
+# When the process manager already supplies the environment (Docker `environment:`/--env-file,
+# systemd EnvironmentFile=), set SKIP_DOTENV=1 to skip the file lookups entirely. python-dotenv
+# is only imported when there is a file to parse.
 _root_env = Path(__file__).parent.parent / '.env'
 _backend_env = Path(__file__).parent / '.env'
 
 env_loaded = False
-if _root_env.exists():
-    load_dotenv(_root_env, override=False)
-    try:
-        print(f"✅ Loaded .env from: {_root_env}")
-    except UnicodeEncodeError:
-        print(f"[OK] Loaded .env from: {_root_env}")
-    env_loaded = True
-if _backend_env.exists():
-    load_dotenv(_backend_env, override=True)
-    try:
-        print(f"✅ Loaded .env from: {_backend_env}")
-    except UnicodeEncodeError:
-        print(f"[OK] Loaded .env from: {_backend_env}")
+_skip_dotenv = os.environ.get('SKIP_DOTENV', '').strip().lower() in ('1', 'true', 'yes')
+_env_files = [] if _skip_dotenv else [
+    (path, override) for path, override in ((_root_env, False), (_backend_env, True)) if path.exists()
+]
+if _env_files:
+    from dotenv import load_dotenv
+
+    for _env_path, _override in _env_files:
+        load_dotenv(_env_path, override=_override)
+        try:
+            print(f"✅ Loaded .env from: {_env_path}")
+        except UnicodeEncodeError:
+            print(f"[OK] Loaded .env from: {_env_path}")
     env_loaded = True
 
-if not env_loaded:
+if not env_loaded and not _skip_dotenv:
     try:
         print("⚠️  No .env file found. Using environment variables or defaults.")
     except UnicodeEncodeError:
@@ -57,14 +69,58 @@ if 'PORT' not in os.environ:
     except UnicodeEncodeError:
         print("[CFG] Using default PORT=5000 for Flask backend")
 
+
+
+# /dev/shm smaller than this (Docker's default is 64 MB, shared with torch) would run out of
+# space under a few concurrent uploads plus their HEIC->JPEG copies; use the disk temp dir then.
+MIN_SHM_UPLOAD_BYTES = 128 * 1024 * 1024
+
+
+def _default_upload_folder():
+    """RAM-backed tmpfs when available: uploads are written and immediately read back by matching."""
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        try:
+            st = os.statvfs(shm)
+            if st.f_frsize * st.f_blocks >= MIN_SHM_UPLOAD_BYTES:
+                return shm
+        except OSError:
+            pass
+    return tempfile.gettempdir()
+
+
 # Configuration constants
-UPLOAD_FOLDER = tempfile.gettempdir()
+# Per-request spool files (uploads, extra images). Exported so TurtleManager's temp-file
+# cleanup looks in the same place.
+UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER') or _default_upload_folder()
+os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+os.environ['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'heic', 'heif'}
+# Same set as '.ext' suffixes, for a single str.endswith() check
+_ALLOWED_SUFFIXES = tuple(sorted('.' + ext for ext in ALLOWED_EXTENSIONS))
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+# Whole-request cap (Flask MAX_CONTENT_LENGTH): oversized bodies get a 413 before any route
+# code runs. Larger than MAX_FILE_SIZE because one upload may carry several extra images.
+MAX_REQUEST_SIZE = int(os.environ.get('MAX_REQUEST_SIZE', str(100 * 1024 * 1024)))
+# Upload spool files in UPLOAD_FOLDER older than this are deleted by the background reaper
+# (a finished request removes its own; this catches crashes and abandoned background jobs).
+TEMP_UPLOAD_TTL_SEC = int(os.environ.get('TEMP_UPLOAD_TTL_SEC', '3600'))
+
+# Image serving behind a reverse proxy (optional). With IMAGE_ACCEL_REDIRECT_PREFIX set (e.g.
+# /internal-images), /api/images answers with an X-Accel-Redirect to that nginx `internal` location,
+# which must alias the backend data directory; nginx then sends the file itself. USE_X_SENDFILE=true
+# does the same for Apache/lighttpd via X-Sendfile. Leave both unset when clients hit Flask directly.
+IMAGE_ACCEL_REDIRECT_PREFIX = os.environ.get('IMAGE_ACCEL_REDIRECT_PREFIX', '').strip().rstrip('/')
+USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', '').strip().lower() in ('1', 'true', 'yes')
 
 # JWT Configuration - must match auth-backend JWT_SECRET
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production')
 
+# Verified JWT payloads are cached briefly so repeat requests with the same bearer skip the
+# HS256 verify. Entries never outlive the token's own `exp`. Set JWT_CACHE_TTL_SEC=0 to disable.
+JWT_CACHE_TTL_SEC = float(os.environ.get('JWT_CACHE_TTL_SEC', '5'))
+JWT_CACHE_MAXSIZE = int(os.environ.get('JWT_CACHE_MAXSIZE', '10000'))
+
 # Auth service URL (required for staff/admin routes). E.g. http://localhost:3001/api
 AUTH_URL = os.environ.get('AUTH_URL', '').rstrip('/')
 
@@ -77,4 +133,4 @@ if JWT_SECRET == 'your-secret-key-change-in-production':
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
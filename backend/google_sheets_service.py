@@ -3,14 +3,20 @@ Google Sheets API Service
 Handles all interactions with Google Sheets for turtle data management.
 """
 
+import functools
+import json
+import logging
 import os
 import ssl
 import threading
 import time
+from collections import OrderedDict
 from http.client import IncompleteRead
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
 # Import modules
@@ -19,6 +25,17 @@ from sheets import helpers
 from sheets import crud
 from sheets import migration
 from sheets import sheet_management
+from sheets.retry import call_with_retry
+from sheets.transport import SessionHttp, authorized_session
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _sheets_discovery_document() -> Optional[Dict[str, Any]]:
+    """Sheets v4 discovery document bundled with google-api-python-client, parsed once per process."""
+    doc = get_static_doc('sheets', 'v4')
+    return json.loads(doc) if doc else None
 
 
 class GoogleSheetsService:
@@ -33,8 +50,16 @@ class GoogleSheetsService:
     # Reverse mapping: internal field names to Google Sheets column headers
     FIELD_TO_COLUMN = FIELD_TO_COLUMN
 
-    # Reentrant lock for all Google Sheets API access (avoids SSL/connection errors from concurrent use)
+    # Sheet list / header row caches start at the base TTL and double (up to the max) each time a
+    # refresh comes back unchanged; a changed value drops back to the base. Our own layout writes
+    # invalidate immediately, so the TTL only bounds edits made in the Sheets UI.
     LIST_SHEETS_CACHE_TTL_SEC = 30
+    LIST_SHEETS_CACHE_MAX_TTL_SEC = 300
+    COLUMN_INDICES_CACHE_TTL_SEC = 15
+    COLUMN_INDICES_CACHE_MAX_TTL_SEC = 120
+    # Recent get_turtle_data hits (LRU); rows edited in the Sheets UI show up after the TTL
+    TURTLE_CACHE_TTL_SEC = 30
+    TURTLE_CACHE_MAXSIZE = 1024
 
     def __init__(
         self,
@@ -64,24 +89,40 @@ class GoogleSheetsService:
         if not os.path.exists(credentials_file):
             raise FileNotFoundError(f"Credentials file not found: {credentials_file}")
         
-        # Reentrant lock so the same thread can call list_sheets from within ensure_primary_id_column
-        self._api_lock = threading.RLock()
         # Cache for list_sheets to reduce API calls and SSL issues
-        self._list_sheets_cache = None
-        self._list_sheets_cache_time = 0.0
+        self._list_sheets_cache = None  # (tuple of sheet_names, timestamp, revision, ttl)
         # Cache for column indices (header row) to avoid duplicate reads in same create flow
-        self._column_indices_cache = {}  # sheet_name -> (indices_dict, timestamp)
-        self.COLUMN_INDICES_CACHE_TTL_SEC = 15
+        self._column_indices_cache = {}  # sheet_name -> (indices_dict, timestamp, revision, ttl)
+        # Bumped by our own layout writes (new tab, column insert). Cache entries remember the
+        # revision they were read at, so a read that raced a write is never served afterwards;
+        # the TTLs above only bound edits made directly in the Sheets UI.
+        self._revision = 0
+        self._revision_lock = threading.Lock()
+        # Single-flight for cache misses: key -> (event, [result, error]) of the fetch in progress
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # (sheet_name, requested id) -> (turtle_data, timestamp, revision). Row writes drop the
+        # tab's entries and bump _turtle_cache_writes so a read that raced them isn't stored.
+        self._turtle_cache = OrderedDict()
+        self._turtle_cache_writes = 0
+        self._turtle_cache_lock = threading.Lock()
+        # Serializes writes that read-then-modify a tab (header inserts, next free row, row deletes).
+        # Reads don't take it: each thread has its own API client (see `service`).
         # RLock so the same thread can re-acquire (e.g. reinit from within a locked block)
         self._api_lock = threading.RLock()
+        # Per-thread discovery client (request objects aren't shared across threads; a single
+        # shared httplib2 connection caused SSL errors like DECRYPTION_FAILED_OR_BAD_RECORD_MAC).
+        # Bumping _service_generation makes every thread rebuild its client on next use.
+        self._local = threading.local()
+        self._service_generation = 0
 
-        # Authenticate
+        # Authenticate. The parsed credentials (and their cached access token) outlive client rebuilds.
         try:
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_file,
-                scopes=['https://www.googleapis.com/auth/spreadsheets']
-            )
-            self.service = build('sheets', 'v4', credentials=credentials)
+            self._credentials = self._load_credentials(credentials_file)
+            # One keep-alive pool shared by every thread's client
+            self._session = authorized_session(self._credentials)
+            self._local.service = self._build_client()
+            self._local.generation = self._service_generation
         except Exception as e:
             raise Exception(f"Failed to authenticate with Google Sheets: {str(e)}")
 
@@ -89,6 +130,29 @@ class GoogleSheetsService:
         # Community spreadsheet: free-text general locations (no admin catalog validation in Sheets).
         self.apply_general_location_sheet_validation = apply_general_location_sheet_validation
 
+    @staticmethod
+    def _load_credentials(credentials_file: str):
+        return service_account.Credentials.from_service_account_file(
+            credentials_file,
+            scopes=['https://www.googleapis.com/auth/spreadsheets']
+        )
+
+    def _build_client(self):
+        # Per-thread clients and reinits reuse the parsed document instead of re-reading it
+        document = _sheets_discovery_document()
+        if document is None:
+            return build('sheets', 'v4', http=SessionHttp(self._session), cache_discovery=False)
+        return build_from_document(document, http=SessionHttp(self._session))
+
+    @property
+    def service(self):
+        """Google Sheets v4 client for the calling thread (built on first use in that thread)."""
+        local = self._local
+        if getattr(local, 'generation', None) != self._service_generation:
+            local.service = self._build_client()
+            local.generation = self._service_generation
+        return local.service
+
     # Helper methods that delegate to module functions
     def _escape_sheet_name(self, sheet_name: str) -> str:
         """Escape sheet name for use in A1 notation."""
@@ -102,98 +166,199 @@ class GoogleSheetsService:
         """Find the column index for a given header in a sheet."""
         return helpers.find_column_index(self.service, self.spreadsheet_id, sheet_name, column_header)
     
+    def _bump_revision(self) -> int:
+        """Mark cached sheet lists and header rows as stale (called after layout writes); returns the new revision."""
+        with self._revision_lock:
+            self._revision += 1
+            return self._revision
+
+    def _single_flight(self, key, fetch):
+        """Run fetch() once for concurrent callers with the same key; the others wait for its result."""
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = (threading.Event(), [None, None])
+        event, slot = call
+        if not leader:
+            event.wait()
+            if slot[1] is not None:
+                raise slot[1]
+            return slot[0]
+        try:
+            slot[0] = fetch()
+            return slot[0]
+        except BaseException as e:
+            slot[1] = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    @staticmethod
+    def _adapted_ttl(previous: Optional[Tuple[Any, float]], fresh: Any, base_ttl: float, max_ttl: float) -> float:
+        """
+        TTL for a refreshed cache entry.
+        
+        Args:
+            previous: (value, ttl) of the entry being refreshed, or None
+            fresh: Newly read value
+            base_ttl: TTL for new or changed values
+            max_ttl: Ceiling for values that keep coming back unchanged
+            
+        Returns:
+            Double the previous TTL (capped) if the value is unchanged, else base_ttl
+        """
+        if previous is None or previous[0] != fresh:
+            return base_ttl
+        return min(previous[1] * 2, max_ttl)
+
     def _invalidate_column_indices_cache(self, sheet_name: Optional[str] = None):
         """Invalidate cached column indices (e.g. after inserting a column)."""
+        self._bump_revision()
         if sheet_name is None:
             self._column_indices_cache.clear()
         else:
             self._column_indices_cache.pop(sheet_name, None)
 
-    def _get_all_column_indices(self, sheet_name: str) -> Dict[str, int]:
-        """Get all column indices for a sheet by reading the header row (with short TTL cache)."""
+    def _get_all_column_indices(self, sheet_name: str) -> Mapping[str, int]:
+        """Get all column indices for a sheet by reading the header row (cached until a layout write).
+
+        Every caller shares the cached mapping, so it is read-only; copy with dict() to modify.
+        """
         now = time.time()
+        revision = self._revision
         entry = self._column_indices_cache.get(sheet_name)
         if entry is not None:
-            indices, ts = entry
-            if (now - ts) < self.COLUMN_INDICES_CACHE_TTL_SEC:
+            indices, ts, cached_revision, ttl = entry
+            if cached_revision == revision and (now - ts) < ttl:
                 return indices
-            self._column_indices_cache.pop(sheet_name, None)
-        indices = helpers.get_all_column_indices(
-            self.service, self.spreadsheet_id, sheet_name, self.list_sheets
-        )
-        if indices:
-            self._column_indices_cache[sheet_name] = (indices, now)
-        return indices
 
-    def _find_row_by_primary_id(self, sheet_name: str, primary_id: str, id_column: str = 'Primary ID') -> Optional[int]:
-        """Find the row index (1-based) for a turtle with a given primary ID."""
+        def _fetch():
+            indices = helpers.get_all_column_indices(
+                self.service, self.spreadsheet_id, sheet_name, self.list_sheets
+            )
+            if not isinstance(indices, MappingProxyType):
+                indices = MappingProxyType(indices)
+            if indices:
+                previous = (entry[0], entry[3]) if entry is not None else None
+                ttl = self._adapted_ttl(
+                    previous, indices, self.COLUMN_INDICES_CACHE_TTL_SEC, self.COLUMN_INDICES_CACHE_MAX_TTL_SEC
+                )
+                self._column_indices_cache[sheet_name] = (indices, now, revision, ttl)
+                if previous is not None and previous[0] != indices:
+                    # Columns moved in the Sheets UI: cached rows were mapped with the old header
+                    self._drop_cached_turtles([sheet_name])
+            return indices
+        # Revision in the key: a caller arriving after a layout write starts its own read
+        return self._single_flight(('column_indices', sheet_name, revision), _fetch)
+
+    def _find_row_for_write(self, sheet_name: str, primary_id: str, id_column: str = 'Primary ID') -> Optional[int]:
+        """Row index (1-based) from a fresh read of the tab.
+
+        Writes that address a row by number need the row as it is now: researchers insert,
+        sort and delete rows in the Sheets UI, which our revision counter never sees.
+        """
         return sheet_management.find_row_by_primary_id(
             self.service, self.spreadsheet_id, sheet_name, primary_id, id_column, self.list_sheets
         )
-    
+
     def _ensure_primary_id_column(self, sheet_name: str) -> bool:
         """Ensure the "Primary ID" column exists in the sheet. Retries on SSL/connection errors."""
-        max_attempts = 2
-        for attempt in range(max_attempts):
-            try:
-                with self._api_lock:
-                    return sheet_management.ensure_primary_id_column(
-                        self.service, self.spreadsheet_id, sheet_name,
-                        self._get_all_column_indices,
-                        invalidate_column_indices_cache_func=self._invalidate_column_indices_cache,
-                    )
-            except (ssl.SSLError, IncompleteRead, OSError) as e:
-                err_msg = str(e).lower()
-                if attempt < max_attempts - 1 and (
-                    'ssl' in err_msg or 'decryption' in err_msg or 'incompleteread' in err_msg
-                    or 'wrong_version' in err_msg or 'cipher' in err_msg or 'mac' in err_msg
-                ):
-                    print(f"SSL/connection error in ensure_primary_id_column: {e}. Reinitializing and retrying...")
-                    try:
-                        self._reinitialize_service()
-                        time.sleep(0.5)
-                    except Exception:
-                        pass
-                    continue
-                print(f"Error ensuring Primary ID column: {e}")
-                return False
+        def _attempt():
+            # Lock per attempt only: the backoff sleep must not hold up other writers
+            with self._api_lock:
+                return sheet_management.ensure_primary_id_column(
+                    self.service, self.spreadsheet_id, sheet_name,
+                    self._get_all_column_indices,
+                    invalidate_column_indices_cache_func=self._invalidate_column_indices_cache,
+                )
+        try:
+            return call_with_retry(
+                _attempt, f"ensure_primary_id_column('{sheet_name}')",
+                on_connection_error=self._reinitialize_service,
+            )
+        except (ssl.SSLError, IncompleteRead, OSError, HttpError) as e:
+            logger.warning("Error ensuring Primary ID column for '%s': %s", sheet_name, e)
+            return False
     
     def _column_index_to_letter(self, col_idx: int) -> str:
         """Convert a 0-based column index to Google Sheets column letter."""
         return helpers.column_index_to_letter(col_idx)
     
     def _reinitialize_service(self):
-        """Reinitialize the Google Sheets service (useful for SSL connection issues)."""
+        """Reinitialize the Google Sheets service (useful for SSL connection issues).
+
+        Drops every thread's client; each one rebuilds (with fresh connections) on next use.
+        The credentials are reused: only the connections are suspect, and re-reading the key file
+        would also throw away the current access token.
+        """
         with self._api_lock:
             try:
-                credentials_file = os.environ.get('GOOGLE_SHEETS_CREDENTIALS_PATH')
-                if not credentials_file:
-                    raise ValueError("Google Sheets credentials path not found")
-                
-                credentials = service_account.Credentials.from_service_account_file(
-                    credentials_file,
-                    scopes=['https://www.googleapis.com/auth/spreadsheets']
-                )
-                self.service = build('sheets', 'v4', credentials=credentials)
+                # Fresh pool: a connection that hit an SSL error must not be handed out again
+                self._session = authorized_session(self._credentials)
+                self._service_generation += 1
                 self._invalidate_list_sheets_cache()
-                print("✅ Google Sheets service reinitialized")
+                logger.info("✅ Google Sheets service reinitialized")
             except Exception as e:
-                print(f"⚠️ Failed to reinitialize Google Sheets service: {e}")
+                logger.warning("⚠️ Failed to reinitialize Google Sheets service: %s", e)
                 raise
 
-    # Public CRUD methods (all run under _api_lock to avoid concurrent API use and SSL errors)
+    def _drop_cached_turtles(self, sheet_names: Optional[List[str]] = None):
+        """Forget cached turtle reads for these tabs (all tabs if None) after a row write."""
+        with self._turtle_cache_lock:
+            self._turtle_cache_writes += 1
+            if sheet_names is None:
+                self._turtle_cache.clear()
+                return
+            names = set(sheet_names)
+            for key in [key for key in self._turtle_cache if key[0] in names]:
+                del self._turtle_cache[key]
+
+    # Public CRUD methods. Reads run concurrently (per-thread clients); writes hold _api_lock.
     def get_turtle_data(self, primary_id: str, sheet_name: str, state: Optional[str] = None, location: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Get turtle data from Google Sheets by primary ID."""
-        with self._api_lock:
-            return crud.get_turtle_data(
-                self.service, self.spreadsheet_id, primary_id, sheet_name, state, location,
-                self._ensure_primary_id_column, self._find_row_by_primary_id, self._get_all_column_indices
-            )
+        """Get turtle data from Google Sheets by primary ID (recent hits are served from memory)."""
+        key = ((sheet_name or '').strip(), primary_id)
+        with self._turtle_cache_lock:
+            revision, writes = self._revision, self._turtle_cache_writes
+            entry = self._turtle_cache.get(key)
+            if entry is not None:
+                data, ts, cached_revision = entry
+                if cached_revision == revision and (time.time() - ts) < self.TURTLE_CACHE_TTL_SEC:
+                    self._turtle_cache.move_to_end(key)
+                    return dict(data)
+                del self._turtle_cache[key]
+        data = crud.get_turtle_data(
+            self.service, self.spreadsheet_id, primary_id, sheet_name, state, location,
+            self._ensure_primary_id_column, self.list_sheets
+        )
+        if data is None:
+            return None
+        with self._turtle_cache_lock:
+            if (self._revision, self._turtle_cache_writes) == (revision, writes):
+                self._turtle_cache[key] = (dict(data), time.time(), revision)
+                self._turtle_cache.move_to_end(key)
+                while len(self._turtle_cache) > self.TURTLE_CACHE_MAXSIZE:
+                    self._turtle_cache.popitem(last=False)
+        return data
+
+    def get_turtle_data_bulk(self, ids_by_sheet: Dict[str, List[str]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get many turtles at once (one values.batchGet): {sheet: [ids]} -> {sheet: {id: data}}."""
+        return crud.get_turtle_data_bulk(
+            self.service, self.spreadsheet_id, ids_by_sheet,
+            self._ensure_primary_id_column, self.list_sheets
+        )
     
     def create_turtle_data(self, turtle_data: Dict[str, Any], sheet_name: str, state: Optional[str] = None, location: Optional[str] = None) -> Optional[str]:
         """Create a new turtle entry in Google Sheets."""
+        return self.create_turtle_data_bulk([turtle_data], sheet_name, state, location)[0]
+
+    def create_turtle_data_bulk(self, turtle_data_list: List[Dict[str, Any]], sheet_name: str,
+                                state: Optional[str] = None, location: Optional[str] = None) -> List[Optional[str]]:
+        """Create many turtles in one tab (one next-row read, one values.batchUpdate) -> primary ID each."""
         with self._api_lock:
-            if turtle_data.get('deceased') is not None:
+            if any(turtle_data.get('deceased') is not None for turtle_data in turtle_data_list):
                 sheet_management.ensure_deceased_column(
                     self.service,
                     self.spreadsheet_id,
@@ -201,12 +366,12 @@ class GoogleSheetsService:
                     self.list_sheets,
                     self._invalidate_column_indices_cache,
                 )
-            created = crud.create_turtle_data(
-                self.service, self.spreadsheet_id, turtle_data, sheet_name, state, location,
+            created = crud.create_turtle_data_bulk(
+                self.service, self.spreadsheet_id, turtle_data_list, sheet_name, state, location,
                 self._ensure_primary_id_column, self._get_all_column_indices,
                 self._invalidate_column_indices_cache,
             )
-            if created and not self.apply_general_location_sheet_validation:
+            if any(created) and not self.apply_general_location_sheet_validation:
                 try:
                     sheet_management.clear_general_location_validation(
                         self.service, self.spreadsheet_id, sheet_name
@@ -220,52 +385,73 @@ class GoogleSheetsService:
     
     def update_turtle_data(self, primary_id: str, turtle_data: Dict[str, Any], sheet_name: str, state: Optional[str] = None, location: Optional[str] = None) -> bool:
         """Update existing turtle data in Google Sheets."""
+        if not sheet_name or not sheet_name.strip():
+            logger.error(
+                "update_turtle_data: sheet_name is empty (primary_id=%s, state=%s, location=%s, fields=%s)",
+                primary_id, state, location, list(turtle_data.keys()),
+            )
+            raise ValueError("sheet_name must be provided and cannot be empty")
+        return self.update_turtle_data_bulk([(primary_id, sheet_name, turtle_data)])[0]
+
+    def update_turtle_data_bulk(self, updates: List[Tuple[str, str, Dict[str, Any]]]) -> List[bool]:
+        """Update many turtles at once: (primary_id, sheet_name, turtle_data) tuples -> one bool each.
+
+        Rows are read with one values.batchGet and written with one values.batchUpdate.
+        """
         with self._api_lock:
-            if turtle_data.get('deceased') is not None:
+            sheet_names = [self._get_sheet_name_for_region(sheet_name) for _, sheet_name, _ in updates]
+            for sheet_name in dict.fromkeys(
+                sheet_name for sheet_name, (_, _, turtle_data) in zip(sheet_names, updates)
+                if turtle_data.get('deceased') is not None
+            ):
                 sheet_management.ensure_deceased_column(
                     self.service,
                     self.spreadsheet_id,
-                    self._get_sheet_name_for_region(sheet_name, state, location),
+                    sheet_name,
                     self.list_sheets,
                     self._invalidate_column_indices_cache,
                 )
-            ok = crud.update_turtle_data(
-                self.service, self.spreadsheet_id, primary_id, turtle_data, sheet_name, state, location,
-                self._ensure_primary_id_column, self._find_row_by_primary_id, self._get_all_column_indices,
+            results = crud.update_turtle_data_bulk(
+                self.service, self.spreadsheet_id, updates,
+                self._ensure_primary_id_column, self.list_sheets, self._get_all_column_indices,
                 self._invalidate_column_indices_cache,
             )
-            if ok and not self.apply_general_location_sheet_validation:
-                try:
-                    sheet_management.clear_general_location_validation(
-                        self.service, self.spreadsheet_id, sheet_name
-                    )
-                except Exception as clear_err:
-                    print(
-                        f"WARNING: Could not clear General Location dropdown on community sheet "
-                        f"'{sheet_name}': {clear_err}"
-                    )
-            return ok
+            self._drop_cached_turtles(sheet_names)
+            if not self.apply_general_location_sheet_validation:
+                for sheet_name in dict.fromkeys(
+                    sheet_name for sheet_name, ok in zip(sheet_names, results) if ok
+                ):
+                    try:
+                        sheet_management.clear_general_location_validation(
+                            self.service, self.spreadsheet_id, sheet_name
+                        )
+                    except Exception as clear_err:
+                        print(
+                            f"WARNING: Could not clear General Location dropdown on community sheet "
+                            f"'{sheet_name}': {clear_err}"
+                        )
+            return results
     
     def delete_turtle_data(self, primary_id: str, sheet_name: str) -> bool:
         """Delete turtle data from Google Sheets by removing the entire row."""
         with self._api_lock:
-            return crud.delete_turtle_data(
-                self.service, self.spreadsheet_id, primary_id, sheet_name, self._find_row_by_primary_id
+            deleted = crud.delete_turtle_data(
+                self.service, self.spreadsheet_id, primary_id, sheet_name, self._find_row_for_write
             )
+            # Rows below the deleted one shift up, so every cached row_index on the tab is off
+            self._drop_cached_turtles([(sheet_name or '').strip()])
+            return deleted
     
     def find_turtle_sheet(self, primary_id: str) -> Optional[str]:
-        """Find which sheet contains a turtle with the given primary ID."""
-        with self._api_lock:
-            return crud.find_turtle_sheet(
-                self.service, self.spreadsheet_id, primary_id, self.list_sheets, self._find_row_by_primary_id
-            )
+        """Find which sheet contains a turtle with the given primary ID (two batchGets across all tabs)."""
+        return crud.find_turtle_sheet(self.service, self.spreadsheet_id, primary_id, self.list_sheets)
 
     # Migration methods
     def generate_primary_id(self, state: Optional[str] = None, location: Optional[str] = None) -> str:
         """Generate a new unique primary ID for a turtle."""
         with self._api_lock:
             return migration.generate_primary_id(
-                self.service, self.spreadsheet_id, self.list_sheets, self._find_row_by_primary_id, state, location
+                self.service, self.spreadsheet_id, self.list_sheets, state=state, location=location
             )
 
     def generate_biology_id(self, gender: str = 'U', sheet_name: Optional[str] = None) -> str:
@@ -291,63 +477,56 @@ class GoogleSheetsService:
     def migrate_ids_to_primary_ids(self) -> Dict[str, int]:
         """Migrate all turtles from using "ID" column to "Primary ID" column."""
         with self._api_lock:
-            return migration.migrate_ids_to_primary_ids(
-                self.service, self.spreadsheet_id, self.list_sheets, self._ensure_primary_id_column, self.generate_primary_id
-            )
+            try:
+                return migration.migrate_ids_to_primary_ids(
+                    self.service, self.spreadsheet_id, self.list_sheets, self._ensure_primary_id_column, self.generate_primary_id
+                )
+            finally:
+                self._drop_cached_turtles()
 
     def get_sheet_values(self, range_name: str) -> Optional[Dict[str, Any]]:
-        """Get values for a range (e.g. "Sheet1!A:Z"). Runs under API lock; retries on SSL/connection errors."""
-        max_attempts = 2
-        for attempt in range(max_attempts):
-            try:
-                with self._api_lock:
-                    result = self.service.spreadsheets().values().get(
-                        spreadsheetId=self.spreadsheet_id,
-                        range=range_name,
-                    ).execute()
-                    return result
-            except (ssl.SSLError, IncompleteRead, OSError) as e:
-                err_msg = str(e).lower()
-                if attempt < max_attempts - 1 and (
-                    'ssl' in err_msg or 'decryption' in err_msg or 'incompleteread' in err_msg
-                    or 'wrong_version' in err_msg or 'cipher' in err_msg or 'mac' in err_msg
-                ):
-                    try:
-                        self._reinitialize_service()
-                        time.sleep(0.5)
-                    except Exception:
-                        pass
-                    continue
-                raise
-        return None
+        """Get values for a range (e.g. "Sheet1!A:Z"). Retries on SSL/connection errors and 429/5xx."""
+        return call_with_retry(
+            lambda: self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=range_name,
+                fields='values',
+            ).execute(),
+            f"get_sheet_values('{range_name}')",
+            on_connection_error=self._reinitialize_service,
+        )
 
     # Sheet management methods
     def _invalidate_list_sheets_cache(self):
         """Invalidate cached sheet list (e.g. after creating a new sheet)."""
+        self._bump_revision()
         self._list_sheets_cache = None
 
     def list_sheets(self) -> List[str]:
-        """List all available sheets (tabs) in the spreadsheet.
-        Uses a reentrant lock and short-lived cache to avoid concurrent Google API calls
-        that can trigger SSL errors (DECRYPTION_FAILED_OR_BAD_RECORD_MAC, WRONG_VERSION_NUMBER).
-        """
-        with self._api_lock:
-            now = time.time()
-            if (
-                self._list_sheets_cache is not None
-                and (now - self._list_sheets_cache_time) < self.LIST_SHEETS_CACHE_TTL_SEC
-            ):
-                return list(self._list_sheets_cache)
-            result = sheet_management.list_sheets(
+        """List all available sheets (tabs) in the spreadsheet (cached until a layout write)."""
+        revision = self._revision
+        cached = self._list_sheets_cache
+        if cached is not None:
+            names, ts, cached_revision, ttl = cached
+            if cached_revision == revision and (time.time() - ts) < ttl:
+                return list(names)
+
+        def _fetch():
+            result = tuple(sheet_management.list_sheets(
                 self.service, self.spreadsheet_id, self._reinitialize_service
+            ))
+            ttl = self._adapted_ttl(
+                (cached[0], cached[3]) if cached is not None else None, result,
+                self.LIST_SHEETS_CACHE_TTL_SEC, self.LIST_SHEETS_CACHE_MAX_TTL_SEC,
             )
-            self._list_sheets_cache = result
-            self._list_sheets_cache_time = time.time()
+            self._list_sheets_cache = (result, time.time(), revision, ttl)
             return result
+        return list(self._single_flight(('list_sheets', revision), _fetch))
 
     def create_sheet_with_headers(self, sheet_name: str) -> bool:
         """Create a new sheet (tab) with all required headers."""
         with self._api_lock:
+            existed = sheet_name in self.list_sheets()
             result = sheet_management.create_sheet_with_headers(
                 self.service,
                 self.spreadsheet_id,
@@ -357,26 +536,42 @@ class GoogleSheetsService:
                 header_order=list(CANONICAL_COLUMN_ORDER),
                 apply_general_location_validation=self.apply_general_location_sheet_validation,
             )
-            if result:
-                self._invalidate_list_sheets_cache()
+            if result and not existed:
+                self._cache_created_sheet(sheet_name)
             return result
 
+    def _cache_created_sheet(self, sheet_name: str):
+        """
+        Write-through after creating a tab: we know its name and header row, so the next
+        create on it needs neither a list_sheets nor a header read.
+        """
+        cached = self._list_sheets_cache
+        extend_list = cached is not None and cached[2] == self._revision
+        # New revision first, so a list/header read that started before the create can't be cached over this
+        revision = self._bump_revision()
+        now = time.time()
+        self._list_sheets_cache = (
+            (cached[0] + (sheet_name,), now, revision, self.LIST_SHEETS_CACHE_TTL_SEC) if extend_list else None
+        )
+        self._column_indices_cache[sheet_name] = (
+            helpers.header_column_indices(CANONICAL_COLUMN_ORDER), now, revision, self.COLUMN_INDICES_CACHE_TTL_SEC,
+        )
+
     def get_sheet_rows(self, sheet_name: str) -> Optional[List[List[Any]]]:
         """
         Get all rows from a sheet tab (for backup export).
         Returns a list of rows, each row a list of cell values, or None on error.
         """
-        with self._api_lock:
-            try:
-                range_ = self._escape_sheet_name(sheet_name)
-                result = self.service.spreadsheets().values().get(
-                    spreadsheetId=self.spreadsheet_id,
-                    range=range_,
-                ).execute()
-                return result.get('values') or []
-            except HttpError as e:
-                print(f"Backup: could not read sheet '{sheet_name}': {e}")
-                return None
-            except Exception as e:
-                print(f"Backup: error reading sheet '{sheet_name}': {e}")
-                return None
+        try:
+            range_ = helpers.escape_sheet_name(sheet_name)
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=range_,
+            ).execute()
+            return result.get('values') or []
+        except HttpError as e:
+            print(f"Backup: could not read sheet '{sheet_name}': {e}")
+            return None
+        except Exception as e:
+            print(f"Backup: error reading sheet '{sheet_name}': {e}")
+            return None
@@ -0,0 +1,55 @@
+"""Flask JSON provider backed by orjson (C-implemented), falling back to the stdlib when absent.
+
+Output matches Flask's default provider for the types the API returns: keys stay sorted and
+dates still go through Flask's ``default`` (HTTP date strings). Anything orjson refuses is
+re-serialized by the stdlib path, so switching providers never turns a response into a 500.
+"""
+
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib encoder is used instead
+    orjson = None
+
+_ORJSON_OPTIONS = 0
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def read_json_file(path):
+    """Parse a JSON file (UTF-8). Raises ``json.JSONDecodeError``/``OSError`` like ``json.load``."""
+    # Unbuffered: the whole file is read at once, so a BufferedReader/TextIOWrapper adds nothing.
+    with open(path, 'rb', buffering=0) as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """``app.json`` provider: orjson for ``jsonify``/``request.get_json`` when installed."""
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs.get('cls') is not None:
+            return super().dumps(obj, **kwargs)
+        option = _ORJSON_OPTIONS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -64,7 +64,7 @@ def _build_backup_zip(scope: str, sheet_name: str | None) -> tuple[bytes, str]:
     sheet_name: required for scope=sheet (Google Sheet tab name).
     Returns (zip_bytes, suggested_filename).
     """
-    if not manager_service.manager_ready.wait(timeout=30):
+    if not manager_service.wait_for_manager(timeout=30):
         raise RuntimeError("Data manager not ready")
     mgr = manager_service.manager
     if mgr is None:
@@ -205,15 +205,11 @@ def register_admin_backup_routes(app):
     @require_admin
     def get_backup_window():
         """Schedule info for the admin-page countdown overlay (staff + admin)."""
-        if request.method == "OPTIONS":
-            return "", 200
         return jsonify(_compute_next_backup_window())
 
     @app.route("/api/backup/archive", methods=["GET", "OPTIONS"])
     @require_admin_only
     def download_admin_backup_archive():
-        if request.method == "OPTIONS":
-            return "", 200
         scope = (request.args.get("scope") or "").strip().lower()
         sheet_name = (request.args.get("sheet") or "").strip() or None
         if not scope:
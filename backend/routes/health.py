@@ -2,10 +2,28 @@
 Health check endpoints
 """
 
-from flask import jsonify
+import json
+
+from flask import Response
 from services import manager_service
 
 
+def _json_body(payload):
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+# Probes hit these every few seconds and the payload has only two states: serialize once.
+_HEALTH_BODIES = {
+    manager_status: _json_body({
+        'status': 'ok',
+        'message': 'PicTur API is running',
+        'manager': manager_status,
+    })
+    for manager_status in ('ready', 'loading')
+}
+_ROOT_BODY = _json_body({'status': 'ok'})
+
+
 def register_health_routes(app):
     """Register health check routes"""
     
@@ -13,18 +31,9 @@ def register_health_routes(app):
     def health_check():
         """Health check endpoint - available immediately (use module ref so we see current value after background init)"""
         manager_status = 'ready' if manager_service.manager is not None else 'loading'
-        response = jsonify({
-            'status': 'ok', 
-            'message': 'PicTur API is running',
-            'manager': manager_status
-        })
-        # Ensure proper headers for health check
-        response.headers['Content-Type'] = 'application/json'
-        return response
+        return Response(_HEALTH_BODIES[manager_status], mimetype='application/json')
 
     @app.route('/', methods=['GET'])
     def root():
         """Simple root endpoint for health checks"""
-        response = jsonify({'status': 'ok'})
-        response.headers['Content-Type'] = 'application/json'
-        return response
+        return Response(_ROOT_BODY, mimetype='application/json')
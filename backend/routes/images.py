@@ -2,14 +2,109 @@
 Image serving endpoint
 """
 
+import functools
+import mimetypes
 import os
+import unicodedata
+from datetime import datetime, timezone
 from io import BytesIO
+from urllib.parse import quote, unquote
 
 import image_utils  # noqa: F401 — registers HEIF opener for Pillow
-from flask import request, jsonify, send_file
+from flask import request, jsonify, send_file, Response
+from werkzeug.http import is_resource_modified
 from PIL import Image, ImageOps
 from services import manager_service
-from config import UPLOAD_FOLDER
+from config import UPLOAD_FOLDER, IMAGE_ACCEL_REDIRECT_PREFIX
+
+# Browsers may reuse an image for this long without asking again; after that the ETag
+# turns the revalidation into a bodyless 304.
+IMAGE_CACHE_MAX_AGE = 3600
+
+
+# Base directories never change at runtime; resolve them once instead of per request.
+_TEMP_DIR_ABS = os.path.abspath(UPLOAD_FOLDER)
+
+
+@functools.lru_cache(maxsize=8)
+def _abs_dir(path):
+    """``os.path.abspath`` of a base directory, memoized."""
+    return os.path.abspath(path)
+
+
+@functools.lru_cache(maxsize=8)
+def _base_prefix(base_abs):
+    """Case-normalized base directory with a trailing separator, memoized per base."""
+    base = os.path.normcase(base_abs)
+    return base if base.endswith(os.sep) else base + os.sep
+
+
+def _is_within(path_abs, base_abs):
+    """is_path_within_base for a path that is already absolute and normalized (no ``..`` left)."""
+    path = os.path.normcase(path_abs)
+    prefix = _base_prefix(base_abs)
+    return path.startswith(prefix) or path + os.sep == prefix
+
+
+def is_path_within_base(file_path, base_abs):
+    """
+    Safely check if file_path is within the absolute directory base_abs.
+    abspath collapses any ``..``, and the prefix ends in a separator, so a sibling such as
+    ``<base>_backup`` does not match the way a bare startswith(base) would.
+    """
+    try:
+        file_abs = os.path.abspath(file_path)
+    except (ValueError, OSError):
+        # ValueError can occur for paths with NUL bytes; OSError for invalid paths
+        return False
+    return _is_within(file_abs, base_abs)
+
+
+# Not in every platform's mimetypes table
+_EXTRA_MIMETYPES = {'.heic': 'image/heic', '.heif': 'image/heif'}
+
+
+@functools.lru_cache(maxsize=64)
+def _mimetype_for_ext(ext):
+    return mimetypes.guess_type('f' + ext)[0] or _EXTRA_MIMETYPES.get(ext, 'application/octet-stream')
+
+
+def _mimetype(path):
+    """Content-Type by file extension, memoized so send_file does not guess it per request."""
+    return _mimetype_for_ext(os.path.splitext(path)[1].lower())
+
+
+def _file_etag(st, suffix=''):
+    """ETag from mtime + size; changes whenever the file is rewritten."""
+    tag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+    return f"{tag}-{suffix}" if suffix else tag
+
+
+def _accel_redirect_response(full_path, data_dir, st, as_attachment=False):
+    """
+    Hand the file body off to nginx (``X-Accel-Redirect``) so it is sent with sendfile(2)
+    instead of being streamed through Python. Only for files under the data directory,
+    which is what the internal nginx location aliases.
+    """
+    rel = os.path.relpath(full_path, data_dir).replace(os.sep, '/')
+    resp = Response(status=200)
+    resp.headers['X-Accel-Redirect'] = f"{IMAGE_ACCEL_REDIRECT_PREFIX}/{quote(rel)}"
+    resp.mimetype = _mimetype(full_path)
+    if as_attachment:
+        # Same Content-Disposition send_file builds (ASCII fallback plus RFC 5987 filename*)
+        name = os.path.basename(full_path)
+        try:
+            name.encode('ascii')
+            names = {'filename': name}
+        except UnicodeEncodeError:
+            simple = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+            names = {'filename': simple, 'filename*': f"UTF-8''{quote(name, safe='!#$&+-.^_`|~')}"}
+        resp.headers.set('Content-Disposition', 'attachment', **names)
+    resp.set_etag(_file_etag(st))
+    resp.last_modified = st.st_mtime
+    resp.cache_control.public = True
+    resp.cache_control.max_age = IMAGE_CACHE_MAX_AGE
+    return resp.make_conditional(request)
 
 
 def _thumbnail_jpeg_bytes(full_path: str, max_dim: int):
@@ -63,57 +158,51 @@ def register_image_routes(app):
         
         # Decode the path
         try:
-            from urllib.parse import unquote
             decoded_path = unquote(image_path)
         except:
             decoded_path = image_path
         
-        # Security: Only serve images from allowed directories
-        safe_path = os.path.normpath(decoded_path)
-        
-        # Check if path is within data directory or temp directory
-        # Wait for manager to be ready (use module ref so we see current value after background init)
-        if not manager_service.manager_ready.wait(timeout=5):
-            return jsonify({'error': 'TurtleManager is still initializing'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
-        
-        data_dir = os.path.abspath(os.path.normpath(manager_service.manager.base_dir))
-        temp_dir = os.path.abspath(os.path.normpath(UPLOAD_FOLDER))
-        
-        def is_path_within_base(file_path, base_dir):
-            """
-            Safely check if file_path is within base_dir using os.path.commonpath.
-            This prevents path traversal attacks that startswith() would allow.
-            """
+        # Security: Only serve images from allowed directories. Each candidate path is made
+        # absolute and normalized exactly once; the containment checks then compare it as is.
+        abs_path = None
+        if os.path.isabs(decoded_path):
             try:
-                file_abs = os.path.abspath(os.path.normpath(file_path))
-                base_abs = os.path.abspath(os.path.normpath(base_dir))
-                # Get the common path and verify it equals the base directory
-                common = os.path.commonpath([file_abs, base_abs])
-                return common == base_abs
+                abs_path = os.path.abspath(decoded_path)
             except (ValueError, OSError):
-                # ValueError can occur if paths are on different drives (Windows)
-                # OSError can occur for invalid paths
-                return False
+                return jsonify({'error': 'Image not found'}), 404
         
         full_path = None
-        # Check if path is absolute and within allowed directories
-        if os.path.isabs(safe_path):
-            if is_path_within_base(safe_path, data_dir) or is_path_within_base(safe_path, temp_dir):
-                if os.path.exists(safe_path) and os.path.isfile(safe_path):
-                    full_path = safe_path
+        data_dir = None
+        # Set when full_path was resolved under data_dir, so the accel check needs no second containment test
+        in_data_dir = False
+        if abs_path is not None and _is_within(abs_path, _TEMP_DIR_ABS):
+            # Fresh uploads live in the temp dir; serving them does not need TurtleManager,
+            # so they keep working during warmup.
+            if os.path.isfile(abs_path):
+                full_path = abs_path
         else:
-            # Relative path - try to resolve it
-            for base_dir in [data_dir, temp_dir]:
-                potential_path = os.path.normpath(os.path.join(base_dir, safe_path))
-                if os.path.exists(potential_path) and os.path.isfile(potential_path):
+            # Data directory paths: wait for manager (module ref so we see the value after background init)
+            if not manager_service.wait_for_manager(timeout=5):
+                return jsonify({'error': 'TurtleManager is still initializing'}), 503
+            if manager_service.manager is None:
+                return jsonify({'error': 'TurtleManager failed to initialize'}), 500
+            data_dir = _abs_dir(manager_service.manager.base_dir)
+
+            if abs_path is not None:
+                if _is_within(abs_path, data_dir) and os.path.isfile(abs_path):
+                    full_path = abs_path
+                    in_data_dir = True
+            else:
+                # Relative path - try to resolve it
+                for base_dir in (data_dir, _TEMP_DIR_ABS):
+                    potential_path = os.path.normpath(os.path.join(base_dir, decoded_path))
                     # Verify it's still within the base directory using safe check
-                    if is_path_within_base(potential_path, base_dir):
+                    if _is_within(potential_path, base_dir) and os.path.isfile(potential_path):
                         full_path = potential_path
+                        in_data_dir = base_dir == data_dir
                         break
-        
-        if not full_path or not os.path.exists(full_path):
+
+        if not full_path:
             return jsonify({'error': 'Image not found'}), 404
 
         # ?download=1 forces the browser to save rather than render inline.
@@ -121,20 +210,43 @@ def register_image_routes(app):
         # Wins over max_dim — a download means the user wants the original full-res file.
         download_flag = (request.args.get('download') or '').strip().lower()
         as_attachment = download_flag in ('1', 'true', 'yes')
+        accel = bool(IMAGE_ACCEL_REDIRECT_PREFIX) and in_data_dir
         if as_attachment:
-            return send_file(full_path, as_attachment=True, download_name=os.path.basename(full_path))
+            if accel:
+                return _accel_redirect_response(full_path, data_dir, os.stat(full_path), as_attachment=True)
+            return send_file(full_path, mimetype=_mimetype(full_path), as_attachment=True,
+                             download_name=os.path.basename(full_path))
+
+        st = os.stat(full_path)
 
         max_dim_raw = request.args.get('max_dim', type=int)
         if max_dim_raw is not None:
             max_dim = max(32, min(2048, max_dim_raw))
             lower = full_path.lower()
             if lower.endswith(('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tif', '.tiff', '.heic', '.heif')):
+                # Repeat views of the same preview revalidate without decoding the original again.
+                thumb_etag = _file_etag(st, f"w{max_dim}")
+                # is_resource_modified needs a datetime (it calls .replace() on it), not a float
+                last_modified = datetime.fromtimestamp(st.st_mtime, timezone.utc)
+                # If-None-Match wins; clients that only send If-Modified-Since get the 304 too
+                if not is_resource_modified(request.environ, etag=thumb_etag, last_modified=last_modified):
+                    resp = Response(status=304)
+                    resp.set_etag(thumb_etag)
+                    resp.last_modified = last_modified
+                    resp.cache_control.public = True
+                    resp.cache_control.max_age = IMAGE_CACHE_MAX_AGE
+                    return resp
                 try:
                     thumb = _thumbnail_jpeg_bytes(full_path, max_dim)
                     if thumb is not None:
-                        return send_file(thumb, mimetype='image/jpeg')
+                        return send_file(thumb, mimetype='image/jpeg', etag=thumb_etag,
+                                         last_modified=last_modified, max_age=IMAGE_CACHE_MAX_AGE)
                 except Exception:
                     pass
 
+        if accel:
+            return _accel_redirect_response(full_path, data_dir, st)
 
-        return send_file(full_path)
+        # With USE_X_SENDFILE on, Flask emits an X-Sendfile header instead of a body.
+        return send_file(full_path, mimetype=_mimetype(full_path), conditional=True, etag=_file_etag(st),
+                         max_age=IMAGE_CACHE_MAX_AGE)
@@ -3,10 +3,53 @@ Backend location folders (State/Location) for review and manual upload.
 Used for two-level path selection: sheet (state) + location.
 """
 
+import os
+
 from flask import jsonify
 from auth import require_admin
 from services import manager_service
 
+# (data-dir fingerprint, locations) from the last scan
+_locations_cache = None
+
+
+def _subfolder_mtimes(path):
+    """Sorted ``(name, mtime_ns)`` of the directories directly inside ``path``."""
+    with os.scandir(path) as it:
+        return tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in it if entry.is_dir()))
+
+
+def _locations_fingerprint(base_dir):
+    """
+    mtimes of the data directory, its state folders and their immediate subfolders, or None if
+    unreadable. get_all_locations tells a location from a turtle folder by whether State/Sub
+    holds plastron/ or ref_data/, and creating those changes only State/Sub's mtime, so the
+    subfolders are part of the fingerprint. Still only stats, no per-subfolder listing.
+    """
+    try:
+        top = os.stat(base_dir).st_mtime_ns
+        with os.scandir(base_dir) as it:
+            states = sorted(
+                (entry.name, entry.stat().st_mtime_ns, _subfolder_mtimes(entry.path))
+                for entry in it if entry.is_dir()
+            )
+    except OSError:
+        return None
+    return top, tuple(states)
+
+
+def _get_locations(manager):
+    """manager.get_all_locations(), rescanned only when the data folder fingerprint changes."""
+    global _locations_cache
+    fingerprint = _locations_fingerprint(manager.base_dir)
+    cached = _locations_cache
+    if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    locations = manager.get_all_locations()
+    if fingerprint is not None:
+        _locations_cache = (fingerprint, locations)
+    return locations
+
 
 def register_locations_routes(app):
     """Register location-related routes"""
@@ -19,12 +62,12 @@ def register_locations_routes(app):
         Returns State/Location strings, e.g. ["Kansas/Wichita", "Kansas/Lawrence", "Nebraska/Topeka", "Community_Uploads"].
         Used for community upload new-turtle and manual upload location selection.
         """
-        if not manager_service.manager_ready.wait(timeout=30):
+        if not manager_service.wait_for_manager(timeout=30):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager failed to initialize'}), 500
         try:
-            locations = manager_service.manager.get_all_locations()
+            locations = _get_locations(manager_service.manager)
             return jsonify({'success': True, 'locations': locations})
         except Exception as e:
             return jsonify({'error': str(e)}), 500
@@ -2,13 +2,17 @@
 Review queue endpoints
 """
 
+import functools
 import os
 import json
+import logging
+import threading
 import time
-import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
-from flask import request, jsonify
+from flask import Response, current_app, request, jsonify
 from werkzeug.utils import secure_filename
 from auth import require_admin
 from services import manager_service
@@ -21,6 +25,11 @@ from general_locations_catalog import (
     resolve_general_location_from_sheet_and_value,
 )
 from additional_image_labels import normalize_additional_type, normalize_label_list, parse_labels_from_form
+from routes.upload import clear_pt_image_cache
+from json_provider import read_json_file
+from upload_utils import save_upload_limited
+
+logger = logging.getLogger(__name__)
 
 
 def normalize_new_turtle_location_for_disk(
@@ -90,32 +99,189 @@ def normalize_new_turtle_location_for_disk(
     return (out, resolved_general_loc)
 
 
+_ADDITIONAL_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+_PACKET_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png'})
+
+# Parsed candidate_matches listings keyed by directory, reused while the directory's mtime is
+# unchanged (adding/removing a candidate bumps it). Review packets are polled far more often
+# than their candidates change.
+_CANDIDATE_CACHE_MAXSIZE = 512
+_candidate_cache = OrderedDict()  # candidates_dir -> (mtime_ns, [candidate dicts])
+_candidate_cache_lock = threading.RLock()
+
+# Parsed metadata.json / manifest.json files keyed by path, reused while mtime and size are
+# unchanged. They are only rewritten when a packet is edited, but every queue poll reads them.
+_JSON_CACHE_MAXSIZE = 2048
+_json_cache = OrderedDict()  # path -> ((mtime_ns, size), parsed JSON)
+_json_cache_lock = threading.RLock()
+
+
+def _scan_dir(path):
+    """One ``os.scandir`` pass: ``{name: DirEntry}`` (empty if the directory is missing)."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
+def _ext(name):
+    """Lower-cased extension of ``name`` (``''`` when there is none)."""
+    return os.path.splitext(name)[1].lower()
+
+
+def _quiet_unlink(path):
+    """Remove ``path`` if it exists; a missing file or other OSError is ignored."""
+    if not path:
+        return
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _first_packet_image(packet_dir):
+    """Path of the packet's uploaded image (first listed .jpg/.jpeg/.png), or ``None``.
+
+    Stops reading the directory at the first match instead of listing it whole.
+    """
+    try:
+        with os.scandir(packet_dir) as it:
+            for entry in it:
+                if not entry.name.startswith('.') and _ext(entry.name) in _PACKET_IMAGE_EXTS:
+                    return entry.path
+    except OSError:
+        pass
+    return None
+
+
+def _entry_is_file(entry):
+    try:
+        return entry is not None and entry.is_file()
+    except OSError:
+        return False
+
+
+def _entry_is_dir(entry):
+    try:
+        return entry is not None and entry.is_dir()
+    except OSError:
+        return False
+
+
+def _read_json_cached(path, entry):
+    """``read_json_file(path)``, served from cache while the file's mtime/size are unchanged.
+
+    The parsed value is shared between calls; callers must copy before mutating it.
+    """
+    try:
+        st = entry.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    if key is not None:
+        with _json_cache_lock:
+            cached = _json_cache.get(path)
+            if cached is not None and cached[0] == key:
+                _json_cache.move_to_end(path)
+                return cached[1]
+
+    data = read_json_file(path)
+
+    if key is not None:
+        with _json_cache_lock:
+            _json_cache[path] = (key, data)
+            _json_cache.move_to_end(path)
+            while len(_json_cache) > _JSON_CACHE_MAXSIZE:
+                _json_cache.popitem(last=False)
+    return data
+
+
+def _parse_candidate_filename(candidate_file):
+    """``Rank1_IDT42_Conf85.jpg`` -> ``(rank, turtle_id, confidence)``."""
+    # Strip extension case-insensitively (.JPG was left on parts, breaking int() for Rank/Conf).
+    root, ext = os.path.splitext(candidate_file)
+    base_name = root if ext.lower() in _PACKET_IMAGE_EXTS else candidate_file
+    rank, turtle_id, confidence = 0, 'Unknown', 0
+    # Slice off the tag rather than str.replace it: replace also ate 'ID' inside the turtle ID.
+    for part in base_name.split('_'):
+        if part.startswith('Rank'):
+            rank = int(part[4:])
+        elif part.startswith('ID'):
+            turtle_id = part[2:]
+        elif part.startswith('Conf'):
+            confidence = int(part[4:])
+        elif part.startswith('Score'):
+            confidence = 0
+    return rank, turtle_id, confidence
+
+
+def _list_candidates(candidates_dir, dir_entry):
+    """Candidate dicts for ``candidates_dir`` in rank order, served from cache while its mtime is unchanged."""
+    try:
+        mtime_ns = dir_entry.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
+        with _candidate_cache_lock:
+            cached = _candidate_cache.get(candidates_dir)
+            if cached is not None and cached[0] == mtime_ns:
+                _candidate_cache.move_to_end(candidates_dir)
+                return [dict(c) for c in cached[1]]
+
+    candidates = []
+    names = sorted(n for n in _scan_dir(candidates_dir) if _ext(n) in _PACKET_IMAGE_EXTS)
+    for candidate_file in names:
+        rank, turtle_id, confidence = _parse_candidate_filename(candidate_file)
+        candidates.append({
+            'rank': rank,
+            'turtle_id': turtle_id,
+            'confidence': confidence,
+            'image_path': os.path.join(candidates_dir, candidate_file),
+        })
+    # Sorted once here (stable, so equal ranks stay in filename order); cache hits come back ready.
+    candidates.sort(key=lambda c: c['rank'])
+
+    if mtime_ns is not None:
+        with _candidate_cache_lock:
+            _candidate_cache[candidates_dir] = (mtime_ns, candidates)
+            _candidate_cache.move_to_end(candidates_dir)
+            while len(_candidate_cache) > _CANDIDATE_CACHE_MAXSIZE:
+                _candidate_cache.popitem(last=False)
+    return [dict(c) for c in candidates]
+
+
 def format_review_packet_item(packet_dir, request_id):
     """Build one queue item dict from packet_dir (used by get_review_queue and get_review_packet)."""
+    # A single readdir of the packet answers every "does X exist" question below.
+    entries = _scan_dir(packet_dir)
+
     metadata_path = os.path.join(packet_dir, 'metadata.json')
     metadata = {}
-    if os.path.exists(metadata_path):
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+    metadata_entry = entries.get('metadata.json')
+    if _entry_is_file(metadata_entry):
+        metadata = dict(_read_json_cached(metadata_path, metadata_entry))
 
     additional_images = []
     additional_dir = os.path.join(packet_dir, 'additional_images')
 
-    def parse_manifest_or_folder(target_dir):
+    def parse_manifest_or_folder(target_dir, target_entries):
         results = []
         manifest_path = os.path.join(target_dir, 'manifest.json')
         processed_files = set()
 
-        if os.path.isfile(manifest_path):
+        manifest_entry = target_entries.get('manifest.json')
+        if _entry_is_file(manifest_entry):
             try:
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
+                manifest = _read_json_cached(manifest_path, manifest_entry)
                 for entry in manifest:
                     fn = entry.get('filename')
                     kind = entry.get('type', 'other')
                     if fn:
                         p = os.path.join(target_dir, fn)
-                        if os.path.isfile(p):
+                        listed = target_entries.get(fn)
+                        # Fall back to a stat only for names the listing missed (case-insensitive FS).
+                        if _entry_is_file(listed) or (listed is None and os.path.isfile(p)):
                             row = {
                                 'filename': fn,
                                 'type': kind,
@@ -130,39 +296,40 @@ def format_review_packet_item(packet_dir, request_id):
             except (json.JSONDecodeError, OSError):
                 pass
 
-        if os.path.isdir(target_dir):
-            for f in sorted(os.listdir(target_dir)):
-                if f != 'manifest.json' and f not in processed_files and f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')):
-                    results.append({
-                        'filename': f,
-                        'type': 'other',
-                        'labels': [],
-                        'timestamp': None,
-                        'image_path': os.path.join(target_dir, f),
-                    })
+        for f in sorted(target_entries):
+            if f != 'manifest.json' and f not in processed_files and _ext(f) in _ADDITIONAL_IMAGE_EXTS:
+                results.append({
+                    'filename': f,
+                    'type': 'other',
+                    'labels': [],
+                    'timestamp': None,
+                    'image_path': os.path.join(target_dir, f),
+                })
         return results
 
-    if os.path.isdir(additional_dir):
-        additional_images.extend(parse_manifest_or_folder(additional_dir))
-        for item in sorted(os.listdir(additional_dir)):
-            item_path = os.path.join(additional_dir, item)
-            if os.path.isdir(item_path):
-                additional_images.extend(parse_manifest_or_folder(item_path))
+    if _entry_is_dir(entries.get('additional_images')):
+        additional_entries = _scan_dir(additional_dir)
+        additional_images.extend(parse_manifest_or_folder(additional_dir, additional_entries))
+        for item in sorted(additional_entries):
+            if _entry_is_dir(additional_entries[item]):
+                item_path = os.path.join(additional_dir, item)
+                additional_images.extend(parse_manifest_or_folder(item_path, _scan_dir(item_path)))
 
     uploaded_image = None
-    for f in os.listdir(packet_dir):
-        if f.lower().endswith(('.jpg', '.png', '.jpeg')) and f != 'metadata.json' and not f.startswith('.'):
+    for f in entries:
+        if not f.startswith('.') and _ext(f) in _PACKET_IMAGE_EXTS:
             uploaded_image = os.path.join(packet_dir, f)
             break
 
     candidates_dir = os.path.join(packet_dir, 'candidate_matches')
+    candidates_entry = entries.get('candidate_matches')
+    has_candidates_dir = _entry_is_dir(candidates_entry)
     failed_path = os.path.join(packet_dir, 'match_search_failed.json')
-    match_search_failed = os.path.isfile(failed_path)
+    match_search_failed = _entry_is_file(entries.get('match_search_failed.json'))
     match_search_error = None
     if match_search_failed:
         try:
-            with open(failed_path, 'r', encoding='utf-8') as f:
-                fail_data = json.load(f)
+            fail_data = read_json_file(failed_path)
             if isinstance(fail_data, dict):
                 err = (fail_data.get('error') or '').strip()
                 match_search_error = err or None
@@ -176,7 +343,7 @@ def format_review_packet_item(packet_dir, request_id):
     # is not "still matching" — classify as failed so the queue shows recovery actions.
     if (
         request_id.startswith('admin_')
-        and not os.path.isdir(candidates_dir)
+        and not has_candidates_dir
         and not match_search_failed
     ):
         match_search_failed = True
@@ -187,33 +354,15 @@ def format_review_packet_item(packet_dir, request_id):
 
     # candidate_matches is created after SuperPoint search succeeds in create_review_packet;
     # missing dir + no failure marker => matching still running (or legacy stuck community packet).
-    match_search_pending = not os.path.isdir(candidates_dir) and not match_search_failed
-    candidates = []
-    if os.path.isdir(candidates_dir):
-        for candidate_file in sorted(os.listdir(candidates_dir)):
-            if candidate_file.lower().endswith(('.jpg', '.png', '.jpeg')):
-                # Strip extension case-insensitively (.JPG was left on parts, breaking int() for Rank/Conf).
-                root, ext = os.path.splitext(candidate_file)
-                base_name = root if ext.lower() in ('.jpg', '.jpeg', '.png') else candidate_file
-                parts = base_name.split('_')
-                rank, turtle_id, confidence = 0, 'Unknown', 0
-                for part in parts:
-                    if part.startswith('Rank'):
-                        rank = int(part.replace('Rank', ''))
-                    elif part.startswith('ID'):
-                        turtle_id = part.replace('ID', '')
-                    elif part.startswith('Conf'):
-                        confidence = int(part.replace('Conf', ''))
-                    elif part.startswith('Score'):
-                        confidence = 0
-                candidates.append({'rank': rank, 'turtle_id': turtle_id, 'confidence': confidence, 'image_path': os.path.join(candidates_dir, candidate_file)})
+    match_search_pending = not has_candidates_dir and not match_search_failed
+    candidates = _list_candidates(candidates_dir, candidates_entry) if has_candidates_dir else []
 
     return {
         'request_id': request_id,
         'uploaded_image': uploaded_image,
         'metadata': metadata,
         'additional_images': additional_images,
-        'candidates': sorted(candidates, key=lambda x: x['rank']),
+        'candidates': candidates,
         'match_search_pending': match_search_pending,
         'match_search_failed': match_search_failed,
         'match_search_error': match_search_error,
@@ -222,66 +371,106 @@ def format_review_packet_item(packet_dir, request_id):
     }
 
 
+# Packets are independent directories; formatting them on a few threads overlaps the
+# metadata/manifest reads instead of paying each disk round-trip in turn.
+REVIEW_QUEUE_IO_WORKERS = 8
+
+
+def iter_review_queue_items(queue_items):
+    """Yield formatted queue entries (``{'path', 'request_id'}``) in order, as each one is ready."""
+    if len(queue_items) <= 1:
+        for item in queue_items:
+            yield format_review_packet_item(item['path'], item['request_id'])
+        return
+    workers = min(REVIEW_QUEUE_IO_WORKERS, len(queue_items))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(
+            lambda item: format_review_packet_item(item['path'], item['request_id']),
+            queue_items,
+        )
+
+
+def format_review_queue_items(queue_items):
+    """Format every queue entry (``{'path', 'request_id'}``), preserving order."""
+    return list(iter_review_queue_items(queue_items))
+
+
+def review_queue_body(queue_items, dumps):
+    """JSON body ``{"items": [...], "success": true}`` for the review queue.
+
+    Each item is serialized with ``dumps`` as soon as it is formatted, so encoding overlaps
+    the worker threads still reading later packets. Keys are in jsonify's sorted order.
+    """
+    items = ','.join(dumps(item) for item in iter_review_queue_items(queue_items))
+    return '{"items":[' + items + '],"success":true}'
+
+
+def _require_manager(view):
+    """Answer 503 while TurtleManager is still loading and 500 if it failed, before ``view`` runs."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        # Module ref, so requests see the manager once background init has set it.
+        if not manager_service.wait_for_manager(timeout=30):
+            return jsonify({'error': 'TurtleManager is still initializing. Please try again in a moment.'}), 503
+        if manager_service.manager is None:
+            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
+        return view(*args, **kwargs)
+    return wrapper
+
+
 def register_review_routes(app):
     """Register review queue routes"""
     
     @app.route('/api/review-queue', methods=['GET'])
     @require_admin
+    @_require_manager
     def get_review_queue():
         """
         Get all pending review queue items (Admin only)
         Returns list of community uploads waiting for review
         """
-        # Wait for manager to be ready (use module ref so we see current value after background init)
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing. Please try again in a moment.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
-        
         try:
             queue_items = manager_service.manager.get_review_queue()
-            formatted_items = [format_review_packet_item(item['path'], item['request_id']) for item in queue_items]
-            return jsonify({'success': True, 'items': formatted_items})
+            body = review_queue_body(queue_items, current_app.json.dumps)
+            return Response(body, mimetype='application/json')
         
         except Exception as e:
             return jsonify({'error': f'Failed to load review queue: {str(e)}'}), 500
 
     @app.route('/api/review-queue/<request_id>/additional-images', methods=['POST'])
     @require_admin
+    @_require_manager
     def add_review_packet_additional_images(request_id):
         """Add additional images to an existing review packet (Admin only)."""
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
         files_with_types = []
+        # One clock read per request: every file in the batch shares its upload time.
+        now = time.time()
+        now_epoch = int(now)
+        now_iso = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now))
         try:
-            for key in list(request.files.keys()):
+            # Plain-dict snapshot (first value per field, as MultiDict.get returns) for the per-file lookups.
+            form = request.form.to_dict()
+            for key, f in request.files.items():
                 if not key.startswith('file_'):
                     continue
-                f = request.files[key]
                 if not f or not f.filename:
                     continue
-                idx = key.replace('file_', '')
-                typ = normalize_additional_type(request.form.get(f'type_{idx}'))
-                lbs = parse_labels_from_form(request.form, idx)
+                idx = key[len('file_'):]
                 if not allowed_file(f.filename):
                     continue
-                f.seek(0, os.SEEK_END)
-                size = f.tell()
-                f.seek(0)
-                if size > MAX_FILE_SIZE:
-                    continue
+                typ = normalize_additional_type(form.get('type_' + idx))
+                lbs = parse_labels_from_form(form, idx)
                 orig_safe = secure_filename(f.filename) or ''
                 ext = os.path.splitext(orig_safe)[1] or '.jpg'
-                temp_path = os.path.join(UPLOAD_FOLDER, f"review_extra_{request_id}_{idx}_{int(time.time())}{ext}")
-                f.save(temp_path)
+                temp_path = os.path.join(UPLOAD_FOLDER, f"review_extra_{request_id}_{idx}_{now_epoch}{ext}")
+                if save_upload_limited(f, temp_path, MAX_FILE_SIZE) is None:
+                    continue
                 # HEIC/HEIF → JPEG (no-op for other formats)
                 temp_path = normalize_to_jpeg(temp_path)
                 item = {
                     'path': temp_path,
                     'type': typ,
-                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                    'timestamp': now_iso,
                     'original_filename': os.path.basename(orig_safe) if orig_safe else f'upload{ext}',
                 }
                 if lbs:
@@ -290,34 +479,21 @@ def register_review_routes(app):
             if not files_with_types:
                 return jsonify({'error': 'No valid image files provided'}), 400
             success, msg = manager_service.manager.add_additional_images_to_packet(request_id, files_with_types)
-            for item in files_with_types:
-                p = item.get('path')
-                if p and os.path.isfile(p):
-                    try:
-                        os.remove(p)
-                    except OSError:
-                        pass
             if not success:
                 return jsonify({'error': msg}), 400
             return jsonify({'success': True, 'message': f'Added {len(files_with_types)} image(s).'})
         except Exception as e:
-            for item in files_with_types:
-                p = item.get('path')
-                if p and os.path.isfile(p):
-                    try:
-                        os.remove(p)
-                    except OSError:
-                        pass
             return jsonify({'error': str(e)}), 500
+        finally:
+            # The manager copies the images into the packet; the temp files are never needed after.
+            for item in files_with_types:
+                _quiet_unlink(item.get('path'))
 
     @app.route('/api/review-queue/<request_id>/additional-images', methods=['DELETE'])
     @require_admin
+    @_require_manager
     def remove_review_packet_additional_image(request_id):
         """Remove one microhabitat/condition image from a packet (Admin only). Body: { "filename": "..." }."""
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
         data = request.get_json(silent=True) or {}
         filename = (data.get('filename') or '').strip()
         if not filename:
@@ -329,12 +505,9 @@ def register_review_routes(app):
 
     @app.route('/api/review-queue/<request_id>', methods=['GET'])
     @require_admin
+    @_require_manager
     def get_review_packet(request_id):
         """Get a single review packet by request_id (Admin only)."""
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
         packet_dir = manager_service.manager._resolve_packet_dir(request_id)
         if not packet_dir or not os.path.isdir(packet_dir):
             return jsonify({'error': 'Request not found'}), 404
@@ -343,6 +516,7 @@ def register_review_routes(app):
 
     @app.route('/api/review-queue/<request_id>/cross-check', methods=['POST'])
     @require_admin
+    @_require_manager
     def cross_check_review_packet(request_id):
         """Run matching against a different photo_type cache as a cross-check (Admin only).
 
@@ -352,11 +526,6 @@ def register_review_routes(app):
         Does NOT update the packet's photo_type or candidates — purely diagnostic.
         Returns match results for comparison.
         """
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
-
         data = request.get_json(silent=True) or {}
         photo_type = (data.get('photo_type') or '').strip().lower()
         if photo_type not in ('plastron', 'carapace'):
@@ -367,15 +536,11 @@ def register_review_routes(app):
             return jsonify({'error': 'Request not found'}), 404
 
         # Use specified image_path if provided, otherwise fall back to packet's main image
-        query_image = None
         specified_path = (data.get('image_path') or '').strip()
         if specified_path and os.path.isfile(specified_path):
             query_image = specified_path
         else:
-            for fname in os.listdir(packet_dir):
-                if fname.lower().endswith(('.jpg', '.png', '.jpeg')) and fname != 'metadata.json' and not fname.startswith('.'):
-                    query_image = os.path.join(packet_dir, fname)
-                    break
+            query_image = _first_packet_image(packet_dir)
         if not query_image:
             return jsonify({'error': 'No image found for cross-check'}), 400
 
@@ -387,8 +552,7 @@ def register_review_routes(app):
         metadata_path = os.path.join(packet_dir, 'metadata.json')
         if os.path.isfile(metadata_path):
             try:
-                with open(metadata_path, 'r') as mf:
-                    packet_metadata = json.load(mf)
+                packet_metadata = read_json_file(metadata_path)
                 location_filter = (packet_metadata.get('match_sheet') or '').strip() or None
             except (json.JSONDecodeError, OSError):
                 pass
@@ -438,17 +602,13 @@ def register_review_routes(app):
 
     @app.route('/api/review-queue/<request_id>/classify', methods=['POST'])
     @require_admin
+    @_require_manager
     def classify_review_packet(request_id):
         """Set photo_type on a review packet and trigger AI matching (Admin only).
 
         Body: { "photo_type": "plastron" | "carapace" }
         Updates metadata.json, clears old candidates, runs matching against the chosen cache.
         """
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
-
         data = request.get_json(silent=True) or {}
         photo_type = (data.get('photo_type') or '').strip().lower()
         if photo_type not in ('plastron', 'carapace'):
@@ -463,8 +623,7 @@ def register_review_routes(app):
         metadata = {}
         if os.path.isfile(metadata_path):
             try:
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
+                metadata = read_json_file(metadata_path)
             except (json.JSONDecodeError, OSError):
                 pass
         metadata['photo_type'] = photo_type
@@ -472,11 +631,7 @@ def register_review_routes(app):
             json.dump(metadata, f)
 
         # Find the uploaded image in the packet
-        query_image = None
-        for fname in os.listdir(packet_dir):
-            if fname.lower().endswith(('.jpg', '.png', '.jpeg')) and fname != 'metadata.json' and not fname.startswith('.'):
-                query_image = os.path.join(packet_dir, fname)
-                break
+        query_image = _first_packet_image(packet_dir)
 
         if not query_image:
             return jsonify({'error': 'No uploaded image found in packet'}), 400
@@ -513,12 +668,9 @@ def register_review_routes(app):
 
     @app.route('/api/flags', methods=['GET'])
     @require_admin
+    @_require_manager
     def get_turtles_with_flags():
         """List turtles that have find_metadata (e.g. digital flag / collected to lab) for release page."""
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing. Please try again in a moment.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
         try:
             items = manager_service.manager.get_turtles_with_flags()
             return jsonify({'success': True, 'items': items})
@@ -529,7 +681,7 @@ def register_review_routes(app):
     @require_admin
     def clear_release_flag():
         """Mark turtle as released back to nature: clear digital flag, set released_at (Admin only)."""
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -545,15 +697,12 @@ def register_review_routes(app):
 
     @app.route('/api/review/<request_id>', methods=['DELETE'])
     @require_admin
+    @_require_manager
     def delete_review(request_id):
         """
         Delete a review queue item without processing (Admin only).
         Use for junk/spam. Requires confirmation in the frontend.
         """
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing. Please try again in a moment.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
         try:
             success, message = manager_service.manager.reject_review_packet(request_id)
             if success:
@@ -564,17 +713,12 @@ def register_review_routes(app):
 
     @app.route('/api/review/<request_id>/approve', methods=['POST'])
     @require_admin
+    @_require_manager
     def approve_review(request_id):
         """
         Approve a review queue item (Admin only)
         Admin selects which of the 5 matches is the correct one, OR creates a new turtle
         """
-        # Wait for manager to be ready
-        if not manager_service.manager_ready.wait(timeout=30):
-            return jsonify({'error': 'TurtleManager is still initializing. Please try again in a moment.'}), 503
-        if manager_service.manager is None:
-            return jsonify({'error': 'TurtleManager failed to initialize'}), 500
-
         data = request.json or {}
         match_turtle_id = data.get('match_turtle_id')  # The turtle ID that was selected
         new_location = data.get('new_location')  # Optional: if creating new turtle (format: "State/Location")
@@ -686,6 +830,8 @@ def register_review_routes(app):
             )
 
             if success:
+                # Approval may have swapped reference .pt/image pairs in place.
+                clear_pt_image_cache()
                 # New turtle: create row in the correct spreadsheet (research vs community).
                 # For new turtles, Sheets sync must succeed — otherwise roll back disk and keep packet.
                 sheets_sync_error = None
@@ -795,10 +941,5 @@ def register_review_routes(app):
                 return jsonify({'error': message}), 400
 
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error approving review: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error approving review: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error approving review: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to approve review: {str(e)}'}), 500
\ No newline at end of file
@@ -2,6 +2,7 @@
 Google Sheets API endpoints
 """
 
+import logging
 import os
 import re
 import threading
@@ -16,6 +17,8 @@ from sheets import sheet_management
 from sheets import lookup as sheets_lookup
 from sheets.value_normalize import normalize_turtle_row_after_read
 
+logger = logging.getLogger(__name__)
+
 # Timeout for single attempt to find sheet + get turtle data (avoids hanging on SSL/slow API)
 SHEETS_TURTLE_DATA_TIMEOUT_SEC = 25
 
@@ -188,20 +191,10 @@ def register_sheets_routes(app):
         
         except ValueError as e:
             # Handle validation errors (e.g., empty sheet_name)
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Validation error getting turtle data from sheets: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Validation error getting turtle data from sheets: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Validation error getting turtle data from sheets: %s", e, exc_info=True)
             return jsonify({'error': f'Validation error: {str(e)}'}), 400
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error getting turtle data from sheets: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error getting turtle data from sheets: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error getting turtle data from sheets: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to get turtle data: {str(e)}'}), 500
 
     @app.route('/api/sheets/generate-primary-id', methods=['POST'])
@@ -229,12 +222,7 @@ def register_sheets_routes(app):
             })
         
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error generating primary ID: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error generating primary ID: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error generating primary ID: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to generate primary ID: {str(e)}'}), 500
 
     @app.route('/api/sheets/generate-id', methods=['POST'])
@@ -285,12 +273,7 @@ def register_sheets_routes(app):
                 'id': id_value
             })
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error generating turtle ID: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error generating turtle ID: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error generating turtle ID: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to generate turtle ID: {str(e)}'}), 500
 
     @app.route('/api/sheets/turtle', methods=['POST'])
@@ -368,12 +351,7 @@ def register_sheets_routes(app):
                 return jsonify({'error': 'Failed to create turtle data'}), 500
         
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error creating turtle data in sheets: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error creating turtle data in sheets: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error creating turtle data in sheets: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to create turtle data: {str(e)}'}), 500
 
     @app.route('/api/sheets/turtle/<primary_id>', methods=['PUT'])
@@ -527,12 +505,7 @@ def register_sheets_routes(app):
                     return jsonify({'error': 'Failed to create turtle data'}), 500
         
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error updating turtle data in sheets: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error updating turtle data in sheets: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error updating turtle data in sheets: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to update turtle data: {str(e)}'}), 500
 
     # Path must NOT be under /api/sheets/turtle/<id> or "lookup-options" is matched as a primary_id on some stacks.
@@ -574,12 +547,7 @@ def register_sheets_routes(app):
             )
             return jsonify({'success': True, 'options': options, 'count': len(options)})
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f'Error lookup-options: {str(e)}')
-            except UnicodeEncodeError:
-                print(f'Error lookup-options: {str(e)}')
-            print(f'Traceback:\n{error_trace}')
+            logger.error("Error lookup-options: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to load lookup options: {str(e)}'}), 500
 
     @app.route('/api/sheets/turtle/mark-deceased', methods=['POST'])
@@ -668,12 +636,7 @@ def register_sheets_routes(app):
                 'message': 'Deceased status updated',
             })
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f'Error mark-deceased: {str(e)}')
-            except UnicodeEncodeError:
-                print(f'Error mark-deceased: {str(e)}')
-            print(f'Traceback:\n{error_trace}')
+            logger.error("Error mark-deceased: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to mark deceased: {str(e)}'}), 500
 
     def _safe_folder_name(name):
@@ -779,12 +742,7 @@ def register_sheets_routes(app):
             })
         
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error in sheets endpoint: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error in sheets endpoint: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error in sheets endpoint: %s", e, exc_info=True)
             # Return empty list instead of failing completely
             return jsonify({
                 'success': False,
@@ -938,12 +896,7 @@ def register_sheets_routes(app):
             })
         
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error listing turtles: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error listing turtles: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error listing turtles: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to list turtles: {str(e)}'}), 500
 
     @app.route('/api/sheets/turtle-names', methods=['GET'])
@@ -982,16 +935,15 @@ def register_sheets_routes(app):
                     sheet_ok = False
                     for name_attempt in range(2):
                         try:
-                            with service._api_lock:
-                                service._ensure_primary_id_column(sheet)
-                                escaped_sheet = sheet
-                                if any(char in sheet for char in [' ', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '-', '+', '=']):
-                                    escaped_sheet = f"'{sheet}'"
-                                range_name = f"{escaped_sheet}!A:ZZ"
-                                result = service.get_sheet_values(range_name)
-                                if not result:
-                                    sheet_ok = True
-                                    break
+                            service._ensure_primary_id_column(sheet)
+                            escaped_sheet = sheet
+                            if any(char in sheet for char in [' ', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '-', '+', '=']):
+                                escaped_sheet = f"'{sheet}'"
+                            range_name = f"{escaped_sheet}!A:ZZ"
+                            result = service.get_sheet_values(range_name)
+                            if not result:
+                                sheet_ok = True
+                                break
 
                             values = result.get('values', []) if result else []
                             if len(values) < 2:
@@ -1041,12 +993,7 @@ def register_sheets_routes(app):
             })
 
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"Error listing turtle names: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error listing turtle names: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("Error listing turtle names: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to list turtle names: {str(e)}'}), 500
 
     @app.route('/api/sheets/migrate-ids', methods=['POST'])
@@ -1075,10 +1022,5 @@ def register_sheets_routes(app):
             })
         
         except Exception as e:
-            error_trace = traceback.format_exc()
-            try:
-                print(f"❌ Error migrating IDs: {str(e)}")
-            except UnicodeEncodeError:
-                print(f"[ERROR] Error migrating IDs: {str(e)}")
-            print(f"Traceback:\n{error_trace}")
+            logger.error("❌ Error migrating IDs: %s", e, exc_info=True)
             return jsonify({'error': f'Failed to migrate IDs: {str(e)}'}), 500
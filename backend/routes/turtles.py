@@ -126,7 +126,7 @@ def register_turtle_routes(app):
           history_dates: [ 'YYYY-MM-DD', ... ]   # includes primary reference dates
         }
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -362,7 +362,7 @@ def register_turtle_routes(app):
         Find additional images by label substring and/or additional-image category.
         Query: q (optional), type (optional). At least one is required.
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -386,7 +386,7 @@ def register_turtle_routes(app):
         Update labels on one additional image (manifest entry). Admin only.
         JSON: { turtle_id, filename, sheet_name?, labels: string[] }
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -423,7 +423,7 @@ def register_turtle_routes(app):
         ``/api/turtles/images`` responses. The handler validates the path
         lives under the resolved turtle folder before writing.
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -464,7 +464,7 @@ def register_turtle_routes(app):
                                  "primary_ts", "has_carapace": bool,
                                  "folder_status": "has_images"|"empty_folder"|"no_folder" }, ... ] }
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -548,7 +548,7 @@ def register_turtle_routes(app):
         Body (JSON): { turtle_id, path, sheet_name? }.
         Response: { success, was_reference, reverted, new_reference_path }.
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -582,7 +582,7 @@ def register_turtle_routes(app):
         absolute path of the file in the Deleted/ folder (or a turtle-dir
         relative path starting with 'Deleted/').
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -609,7 +609,7 @@ def register_turtle_routes(app):
         Delete one additional image from a turtle's folder (Admin only).
         Query: turtle_id (required), filename (required), sheet_name (optional).
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -635,7 +635,7 @@ def register_turtle_routes(app):
         Form: file_0, type_0, labels_0, ... (type normalized server-side),
         optional sheet_name. When the folder is missing, sheet_name creates data/<location>/<turtle_id>/ .
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -720,7 +720,7 @@ def register_turtle_routes(app):
         Form: turtle_id (required), photo_type ('plastron'|'carapace'), file, sheet_name (optional).
         Archives the old reference to {photo_type}/Old References/ and updates VRAM cache.
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -779,7 +779,7 @@ def register_turtle_routes(app):
         set_if_missing: fails if ref_data already has an identifier for this turtle_id.
         replace: archives the previous master image to loose_images when present, then sets the new one.
         """
-        if not manager_service.manager_ready.wait(timeout=5):
+        if not manager_service.wait_for_manager(timeout=5):
             return jsonify({'error': 'TurtleManager is still initializing'}), 503
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager not available'}), 500
@@ -5,17 +5,32 @@ Photo upload endpoint
 import os
 import re
 import shutil
+import stat
 import json
 import sys
 import time
 import traceback
 import threading
 import uuid
+from collections import OrderedDict
 from flask import request, jsonify
 from werkzeug.utils import secure_filename
 from config import UPLOAD_FOLDER, MAX_FILE_SIZE, allowed_file
-from auth import optional_auth, check_auth_revocation
+from auth import optional_auth, require_auth, check_auth_revocation
 from image_utils import normalize_to_jpeg
+from upload_utils import (
+    CHUNK_SIZE_HINT,
+    ChunkedUploadError,
+    create_chunked_upload,
+    finish_chunked_upload,
+    get_chunked_upload,
+    parse_content_range,
+    save_upload_limited,
+    temp_upload_path,
+    upload_display_name,
+    upload_looks_like_image,
+    write_upload_chunk,
+)
 from services import manager_service
 from additional_image_labels import normalize_additional_type, parse_labels_from_form
 
@@ -38,23 +53,19 @@ def _collect_extra_upload_files(request, request_id):
         f = request.files[key]
         if not f or not f.filename:
             continue
-        if not allowed_file(f.filename):
+        if not allowed_file(f.filename) or not upload_looks_like_image(f):
             continue
         idx = int(m.group(2))
         typ_raw = m.group(1)
         entries.append((idx, typ_raw, key, f))
     entries.sort(key=lambda e: e[0])
     for idx, typ_raw, key, f in entries:
-        f.seek(0, os.SEEK_END)
-        size = f.tell()
-        f.seek(0)
-        if size > MAX_FILE_SIZE:
-            continue
         typ = normalize_additional_type(typ_raw)
-        lbs = parse_labels_from_form(request.form, str(idx), key_prefix='extra_labels')
         ext = os.path.splitext(secure_filename(f.filename))[1] or '.jpg'
         extra_temp = os.path.join(UPLOAD_FOLDER, f"extra_{request_id}_{typ}_{int(time.time())}{ext}")
-        f.save(extra_temp)
+        if save_upload_limited(f, extra_temp, MAX_FILE_SIZE) is None:
+            continue
+        lbs = parse_labels_from_form(request.form, str(idx), key_prefix='extra_labels')
         extra_temp = normalize_to_jpeg(extra_temp)
         item = {
             'path': extra_temp,
@@ -68,6 +79,13 @@ def _collect_extra_upload_files(request, request_id):
 
 _IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
 
+# (pt_path, dir mtime_ns) -> resolved image path. The same reference .pt comes back in
+# match after match; keying on the directory mtime means any rename/add/remove next to it
+# forces a rescan, and outdated keys simply age out.
+_PT_IMAGE_CACHE_MAXSIZE = 8192
+_pt_image_cache = OrderedDict()
+_pt_image_cache_lock = threading.Lock()
+
 
 def find_image_for_pt(pt_path):
     """Find the image file next to a .pt file, matching the extension case-insensitively.
@@ -82,11 +100,22 @@ def find_image_for_pt(pt_path):
     """
     if not pt_path or not pt_path.endswith('.pt'):
         return pt_path
-    base = pt_path[:-3]
-    dir_path = os.path.dirname(base) or '.'
-    base_name = os.path.basename(base)
-    if not os.path.isdir(dir_path):
+    dir_path = os.path.dirname(pt_path[:-3]) or '.'
+    # One stat per call; the listdir only happens when the directory changed.
+    try:
+        st = os.stat(dir_path)
+    except OSError:
+        return pt_path
+    if not stat.S_ISDIR(st.st_mode):
         return pt_path
+    key = (pt_path, st.st_mtime_ns)
+    with _pt_image_cache_lock:
+        cached = _pt_image_cache.get(key)
+        if cached is not None:
+            _pt_image_cache.move_to_end(key)
+            return cached
+
+    base_name = os.path.basename(pt_path[:-3])
     try:
         entries = os.listdir(dir_path)
     except OSError:
@@ -94,10 +123,22 @@ def find_image_for_pt(pt_path):
     for fname in entries:
         stem, ext = os.path.splitext(fname)
         if stem == base_name and ext.lower() in _IMAGE_EXTENSIONS:
-            return os.path.join(dir_path, fname)
+            found = os.path.join(dir_path, fname)
+            with _pt_image_cache_lock:
+                _pt_image_cache[key] = found
+                while len(_pt_image_cache) > _PT_IMAGE_CACHE_MAXSIZE:
+                    _pt_image_cache.popitem(last=False)
+            return found
+    # Misses are not cached: the image may land in the same mtime tick right after.
     return pt_path
 
 
+def clear_pt_image_cache():
+    """Drop cached .pt -> image lookups (after reference images are replaced on disk)."""
+    with _pt_image_cache_lock:
+        _pt_image_cache.clear()
+
+
 # ARCHITECT NOTE: Kept .pt conversion for SuperPoint integration
 def convert_pt_to_image_path(pt_path):
     """Backwards-compatible wrapper — delegates to case-insensitive lookup."""
@@ -106,18 +147,74 @@ def convert_pt_to_image_path(pt_path):
 def register_upload_routes(app):
     """Register upload routes"""
 
+    @app.route('/api/upload/init', methods=['POST'])
+    @require_auth
+    def init_chunked_upload():
+        """
+        Start a resumable upload (signed-in users only). Body: { "filename": "IMG_1.jpg", "size": <bytes> }.
+        Returns upload_id; send the bytes with PUT /api/upload/chunk, then POST /api/upload
+        (or /api/upload/complete) with form field upload_id instead of a file.
+        Each session pre-allocates its file, so anonymous callers could fill the disk with inits.
+        """
+        data = request.get_json(silent=True) or {}
+        original_name = str(data.get('filename') or '').strip()
+        try:
+            size = int(data.get('size'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'size must be a positive integer'}), 400
+        if not original_name or not allowed_file(original_name):
+            return jsonify({'error': 'Invalid file type'}), 400
+        try:
+            upload_id = create_chunked_upload(original_name, size)
+        except ChunkedUploadError as e:
+            return jsonify({'error': str(e)}), e.status
+        return jsonify({'success': True, 'upload_id': upload_id, 'chunk_size': CHUNK_SIZE_HINT})
+
+    @app.route('/api/upload/chunk', methods=['PUT'])
+    def put_upload_chunk():
+        """
+        Write one chunk. Query: upload_id=<id>; header Content-Range: bytes <start>-<end>/<total>;
+        body is the raw chunk. Chunks may arrive in any order and be retried individually.
+        """
+        upload_id = request.args.get('upload_id', '')
+        try:
+            start, end, total = parse_content_range(request.headers.get('Content-Range'))
+            if end - start + 1 > MAX_FILE_SIZE:
+                return jsonify({'error': 'Chunk too large'}), 413
+            digest = write_upload_chunk(upload_id, start, end, total, request.get_data(cache=False))
+        except ChunkedUploadError as e:
+            return jsonify({'error': str(e)}), e.status
+        return jsonify({'success': True, 'start': start, 'end': end, 'sha256': digest})
+
+    @app.route('/api/upload/chunk', methods=['GET'])
+    def get_upload_chunks():
+        """Ranges already stored for upload_id (with sha256), so a client can skip them on resume."""
+        try:
+            session = get_chunked_upload(request.args.get('upload_id', ''))
+        except ChunkedUploadError as e:
+            return jsonify({'error': str(e)}), e.status
+        chunks = sorted(
+            ({'start': int(k), 'end': v['end'], 'sha256': v['sha256']} for k, v in session['chunks'].items()),
+            key=lambda c: c['start'],
+        )
+        return jsonify({'success': True, 'size': session['size'], 'chunks': chunks})
+
     @app.route('/api/upload', methods=['POST'])
+    @app.route('/api/upload/complete', methods=['POST'])
     @optional_auth
     def upload_photo():
         # Wait for manager to be ready
-        if not manager_service.manager_ready.wait(timeout=30):
+        if not manager_service.wait_for_manager(timeout=30):
             return jsonify({'error': 'TurtleManager is still initializing. Please try again in a moment.'}), 503
 
         if manager_service.manager is None:
             return jsonify({'error': 'TurtleManager is not ready. Please try again in a moment.'}), 503
 
+        temp_path = None
         try:
-            if 'file' not in request.files:
+            # Either a classic multipart `file`, or `upload_id` of a finished resumable upload
+            upload_id = (request.form.get('upload_id') or '').strip()
+            if not upload_id and 'file' not in request.files:
                 return jsonify({'error': 'No file provided'}), 400
 
             # Get user data from verified JWT token (if provided)
@@ -129,7 +226,6 @@ def register_upload_routes(app):
                 user_role = 'community'
                 user_email = 'anonymous'
 
-            file = request.files['file']
             state = request.form.get('state', '')
             location = request.form.get('location', '')
 
@@ -143,25 +239,34 @@ def register_upload_routes(app):
             digital_flag_lon = request.form.get('digital_flag_lon', type=float)
             digital_flag_source = request.form.get('digital_flag_source', '').strip().lower()
 
-            if file.filename == '':
-                return jsonify({'error': 'No file selected'}), 400
-
-            if not allowed_file(file.filename):
-                return jsonify({'error': 'Invalid file type'}), 400
+            if upload_id:
+                try:
+                    original_name = get_chunked_upload(upload_id).get('filename') or ''
+                    if not allowed_file(original_name):
+                        return jsonify({'error': 'Invalid file type'}), 400
+                    temp_path = temp_upload_path(secure_filename(original_name))
+                    finish_chunked_upload(upload_id, temp_path)
+                except ChunkedUploadError as e:
+                    return jsonify({'error': str(e)}), e.status
+            else:
+                file = request.files['file']
+                if file.filename == '':
+                    return jsonify({'error': 'No file selected'}), 400
 
-            file.seek(0, os.SEEK_END)
-            file_size = file.tell()
-            file.seek(0)
+                if not allowed_file(file.filename):
+                    return jsonify({'error': 'Invalid file type'}), 400
 
-            if file_size > MAX_FILE_SIZE:
-                return jsonify({'error': 'File too large (max 5MB)'}), 400
+                if not upload_looks_like_image(file):
+                    return jsonify({'error': 'File content is not a supported image'}), 400
 
-            filename = secure_filename(file.filename)
-            temp_path = os.path.join(UPLOAD_FOLDER, filename)
-            file.save(temp_path)
+                temp_path = temp_upload_path(secure_filename(file.filename))
+                # Copy + size check in one pass; bails out as soon as the limit is crossed
+                if save_upload_limited(file, temp_path, MAX_FILE_SIZE) is None:
+                    return jsonify({'error': 'File too large (max 5MB)'}), 413
             # HEIC/HEIF → JPEG so SuperPoint + frontend can handle it
             temp_path = normalize_to_jpeg(temp_path)
-            filename = os.path.basename(temp_path)
+            # Name as uploaded (no spool prefix): used for the packet's query image and request_id
+            filename = upload_display_name(temp_path)
 
             if not os.path.exists(temp_path):
                 return jsonify({'error': 'Failed to save file'}), 500
@@ -342,7 +447,7 @@ def register_upload_routes(app):
                         user_info['digital_flag_source'] = digital_flag_source
 
                 # Pre-generate request_id so it can be returned immediately
-                safe_name = os.path.basename(temp_path).replace(" ", "_")
+                safe_name = filename.replace(" ", "_")
                 request_id = f"Req_{int(time.time() * 1000)}_{safe_name}_{uuid.uuid4().hex[:6]}"
 
                 # Save extra files to disk now (must happen inside request context)
@@ -350,12 +455,13 @@ def register_upload_routes(app):
 
                 # Run matching and packet creation in the background so the
                 # community member is not blocked waiting for AI processing
-                def _build_packet(img_path, u_info, req_id, fwt):
+                def _build_packet(img_path, u_info, req_id, fwt, query_name):
                     try:
                         manager_service.manager.create_review_packet(
                             img_path,
                             user_info=u_info,
-                            req_id=req_id
+                            req_id=req_id,
+                            query_filename=query_name
                         )
                         if fwt:
                             manager_service.manager.add_additional_images_to_packet(req_id, fwt)
@@ -379,7 +485,7 @@ def register_upload_routes(app):
 
                 threading.Thread(
                     target=_build_packet,
-                    args=(temp_path, user_info, request_id, files_with_types),
+                    args=(temp_path, user_info, request_id, files_with_types, filename),
                     daemon=True
                 ).start()
 
@@ -393,6 +499,12 @@ def register_upload_routes(app):
             error_trace = traceback.format_exc()
             sys.stderr.write(f"[UPLOAD 500] {str(e)}\n{error_trace}")
             sys.stderr.flush()
+            # Don't leave the spooled upload behind (UPLOAD_FOLDER may be a RAM-backed tmpfs)
+            if temp_path and os.path.isfile(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
             return jsonify({
                 'error': f'Processing failed: {str(e)}',
                 'details': error_trace if app.debug else None
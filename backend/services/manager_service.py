@@ -2,16 +2,29 @@
 Turtle Manager and Google Sheets Service initialization
 """
 
+import logging
 import os
 import threading
 import time
 from google_sheets_service import GoogleSheetsService
+from upload_utils import sweep_temp_uploads
+
+logger = logging.getLogger(__name__)
 
 # Initialize Turtle Manager in background thread to avoid blocking server start
 # This allows the server to start immediately and respond to health checks
 manager = None
 manager_ready = threading.Event()
 
+# Request threads allowed to park on manager_ready at once. While the model warms up,
+# further requests get an immediate 503 instead of waiting, so a burst (e.g. a gallery's
+# worth of /api/images calls) cannot occupy every WSGI worker thread and starve /api/health.
+MANAGER_WAIT_SLOTS = int(os.environ.get('MANAGER_WAIT_SLOTS', '4'))
+_manager_wait_slots = threading.BoundedSemaphore(max(1, MANAGER_WAIT_SLOTS))
+
+# How often the temp-upload reaper scans UPLOAD_FOLDER
+TEMP_REAPER_INTERVAL_SEC = 60
+
 # Initialize Google Sheets Service (lazy initialization)
 sheets_service = None
 community_sheets_service = None
@@ -108,6 +121,28 @@ def check_and_run_migration():
     migration_thread.start()
 
 
+def wait_for_manager(timeout, ready=None):
+    """Wait up to ``timeout`` seconds for manager init to finish; ``False`` if still loading.
+
+    Returns at once once init is done. During warmup only MANAGER_WAIT_SLOTS callers
+    actually block; the rest get ``False`` immediately.
+
+    Args:
+        timeout: Seconds to block at most
+        ready: Event to wait on (default ``manager_ready``, which the init thread sets)
+    """
+    if ready is None:
+        ready = manager_ready
+    if ready.is_set():
+        return True
+    if not _manager_wait_slots.acquire(blocking=False):
+        return False
+    try:
+        return ready.wait(timeout=timeout)
+    finally:
+        _manager_wait_slots.release()
+
+
 def initialize_manager():
     """Initialize Turtle Manager in background thread (real TurtleManager only)."""
     global manager
@@ -115,17 +150,11 @@ def initialize_manager():
     try:
         manager = TurtleManager()
         manager_ready.set()
-        try:
-            print("✅ TurtleManager initialized successfully")
-        except UnicodeEncodeError:
-            print("[OK] TurtleManager initialized successfully")
+        logger.info("✅ TurtleManager initialized successfully")
         # Ensure data folder structure matches admin and community spreadsheets (no reset required)
         _ensure_sheet_folders_on_startup()
     except Exception as e:
-        try:
-            print(f"❌ Error initializing TurtleManager: {str(e)}")
-        except UnicodeEncodeError:
-            print(f"[ERROR] Error initializing TurtleManager: {str(e)}")
+        logger.error("❌ Error initializing TurtleManager: %s", e, exc_info=True)
         manager_ready.set()  # Set even on error so server can continue
 
 
@@ -150,10 +179,19 @@ def _ensure_sheet_folders_on_startup():
     try:
         manager.ensure_data_folders_from_sheets(admin_sheets, community_sheets)
     except Exception as e:
+        logger.warning("⚠️ Could not ensure sheet folders: %s", e)
+
+
+def run_temp_reaper():
+    """Periodically delete orphaned upload spool files (crashed or abandoned requests)."""
+    while True:
         try:
-            print(f"⚠️ Could not ensure sheet folders: {e}")
-        except UnicodeEncodeError:
-            print("[WARN] Could not ensure sheet folders")
+            removed = sweep_temp_uploads()
+            if removed:
+                logger.info("🧹 Removed %d orphaned upload temp file(s)", removed)
+        except Exception as e:
+            logger.warning("⚠️ Temp upload sweep failed: %s", e)
+        time.sleep(TEMP_REAPER_INTERVAL_SEC)
 
 
 def initialize_sheets_migration():
@@ -177,3 +215,7 @@ manager_thread.start()
 # Start sheets migration check in background
 sheets_migration_thread = threading.Thread(target=initialize_sheets_migration, daemon=True)
 sheets_migration_thread.start()
+
+# Sweep orphaned upload temp files in the background
+temp_reaper_thread = threading.Thread(target=run_temp_reaper, daemon=True)
+temp_reaper_thread.start()
@@ -2,7 +2,8 @@
 Column mappings for Google Sheets
 """
 
-from typing import Any, Dict, List, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
 # Canonical header order (research spreadsheet). Used for new tabs and inserting missing columns.
 CANONICAL_COLUMN_ORDER: Tuple[str, ...] = (
@@ -98,10 +99,11 @@ def _column_mapping_entries() -> List[Tuple[str, str]]:
     ]
 
 
-COLUMN_MAPPING: Dict[str, str] = dict(_column_mapping_entries())
+# Read-only: built once at import and shared by every request (no per-call copies)
+COLUMN_MAPPING: Mapping[str, str] = MappingProxyType(dict(_column_mapping_entries()))
 
 
-def _build_field_to_column(column_mapping: Dict[str, str]) -> Dict[str, str]:
+def _build_field_to_column(column_mapping: Mapping[str, str]) -> Dict[str, str]:
     """One preferred sheet header per internal field (first canonical header wins)."""
     out: Dict[str, str] = {}
     for header, field in column_mapping.items():
@@ -127,9 +129,14 @@ def _build_field_to_column(column_mapping: Dict[str, str]) -> Dict[str, str]:
 
 
 # Reverse mapping: internal field names to Google Sheets column headers (for inserts / writes)
-FIELD_TO_COLUMN: Dict[str, str] = _build_field_to_column(COLUMN_MAPPING)
+FIELD_TO_COLUMN: Mapping[str, str] = MappingProxyType(_build_field_to_column(COLUMN_MAPPING))
 
-_CANONICAL_INDEX = {h: i for i, h in enumerate(CANONICAL_COLUMN_ORDER)}
+# Header -> 0-based column for a tab laid out exactly in canonical order (the common case;
+# helpers.header_column_indices returns this shared mapping instead of building a new dict)
+CANONICAL_COLUMN_INDICES: Mapping[str, int] = MappingProxyType(
+    {h: i for i, h in enumerate(CANONICAL_COLUMN_ORDER)}
+)
+_CANONICAL_INDEX = CANONICAL_COLUMN_INDICES
 
 
 def compute_insert_index_for_missing_column(
@@ -171,8 +178,8 @@ def compute_insert_index_for_missing_column(
 
 def collect_missing_headers_for_turtle_data(
     turtle_data: Dict[str, Any],
-    existing_headers: Dict[str, int],
-    field_to_column: Dict[str, str] = FIELD_TO_COLUMN,
+    existing_headers: Mapping[str, int],
+    field_to_column: Mapping[str, str] = FIELD_TO_COLUMN,
     metadata_keys: frozenset = TURTLE_METADATA_KEYS,
 ) -> List[str]:
     """
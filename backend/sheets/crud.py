@@ -2,21 +2,164 @@
 CRUD operations for Google Sheets turtle data
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from googleapiclient.errors import HttpError
-from .helpers import escape_sheet_name, get_sheet_name_for_region, column_index_to_letter
-from .columns import COLUMN_MAPPING
+from .helpers import escape_sheet_name, get_sheet_name_for_region, column_index_to_letter, header_column_indices
+from .columns import COLUMN_MAPPING, collect_missing_headers_for_turtle_data
 from .row_formatting import apply_deceased_row_background, is_deceased_yes
 from . import sheet_management
 from .value_normalize import format_field_value_for_sheet, normalize_turtle_row_after_read
 
 
+def read_sheet_values(service, spreadsheet_id: str, sheet_names: List[str]) -> Dict[str, List[List[Any]]]:
+    """
+    Read whole tabs with a single values.batchGet call.
+    
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Google Sheets spreadsheet ID
+        sheet_names: Tabs to read (must exist; duplicates are read once)
+        
+    Returns:
+        Dictionary mapping sheet name to its rows (row 0 = header row)
+    """
+    names = list(dict.fromkeys(sheet_names))
+    if not names:
+        return {}
+    result = service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=[escape_sheet_name(name) for name in names],
+        fields='valueRanges.values',
+    ).execute()
+    # valueRanges come back in request order
+    return {
+        name: value_range.get('values', [])
+        for name, value_range in zip(names, result.get('valueRanges', []))
+    }
+
+
+def _row_lookup(values: List[List[Any]]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Index a tab's rows by the "Primary ID" and "ID" (biology ID) columns.
+    Returns two dicts mapping cell value -> 1-based row of its first occurrence.
+    """
+    if not values:
+        return {}, {}
+    headers = values[0]
+    lookups = []
+    for column in ('Primary ID', 'ID'):
+        rows = {}
+        if column in headers:
+            col_idx = headers.index(column)
+            for row_idx, row in enumerate(values[1:], start=2):
+                if len(row) > col_idx and row[col_idx] not in rows:
+                    rows[row[col_idx]] = row_idx
+        lookups.append(rows)
+    return lookups[0], lookups[1]
+
+
+def _find_row(lookup: Tuple[Dict[str, int], Dict[str, int]], primary_id: str) -> Optional[int]:
+    """Primary ID column first, then the biology ID column (the AI match system may pass F001/M012)."""
+    primary_rows, id_rows = lookup
+    return primary_rows.get(primary_id) or id_rows.get(primary_id)
+
+
+def _existing_sheets(sheet_names, list_sheets_func) -> List[str]:
+    """Tabs from sheet_names that exist (a missing tab would fail the whole batchGet)."""
+    available = set(list_sheets_func()) if list_sheets_func else None
+    existing = []
+    for name in dict.fromkeys(sheet_names):
+        if available is not None and name not in available:
+            print(f"Warning: Sheet '{name}' not found. Available sheets: {sorted(available)}")
+            continue
+        existing.append(name)
+    return existing
+
+
+def _read_tabs_with_primary_id(service, spreadsheet_id: str, sheet_names: List[str],
+                               ensure_primary_id_column_func=None) -> Dict[str, List[List[Any]]]:
+    """
+    read_sheet_values, checking "Primary ID" against the header row it returned instead of
+    a separate header read; only tabs that lacked the column (and got it) are read again.
+    """
+    sheet_values = read_sheet_values(service, spreadsheet_id, sheet_names)
+    if ensure_primary_id_column_func is None:
+        return sheet_values
+    reread = [
+        sheet_name for sheet_name, values in sheet_values.items()
+        if values and 'Primary ID' not in header_column_indices(values[0])
+        and ensure_primary_id_column_func(sheet_name)
+    ]
+    if reread:
+        sheet_values.update(read_sheet_values(service, spreadsheet_id, reread))
+    return sheet_values
+
+
+def get_turtle_data_bulk(service, spreadsheet_id: str, ids_by_sheet: Dict[str, List[str]],
+                         ensure_primary_id_column_func=None,
+                         list_sheets_func=None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Get several turtles' data with one values.batchGet over their tabs.
+    
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Google Sheets spreadsheet ID
+        ids_by_sheet: Sheet name -> primary IDs (or biology IDs) to read from that sheet
+        ensure_primary_id_column_func: Function to ensure Primary ID column exists
+        list_sheets_func: Function to list available sheets
+        
+    Returns:
+        Dictionary sheet name -> {requested ID -> turtle data}; IDs that were not found are omitted
+    """
+    ids_by_sheet = {
+        get_sheet_name_for_region(sheet_name=sheet_name): ids
+        for sheet_name, ids in ids_by_sheet.items()
+    }
+    try:
+        sheet_names = _existing_sheets(ids_by_sheet, list_sheets_func)
+        sheet_values = _read_tabs_with_primary_id(
+            service, spreadsheet_id, sheet_names, ensure_primary_id_column_func,
+        )
+    except HttpError as e:
+        print(f"Error getting turtle data: {e}")
+        return {}
+
+    found = {}
+    for sheet_name, values in sheet_values.items():
+        if not values:
+            continue
+        column_indices = header_column_indices(values[0])
+        lookup = _row_lookup(values)
+        for primary_id in ids_by_sheet[sheet_name]:
+            row_idx = _find_row(lookup, primary_id)
+            if not row_idx:
+                continue
+            row_data = values[row_idx - 1]
+
+            # Map row data to field names
+            turtle_data = {}
+            for header, col_idx in column_indices.items():
+                if header in COLUMN_MAPPING:
+                    field_name = COLUMN_MAPPING[header]
+                    value = row_data[col_idx] if col_idx < len(row_data) else ''
+                    turtle_data[field_name] = value.strip() if value else ''
+
+            # Use the actual Primary ID from the row data if available (the caller may
+            # have passed a biology ID like F001 which found the row via the ID column).
+            turtle_data['primary_id'] = turtle_data.get('primary_id') or primary_id
+            turtle_data['sheet_name'] = sheet_name
+            turtle_data['row_index'] = row_idx
+
+            normalize_turtle_row_after_read(turtle_data)
+            found.setdefault(sheet_name, {})[primary_id] = turtle_data
+    return found
+
+
 def get_turtle_data(service, spreadsheet_id: str, primary_id: str, sheet_name: str, 
                    state: Optional[str] = None, location: Optional[str] = None,
-                   ensure_primary_id_column_func=None, find_row_by_primary_id_func=None,
-                   get_all_column_indices_func=None) -> Optional[Dict[str, Any]]:
+                   ensure_primary_id_column_func=None, list_sheets_func=None) -> Optional[Dict[str, Any]]:
     """
-    Get turtle data from Google Sheets by primary ID.
+    Get turtle data from Google Sheets by primary ID (one-element get_turtle_data_bulk).
     
     Args:
         service: Google Sheets API service object
@@ -26,8 +169,7 @@ def get_turtle_data(service, spreadsheet_id: str, primary_id: str, sheet_name: s
         state: Optional state name (for backwards compatibility)
         location: Optional specific location (for backwards compatibility)
         ensure_primary_id_column_func: Function to ensure Primary ID column exists
-        find_row_by_primary_id_func: Function to find row by primary ID
-        get_all_column_indices_func: Function to get all column indices
+        list_sheets_func: Function to list available sheets
         
     Returns:
         Dictionary with turtle data or None if not found
@@ -38,105 +180,89 @@ def get_turtle_data(service, spreadsheet_id: str, primary_id: str, sheet_name: s
         raise ValueError("sheet_name must be provided and cannot be empty")
     
     sheet_name = get_sheet_name_for_region(sheet_name=sheet_name, state=state, location=location)
+    found = get_turtle_data_bulk(
+        service, spreadsheet_id, {sheet_name: [primary_id]},
+        ensure_primary_id_column_func, list_sheets_func,
+    )
+    return found.get(sheet_name, {}).get(primary_id)
+
+
+def _build_new_row(column_indices: Dict[str, int], turtle_data: Dict[str, Any]) -> List[Any]:
+    """Row cells for a new turtle, aligned to the header's column indices."""
+    # Create a list with empty strings for all columns
+    max_col_idx = max(column_indices.values()) if column_indices else 0
+    row_data = [''] * (max_col_idx + 1)
     
-    try:
-        # Ensure Primary ID column exists
-        ensure_primary_id_column_func(sheet_name)
-        
-        # Find the row using Primary ID column first, then fall back to ID column
-        # (biology ID like F001/M012). This handles the case where the AI match
-        # system passes a folder name (biology ID) instead of the actual Primary ID.
-        row_idx = find_row_by_primary_id_func(sheet_name, primary_id, 'Primary ID')
-        if not row_idx:
-            row_idx = find_row_by_primary_id_func(sheet_name, primary_id, 'ID')
-        if not row_idx:
-            return None
-        
-        # Get column indices
-        column_indices = get_all_column_indices_func(sheet_name)
-        
-        # Get the row data
-        escaped_sheet = escape_sheet_name(sheet_name)
-        range_name = f"{escaped_sheet}!{row_idx}:{row_idx}"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=range_name
-        ).execute()
-        
-        values = result.get('values', [])
-        if not values:
-            return None
-        
-        row_data = values[0]
-        
-        # Map row data to field names
-        turtle_data = {}
-        for header, col_idx in column_indices.items():
-            if header in COLUMN_MAPPING:
-                field_name = COLUMN_MAPPING[header]
-                value = row_data[col_idx] if col_idx < len(row_data) else ''
-                turtle_data[field_name] = value.strip() if value else ''
-        
-        # Use the actual Primary ID from the row data if available (the caller may
-        # have passed a biology ID like F001 which found the row via the ID column).
-        turtle_data['primary_id'] = turtle_data.get('primary_id') or primary_id
-        turtle_data['sheet_name'] = sheet_name
-        turtle_data['row_index'] = row_idx
-
-        normalize_turtle_row_after_read(turtle_data)
-        return turtle_data
-    except HttpError as e:
-        print(f"Error getting turtle data: {e}")
-        return None
+    # Fill in the data
+    for header, col_idx in column_indices.items():
+        if header in COLUMN_MAPPING:
+            field_name = COLUMN_MAPPING[header]
+            if field_name in turtle_data:
+                row_data[col_idx] = format_field_value_for_sheet(
+                    field_name, turtle_data[field_name]
+                )
+    
+    # Ensure Primary ID is written (it's required)
+    primary_id = turtle_data.get('primary_id') or turtle_data.get('id')
+    if primary_id and 'Primary ID' in column_indices:
+        row_data[column_indices['Primary ID']] = str(primary_id)
+    return row_data
 
 
-def create_turtle_data(service, spreadsheet_id: str, turtle_data: Dict[str, Any], sheet_name: str,
-                      state: Optional[str] = None, location: Optional[str] = None,
-                      ensure_primary_id_column_func=None, get_all_column_indices_func=None,
-                      invalidate_column_indices_cache_func=None) -> Optional[str]:
+def create_turtle_data_bulk(service, spreadsheet_id: str, turtle_data_list: List[Dict[str, Any]], sheet_name: str,
+                            state: Optional[str] = None, location: Optional[str] = None,
+                            ensure_primary_id_column_func=None, get_all_column_indices_func=None,
+                            invalidate_column_indices_cache_func=None) -> List[Optional[str]]:
     """
-    Create a new turtle entry in Google Sheets.
+    Create several turtles in one tab: one read to find the next free row, one values.batchUpdate
+    writing every new row.
     
     Args:
         service: Google Sheets API service object
         spreadsheet_id: Google Sheets spreadsheet ID
-        turtle_data: Dictionary with turtle data (using internal field names)
+        turtle_data_list: Dictionaries with turtle data (using internal field names)
         sheet_name: Name of the sheet (tab) to create in (e.g., "Location A", "Location B")
         state: Optional state name (for backwards compatibility)
         location: Optional specific location (for backwards compatibility)
         ensure_primary_id_column_func: Function to ensure Primary ID column exists
         get_all_column_indices_func: Function to get all column indices
+        invalidate_column_indices_cache_func: Callback(sheet_name) after a column insert
         
     Returns:
-        Primary ID of the created turtle or None if failed
+        Primary ID of each created turtle (all None if the write failed)
     """
     # Validate sheet_name before processing
     if not sheet_name or not sheet_name.strip():
-        print(f"ERROR in create_turtle_data: sheet_name is empty! state={state}, location={location}, turtle_data keys={list(turtle_data.keys())}")
+        keys = sorted({key for turtle_data in turtle_data_list for key in turtle_data})
+        print(f"ERROR in create_turtle_data: sheet_name is empty! state={state}, location={location}, turtle_data keys={keys}")
         raise ValueError("sheet_name must be provided and cannot be empty")
     
     sheet_name = get_sheet_name_for_region(sheet_name=sheet_name, state=state, location=location)
+    failed = [None] * len(turtle_data_list)
+    if not turtle_data_list:
+        return failed
     
     try:
         # Ensure Primary ID column exists (do not insert when headers unreadable to avoid duplicate columns)
         if not ensure_primary_id_column_func(sheet_name):
             print(f"ERROR in create_turtle_data: Could not ensure Primary ID column for sheet '{sheet_name}'")
-            return None
+            return failed
 
-        sheet_management.ensure_missing_columns_for_turtle_write(
-            service,
-            spreadsheet_id,
-            sheet_name,
-            turtle_data,
-            get_all_column_indices_func,
-            invalidate_column_indices_cache_func,
-        )
+        for turtle_data in turtle_data_list:
+            sheet_management.ensure_missing_columns_for_turtle_write(
+                service,
+                spreadsheet_id,
+                sheet_name,
+                turtle_data,
+                get_all_column_indices_func,
+                invalidate_column_indices_cache_func,
+            )
         
         # Get column indices
         column_indices = get_all_column_indices_func(sheet_name)
         if not column_indices:
             print(f"ERROR in create_turtle_data: No column headers for sheet '{sheet_name}'")
-            return None
+            return failed
         
         # Next row must not be derived from column A alone: values.get on a single column
         # stops at the last non-empty cell *in that column*. Rows with an empty Primary ID
@@ -165,177 +291,225 @@ def create_turtle_data(service, spreadsheet_id: str, turtle_data: Dict[str, Any]
         values = result.get('values', [])
         next_row = len(values) + 1 if values else 2  # Row 1 is headers
         
-        # Build the row data
-        # First, get the maximum column index we need
-        max_col_idx = max(column_indices.values()) if column_indices else 0
-        
-        # Create a list with empty strings for all columns
-        row_data = [''] * (max_col_idx + 1)
-        
-        # Fill in the data
-        for header, col_idx in column_indices.items():
-            if header in COLUMN_MAPPING:
-                field_name = COLUMN_MAPPING[header]
-                if field_name in turtle_data:
-                    row_data[col_idx] = format_field_value_for_sheet(
-                        field_name, turtle_data[field_name]
-                    )
-        
-        # Ensure Primary ID is written (it's required)
-        primary_id = turtle_data.get('primary_id') or turtle_data.get('id')
-        if primary_id and 'Primary ID' in column_indices:
-            primary_id_col_idx = column_indices['Primary ID']
-            # Extend row_data if necessary
-            while len(row_data) <= primary_id_col_idx:
-                row_data.append('')
-            row_data[primary_id_col_idx] = str(primary_id)
-        
-        # Write the row
-        range_name = f"{escaped_sheet}!{next_row}:{next_row}"
-        body = {
-            'values': [row_data]
-        }
-        
-        service.spreadsheets().values().update(
+        # Write the rows (consecutive, starting at the first free row)
+        service.spreadsheets().values().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            range=range_name,
-            valueInputOption='RAW',
-            body=body
+            body={
+                'valueInputOption': 'RAW',
+                'data': [
+                    {
+                        'range': f"{escaped_sheet}!{row_idx}:{row_idx}",
+                        'values': [_build_new_row(column_indices, turtle_data)],
+                    }
+                    for row_idx, turtle_data in enumerate(turtle_data_list, start=next_row)
+                ],
+            },
         ).execute()
 
-        if is_deceased_yes(turtle_data.get('deceased')):
-            apply_deceased_row_background(
-                service, spreadsheet_id, sheet_name, next_row, True,
-            )
-        
-        # Return the primary ID
-        return primary_id
+        for row_idx, turtle_data in enumerate(turtle_data_list, start=next_row):
+            if is_deceased_yes(turtle_data.get('deceased')):
+                apply_deceased_row_background(
+                    service, spreadsheet_id, sheet_name, row_idx, True,
+                )
+        
+        # Return the primary IDs
+        return [turtle_data.get('primary_id') or turtle_data.get('id') for turtle_data in turtle_data_list]
     except HttpError as e:
         print(f"Error creating turtle data: {e}")
-        return None
+        return failed
 
 
-def update_turtle_data(service, spreadsheet_id: str, primary_id: str, turtle_data: Dict[str, Any], sheet_name: str,
+def create_turtle_data(service, spreadsheet_id: str, turtle_data: Dict[str, Any], sheet_name: str,
                       state: Optional[str] = None, location: Optional[str] = None,
-                      ensure_primary_id_column_func=None, find_row_by_primary_id_func=None,
-                      get_all_column_indices_func=None,
-                      invalidate_column_indices_cache_func=None) -> bool:
+                      ensure_primary_id_column_func=None, get_all_column_indices_func=None,
+                      invalidate_column_indices_cache_func=None) -> Optional[str]:
     """
-    Update existing turtle data in Google Sheets.
+    Create a new turtle entry in Google Sheets (one-element create_turtle_data_bulk).
     
     Args:
         service: Google Sheets API service object
         spreadsheet_id: Google Sheets spreadsheet ID
-        primary_id: Primary ID of the turtle to update
-        turtle_data: Dictionary with updated turtle data (using internal field names)
-        sheet_name: Name of the sheet (tab) to update in (e.g., "Location A", "Location B")
+        turtle_data: Dictionary with turtle data (using internal field names)
+        sheet_name: Name of the sheet (tab) to create in (e.g., "Location A", "Location B")
         state: Optional state name (for backwards compatibility)
         location: Optional specific location (for backwards compatibility)
         ensure_primary_id_column_func: Function to ensure Primary ID column exists
-        find_row_by_primary_id_func: Function to find row by primary ID
         get_all_column_indices_func: Function to get all column indices
         
     Returns:
-        True if successful, False otherwise
+        Primary ID of the created turtle or None if failed
     """
-    # Validate sheet_name before processing
-    if not sheet_name or not sheet_name.strip():
-        print(f"ERROR in update_turtle_data: sheet_name is empty! primary_id={primary_id}, state={state}, location={location}, turtle_data keys={list(turtle_data.keys())}")
-        raise ValueError("sheet_name must be provided and cannot be empty")
-    
-    sheet_name = get_sheet_name_for_region(sheet_name=sheet_name, state=state, location=location)
+    return create_turtle_data_bulk(
+        service, spreadsheet_id, [turtle_data], sheet_name, state, location,
+        ensure_primary_id_column_func, get_all_column_indices_func,
+        invalidate_column_indices_cache_func,
+    )[0]
+
+
+def _apply_turtle_update(row_data: List[Any], column_indices: Dict[str, int], primary_id: str,
+                         turtle_data: Dict[str, Any]) -> None:
+    """Write turtle_data's fields into row_data (in place) at their header columns."""
+    for header, col_idx in column_indices.items():
+        if header in COLUMN_MAPPING:
+            field_name = COLUMN_MAPPING[header]
+            if field_name in turtle_data:
+                # Extend row_data if necessary
+                while len(row_data) <= col_idx:
+                    row_data.append('')
+                row_data[col_idx] = format_field_value_for_sheet(
+                    field_name, turtle_data[field_name]
+                )
+
+    # Primary ID: keep existing cell if the row was matched via biology ID (ID column)
+    if 'Primary ID' in column_indices:
+        primary_id_col_idx = column_indices['Primary ID']
+        while len(row_data) <= primary_id_col_idx:
+            row_data.append('')
+        existing_primary = ''
+        if primary_id_col_idx < len(row_data) and row_data[primary_id_col_idx]:
+            existing_primary = str(row_data[primary_id_col_idx]).strip()
+        if 'primary_id' in turtle_data and str(turtle_data.get('primary_id') or '').strip():
+            row_data[primary_id_col_idx] = str(turtle_data['primary_id']).strip()
+        elif existing_primary:
+            row_data[primary_id_col_idx] = existing_primary
+        else:
+            row_data[primary_id_col_idx] = str(primary_id)
+
+
+def update_turtle_data_bulk(service, spreadsheet_id: str, updates: List[Tuple[str, str, Dict[str, Any]]],
+                            ensure_primary_id_column_func=None, list_sheets_func=None,
+                            get_all_column_indices_func=None,
+                            invalidate_column_indices_cache_func=None) -> List[bool]:
+    """
+    Update several turtles with one values.batchGet (rows) and one values.batchUpdate (writes).
     
-    try:
-        # Ensure Primary ID column exists
-        ensure_primary_id_column_func(sheet_name)
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Google Sheets spreadsheet ID
+        updates: (primary_id, sheet_name, turtle_data) tuples; turtle_data uses internal field names
+        ensure_primary_id_column_func: Function to ensure Primary ID column exists
+        list_sheets_func: Function to list available sheets
+        get_all_column_indices_func: Function to get all column indices
+        invalidate_column_indices_cache_func: Callback(sheet_name) after a column insert
         
-        # Find the row (Primary ID first, then biology ID column — same as get_turtle_data)
-        row_idx = find_row_by_primary_id_func(sheet_name, primary_id, 'Primary ID')
-        if not row_idx:
-            row_idx = find_row_by_primary_id_func(sheet_name, primary_id, 'ID')
-        if not row_idx:
-            return False
-
-        sheet_management.ensure_missing_columns_for_turtle_write(
-            service,
-            spreadsheet_id,
-            sheet_name,
-            turtle_data,
-            get_all_column_indices_func,
-            invalidate_column_indices_cache_func,
+    Returns:
+        One bool per update (True if its row was found and written)
+    """
+    updates = [
+        (primary_id, get_sheet_name_for_region(sheet_name=sheet_name), turtle_data)
+        for primary_id, sheet_name, turtle_data in updates
+    ]
+    results = [False] * len(updates)
+    try:
+        sheet_names = _existing_sheets([sheet_name for _, sheet_name, _ in updates], list_sheets_func)
+        sheet_values = _read_tabs_with_primary_id(
+            service, spreadsheet_id, sheet_names, ensure_primary_id_column_func,
         )
-        
-        # Get column indices
-        column_indices = get_all_column_indices_func(sheet_name)
-        
-        # Get current row data
-        escaped_sheet = escape_sheet_name(sheet_name)
-        range_name = f"{escaped_sheet}!{row_idx}:{row_idx}"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=range_name
-        ).execute()
-        
-        values = result.get('values', [])
-        if not values:
-            return False
-        
-        row_data = list(values[0])
-        
-        # Update the row data
-        for header, col_idx in column_indices.items():
-            if header in COLUMN_MAPPING:
-                field_name = COLUMN_MAPPING[header]
-                if field_name in turtle_data:
-                    # Extend row_data if necessary
-                    while len(row_data) <= col_idx:
-                        row_data.append('')
-                    row_data[col_idx] = format_field_value_for_sheet(
-                        field_name, turtle_data[field_name]
-                    )
-        
-        # Primary ID: keep existing cell if the row was matched via biology ID (ID column)
-        if 'Primary ID' in column_indices:
-            primary_id_col_idx = column_indices['Primary ID']
-            while len(row_data) <= primary_id_col_idx:
-                row_data.append('')
-            existing_primary = ''
-            if primary_id_col_idx < len(row_data) and row_data[primary_id_col_idx]:
-                existing_primary = str(row_data[primary_id_col_idx]).strip()
-            if 'primary_id' in turtle_data and str(turtle_data.get('primary_id') or '').strip():
-                row_data[primary_id_col_idx] = str(turtle_data['primary_id']).strip()
-            elif existing_primary:
-                row_data[primary_id_col_idx] = existing_primary
-            else:
-                row_data[primary_id_col_idx] = str(primary_id)
-        
-        # Write the updated row
-        range_name = f"{escaped_sheet}!{row_idx}:{row_idx}"
-        body = {
-            'values': [row_data]
-        }
-        
-        service.spreadsheets().values().update(
+        # Column inserts shift cells, so a tab that needed one is read again before the writes
+        reread = []
+        for _, sheet_name, turtle_data in updates:
+            values = sheet_values.get(sheet_name)
+            if not values or not collect_missing_headers_for_turtle_data(
+                turtle_data, header_column_indices(values[0])
+            ):
+                continue
+            if sheet_management.ensure_missing_columns_for_turtle_write(
+                service,
+                spreadsheet_id,
+                sheet_name,
+                turtle_data,
+                get_all_column_indices_func,
+                invalidate_column_indices_cache_func,
+            ):
+                reread.append(sheet_name)
+        if reread:
+            sheet_values.update(read_sheet_values(service, spreadsheet_id, reread))
+
+        # (sheet, row) -> row cells; several updates to one row are merged into one write
+        pending = {}
+        pending_deceased = {}
+        sheet_layouts = {}
+        for i, (primary_id, sheet_name, turtle_data) in enumerate(updates):
+            values = sheet_values.get(sheet_name)
+            if not values:
+                continue
+            if sheet_name not in sheet_layouts:
+                sheet_layouts[sheet_name] = (header_column_indices(values[0]), _row_lookup(values))
+            column_indices, lookup = sheet_layouts[sheet_name]
+            row_idx = _find_row(lookup, primary_id)
+            if not row_idx:
+                continue
+            key = (sheet_name, row_idx)
+            if key not in pending:
+                pending[key] = list(values[row_idx - 1])
+            _apply_turtle_update(pending[key], column_indices, primary_id, turtle_data)
+            if 'deceased' in turtle_data:
+                pending_deceased[key] = str(turtle_data.get('deceased') or '')
+            results[i] = True
+        if not pending:
+            return results
+
+        service.spreadsheets().values().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            range=range_name,
-            valueInputOption='RAW',
-            body=body
+            body={
+                'valueInputOption': 'RAW',
+                'data': [
+                    {'range': f"{escape_sheet_name(sheet_name)}!{row_idx}:{row_idx}", 'values': [row_data]}
+                    for (sheet_name, row_idx), row_data in pending.items()
+                ],
+            },
         ).execute()
+    except HttpError as e:
+        print(f"Error updating turtle data: {e}")
+        return [False] * len(updates)
 
+    for (sheet_name, row_idx), row_data in pending.items():
+        column_indices = sheet_layouts[sheet_name][0]
         deceased_raw = ''
         if 'Deceased?' in column_indices:
             ix = column_indices['Deceased?']
             deceased_raw = row_data[ix] if ix < len(row_data) else ''
-        elif 'deceased' in turtle_data:
-            deceased_raw = str(turtle_data.get('deceased') or '')
-        apply_deceased_row_background(
-            service, spreadsheet_id, sheet_name, row_idx, is_deceased_yes(deceased_raw),
-        )
+        else:
+            deceased_raw = pending_deceased.get((sheet_name, row_idx), '')
+        try:
+            apply_deceased_row_background(
+                service, spreadsheet_id, sheet_name, row_idx, is_deceased_yes(deceased_raw),
+            )
+        except HttpError as e:
+            print(f"Error updating turtle row background: {e}")
+    return results
+
+
+def update_turtle_data(service, spreadsheet_id: str, primary_id: str, turtle_data: Dict[str, Any], sheet_name: str,
+                      state: Optional[str] = None, location: Optional[str] = None,
+                      ensure_primary_id_column_func=None, list_sheets_func=None,
+                      get_all_column_indices_func=None,
+                      invalidate_column_indices_cache_func=None) -> bool:
+    """
+    Update existing turtle data in Google Sheets (one-element update_turtle_data_bulk).
+    
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Google Sheets spreadsheet ID
+        primary_id: Primary ID of the turtle to update
+        turtle_data: Dictionary with updated turtle data (using internal field names)
+        sheet_name: Name of the sheet (tab) to update in (e.g., "Location A", "Location B")
+        state: Optional state name (for backwards compatibility)
+        location: Optional specific location (for backwards compatibility)
+        ensure_primary_id_column_func: Function to ensure Primary ID column exists
+        list_sheets_func: Function to list available sheets
+        get_all_column_indices_func: Function to get all column indices
         
-        return True
-    except HttpError as e:
-        print(f"Error updating turtle data: {e}")
-        return False
+    Returns:
+        True if successful, False otherwise
+    """
+    # Raises ValueError for an empty or backup sheet_name
+    sheet_name = get_sheet_name_for_region(sheet_name=sheet_name, state=state, location=location)
+    return update_turtle_data_bulk(
+        service, spreadsheet_id, [(primary_id, sheet_name, turtle_data)],
+        ensure_primary_id_column_func, list_sheets_func,
+        get_all_column_indices_func, invalidate_column_indices_cache_func,
+    )[0]
 
 
 def delete_turtle_data(service, spreadsheet_id: str, primary_id: str, sheet_name: str,
@@ -404,33 +578,74 @@ def delete_turtle_data(service, spreadsheet_id: str, primary_id: str, sheet_name
         return False
 
 
-def find_turtle_sheet(service, spreadsheet_id: str, primary_id: str, list_sheets_func=None,
-                     find_row_by_primary_id_func=None) -> Optional[str]:
+def _id_column_ranges(service, spreadsheet_id: str, sheet_names: List[str]) -> List[Tuple[str, str, int]]:
+    """
+    Read every tab's header row in one values.batchGet and locate its ID columns.
+    
+    Returns:
+        (sheet_name, column, column_index) for each tab's "Primary ID" and "ID" columns
+    """
+    result = service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=[f"{escape_sheet_name(name)}!1:1" for name in sheet_names],
+        fields='valueRanges.values',
+    ).execute()
+    columns = []
+    for name, value_range in zip(sheet_names, result.get('valueRanges', [])):
+        headers = (value_range.get('values') or [[]])[0]
+        indices = header_column_indices(headers)
+        for column in ('Primary ID', 'ID'):
+            if column in indices:
+                columns.append((name, column, indices[column]))
+    return columns
+
+
+def find_turtle_sheet(service, spreadsheet_id: str, primary_id: str, list_sheets_func=None) -> Optional[str]:
     """
     Find which sheet contains a turtle with the given primary ID.
-    Searches all sheets (except backup sheets).
+    Searches all sheets (except backup sheets) with two values.batchGet calls, whatever
+    the number of tabs: every header row, then every tab's ID columns.
     
     Args:
         service: Google Sheets API service object
         spreadsheet_id: Google Sheets spreadsheet ID
         primary_id: Primary ID to search for
         list_sheets_func: Function to list all sheets
-        find_row_by_primary_id_func: Function to find row by primary ID
         
     Returns:
         Sheet name if found, None otherwise
     """
     try:
-        all_sheets = list_sheets_func()  # Already excludes backup sheets
-        # Search by Primary ID column first
+        all_sheets = list(list_sheets_func())  # Already excludes backup sheets
+        if not all_sheets:
+            return None
+        id_columns = _id_column_ranges(service, spreadsheet_id, all_sheets)
+        if not id_columns:
+            return None
+        # Column-major reads: each range comes back as one flat list of cells
+        result = service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=[
+                f"{escape_sheet_name(name)}!{column_index_to_letter(idx)}2:{column_index_to_letter(idx)}"
+                for name, _column, idx in id_columns
+            ],
+            majorDimension='COLUMNS',
+            fields='valueRanges.values',
+        ).execute()
+        hits = {
+            (name, column)
+            for (name, column, _idx), value_range in zip(id_columns, result.get('valueRanges', []))
+            if primary_id in (value_range.get('values') or [[]])[0]
+        }
+        with_primary_id = {name for name, column, _idx in id_columns if column == 'Primary ID'}
+        # Search by Primary ID column first (the ID column stands in on tabs without one)
         for sheet_name in all_sheets:
-            row_idx = find_row_by_primary_id_func(sheet_name, primary_id, 'Primary ID')
-            if row_idx:
+            primary_column = 'Primary ID' if sheet_name in with_primary_id else 'ID'
+            if (sheet_name, primary_column) in hits:
                 return sheet_name
         # Fallback: search by biology ID column (folder name like F001/M1)
         for sheet_name in all_sheets:
-            row_idx = find_row_by_primary_id_func(sheet_name, primary_id, 'ID')
-            if row_idx:
+            if (sheet_name, 'ID') in hits:
                 return sheet_name
         return None
     except Exception as e:
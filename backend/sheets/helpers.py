@@ -2,15 +2,18 @@
 Helper functions for Google Sheets operations
 """
 
+import functools
 import time
-from typing import Optional, Dict
+from typing import Optional, Mapping
 from googleapiclient.errors import HttpError
+from .columns import CANONICAL_COLUMN_ORDER, CANONICAL_COLUMN_INDICES
 
 # Retry config for Sheets API rate limit (429)
 SHEETS_RATE_LIMIT_RETRY_WAIT_SEC = 3
 SHEETS_RATE_LIMIT_MAX_RETRIES = 2
 
 
+@functools.lru_cache(maxsize=512)
 def escape_sheet_name(sheet_name: str) -> str:
     """
     Escape sheet name for use in A1 notation.
@@ -99,7 +102,7 @@ def find_column_index(service, spreadsheet_id: str, sheet_name: str, column_head
         return None
 
 
-def get_all_column_indices(service, spreadsheet_id: str, sheet_name: str, list_sheets_func) -> Dict[str, int]:
+def get_all_column_indices(service, spreadsheet_id: str, sheet_name: str, list_sheets_func) -> Mapping[str, int]:
     """
     Get all column indices for a sheet by reading the header row.
     Skips backup sheets.
@@ -134,7 +137,8 @@ def get_all_column_indices(service, spreadsheet_id: str, sheet_name: str, list_s
             try:
                 result = service.spreadsheets().values().get(
                     spreadsheetId=spreadsheet_id,
-                    range=range_name
+                    range=range_name,
+                    fields='values',
                 ).execute()
                 break
             except HttpError as e:
@@ -152,17 +156,7 @@ def get_all_column_indices(service, spreadsheet_id: str, sheet_name: str, list_s
         if not values:
             return {}
         
-        headers = values[0]
-        column_indices = {}
-        for idx, header in enumerate(headers):
-            if header and header.strip():
-                key = header.strip()
-                # Keep first occurrence for duplicate headers (e.g. multiple "Primary ID" columns)
-                # so we always write to the same column and don't leave duplicates empty
-                if key not in column_indices:
-                    column_indices[key] = idx
-        
-        return column_indices
+        return header_column_indices(values[0])
     except HttpError as e:
         print(f"Error getting column indices for sheet '{sheet_name}': {e}")
         # Try to list available sheets for debugging
@@ -174,16 +168,31 @@ def get_all_column_indices(service, spreadsheet_id: str, sheet_name: str, list_s
         return {}
 
 
-def column_index_to_letter(col_idx: int) -> str:
+def header_column_indices(headers) -> Mapping[str, int]:
     """
-    Convert a 0-based column index to Google Sheets column letter (A, B, C, ..., Z, AA, AB, ...)
+    Map stripped, non-empty header cells (row 1) to their 0-based column index.
     
     Args:
-        col_idx: 0-based column index
+        headers: Row 1 cell values
         
     Returns:
-        Column letter(s) (e.g., 'A', 'B', 'AA')
+        Mapping of column headers to indices (0-based). A header row in exact canonical
+        order gets the shared read-only CANONICAL_COLUMN_INDICES.
     """
+    if tuple(headers) == CANONICAL_COLUMN_ORDER:
+        return CANONICAL_COLUMN_INDICES
+    column_indices = {}
+    for idx, header in enumerate(headers):
+        if header and header.strip():
+            key = header.strip()
+            # Keep first occurrence for duplicate headers (e.g. multiple "Primary ID" columns)
+            # so we always write to the same column and don't leave duplicates empty
+            if key not in column_indices:
+                column_indices[key] = idx
+    return column_indices
+
+
+def _column_letter(col_idx: int) -> str:
     result = ''
     col_idx += 1  # Convert to 1-based
     while col_idx > 0:
@@ -193,6 +202,25 @@ def column_index_to_letter(col_idx: int) -> str:
     return result
 
 
+# A..ZZ (every column our ranges address, e.g. A:ZZ); wider sheets fall back to _column_letter
+_COLUMN_LETTERS = tuple(_column_letter(i) for i in range(26 * 27))
+
+
+def column_index_to_letter(col_idx: int) -> str:
+    """
+    Convert a 0-based column index to Google Sheets column letter (A, B, C, ..., Z, AA, AB, ...)
+    
+    Args:
+        col_idx: 0-based column index
+        
+    Returns:
+        Column letter(s) (e.g., 'A', 'B', 'AA')
+    """
+    if 0 <= col_idx < len(_COLUMN_LETTERS):
+        return _COLUMN_LETTERS[col_idx]
+    return _column_letter(col_idx)
+
+
 def is_backup_sheet(sheet_name: str) -> bool:
     """
     Check if a sheet name is a backup sheet.
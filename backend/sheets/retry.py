@@ -0,0 +1,81 @@
+"""
+Retry with jittered exponential backoff for Sheets API calls.
+
+Callers wrap one *attempt* (taking ``_api_lock`` inside it if they need it), so the lock is
+released while we sleep and other threads are not queued behind a backoff.
+"""
+
+import logging
+import random
+import ssl
+import time
+from http.client import IncompleteRead
+from typing import Callable, Optional, TypeVar
+
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+RETRY_MAX_ATTEMPTS = 4
+RETRY_INITIAL_WAIT_SEC = 0.2
+RETRY_MAX_WAIT_SEC = 5.0
+# 429 = rate limit; 5xx = Google backend hiccup
+RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_CONNECTION_ERROR_MARKERS = ('ssl', 'decryption', 'incompleteread', 'wrong_version', 'cipher', 'mac')
+
+T = TypeVar('T')
+
+
+def is_connection_error(e: BaseException) -> bool:
+    """True for SSL / dropped-connection errors (the client should be rebuilt before retrying)."""
+    if isinstance(e, (ssl.SSLError, IncompleteRead, ConnectionError)):
+        return True
+    if isinstance(e, OSError):
+        msg = str(e).lower()
+        return any(marker in msg for marker in _CONNECTION_ERROR_MARKERS)
+    return False
+
+
+def is_retryable_error(e: BaseException) -> bool:
+    """Connection flakes plus rate-limit / server-side HttpErrors."""
+    if isinstance(e, HttpError):
+        return getattr(e.resp, 'status', None) in RETRYABLE_HTTP_STATUSES
+    return is_connection_error(e)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait after failed attempt ``attempt`` (0-based): exponential, capped, plus jitter."""
+    return min(RETRY_MAX_WAIT_SEC, RETRY_INITIAL_WAIT_SEC * (2 ** attempt)) + random.uniform(0, RETRY_INITIAL_WAIT_SEC)
+
+
+def call_with_retry(func: Callable[[], T], label: str,
+                    on_connection_error: Optional[Callable[[], None]] = None,
+                    max_attempts: int = RETRY_MAX_ATTEMPTS) -> T:
+    """
+    Call ``func`` until it succeeds, retrying retryable errors with backoff.
+
+    Args:
+        func: One attempt (no arguments)
+        label: Short description for log lines
+        on_connection_error: Called before sleeping after a connection error (e.g. reinitialize the client)
+        max_attempts: Total attempts, including the first
+
+    Returns:
+        Whatever ``func`` returns; the last error is re-raised once attempts run out
+    """
+    for attempt in range(max_attempts):
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= max_attempts - 1 or not is_retryable_error(e):
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning("⚠️ %s: %s. Retrying in %.1fs (%d/%d)", label, e, delay, attempt + 1, max_attempts - 1)
+            if on_connection_error is not None and is_connection_error(e):
+                try:
+                    on_connection_error()
+                except Exception:
+                    pass
+            time.sleep(delay)
+    raise AssertionError('unreachable')
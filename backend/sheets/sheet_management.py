@@ -2,11 +2,13 @@
 Sheet management functions for Google Sheets
 """
 
+import logging
 from typing import Any, Dict, List, Optional
 from googleapiclient.errors import HttpError
+import random
 import ssl
 import time
-from .helpers import escape_sheet_name, column_index_to_letter, is_backup_sheet
+from .helpers import escape_sheet_name, column_index_to_letter, get_all_column_indices, is_backup_sheet
 from .columns import (
     CANONICAL_COLUMN_ORDER,
     FIELD_TO_COLUMN,
@@ -15,8 +17,11 @@ from .columns import (
 )
 from general_locations_catalog import get_general_location_options_for_sheet
 
+logger = logging.getLogger(__name__)
+
 GENERAL_LOCATION_VALIDATION_START_ROW = 1  # Row 2 in Sheets UI
 GENERAL_LOCATION_VALIDATION_END_ROW = 100000
+DEFAULT_SHEET_COLUMN_COUNT = 26
 
 
 def _sheets_v4_client_and_id(service_or_wrapper):
@@ -42,6 +47,33 @@ def _get_sheet_id(service, spreadsheet_id: str, sheet_name: str) -> Optional[int
     return None
 
 
+def _insert_header_column_requests(sheet_id: int, column_index: int, header: str,
+                                   inherit_from_before: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """batchUpdate requests inserting one column and writing its row-1 header (one atomic call)."""
+    insert = {
+        'range': {
+            'sheetId': sheet_id,
+            'dimension': 'COLUMNS',
+            'startIndex': column_index,
+            'endIndex': column_index + 1,
+        }
+    }
+    if inherit_from_before is not None:
+        insert['inheritFromBefore'] = inherit_from_before
+    return [{'insertDimension': insert}, _header_cells_request(sheet_id, column_index, [header])]
+
+
+def _header_cells_request(sheet_id: int, column_index: int, headers: List[str]) -> Dict[str, Any]:
+    """updateCells request writing headers into row 1 from column_index on (RAW strings)."""
+    return {
+        'updateCells': {
+            'rows': [{'values': [{'userEnteredValue': {'stringValue': header}} for header in headers]}],
+            'fields': 'userEnteredValue',
+            'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': column_index},
+        }
+    }
+
+
 def _get_general_location_column_index(service, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
     """Return the zero-based column index for the General Location column."""
     try:
@@ -75,6 +107,29 @@ def _build_general_location_validation_values(sheet_name: str) -> List[str]:
     return values
 
 
+def _general_location_validation_request(sheet_id: int, column_index: int, values: List[str]) -> Dict[str, Any]:
+    """setDataValidation request for the General Location dropdown (rows 2+)."""
+    return {
+        'setDataValidation': {
+            'range': {
+                'sheetId': sheet_id,
+                'startRowIndex': GENERAL_LOCATION_VALIDATION_START_ROW,
+                'endRowIndex': GENERAL_LOCATION_VALIDATION_END_ROW,
+                'startColumnIndex': column_index,
+                'endColumnIndex': column_index + 1,
+            },
+            'rule': {
+                'condition': {
+                    'type': 'ONE_OF_LIST',
+                    'values': [{'userEnteredValue': value} for value in values],
+                },
+                'showCustomUi': True,
+                'strict': True,
+            },
+        }
+    }
+
+
 def _apply_general_location_validation(
     service,
     spreadsheet_id: str,
@@ -102,28 +157,9 @@ def _apply_general_location_validation(
         if not values:
             return False
 
-        requests = [{
-            'setDataValidation': {
-                'range': {
-                    'sheetId': sheet_id,
-                    'startRowIndex': GENERAL_LOCATION_VALIDATION_START_ROW,
-                    'endRowIndex': GENERAL_LOCATION_VALIDATION_END_ROW,
-                    'startColumnIndex': column_index,
-                    'endColumnIndex': column_index + 1,
-                },
-                'rule': {
-                    'condition': {
-                        'type': 'ONE_OF_LIST',
-                        'values': [{'userEnteredValue': value} for value in values],
-                    },
-                    'showCustomUi': True,
-                    'strict': True,
-                },
-            }
-        }]
         service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            body={'requests': requests},
+            body={'requests': [_general_location_validation_request(sheet_id, column_index, values)]},
         ).execute()
         return True
     except HttpError as e:
@@ -275,38 +311,21 @@ def ensure_missing_columns_for_turtle_write(
             print(f"ERROR: Could not find sheet '{sheet_name}' for column insert")
             return False
 
+        # Requests in one batchUpdate apply in order, so each insert index is computed
+        # against the header row as the previous inserts left it.
+        headers = _read_header_row_list(service, spreadsheet_id, sheet_name)
+        requests = []
         for header in missing:
-            headers = _read_header_row_list(service, spreadsheet_id, sheet_name)
-            normalized = [(h or '').strip() for h in headers]
-            if header in normalized:
+            if header in [(h or '').strip() for h in headers]:
                 continue
-
             insert_at = compute_insert_index_for_missing_column(headers, header)
-            requests = [{
-                'insertDimension': {
-                    'range': {
-                        'sheetId': sheet_id,
-                        'dimension': 'COLUMNS',
-                        'startIndex': insert_at,
-                        'endIndex': insert_at + 1,
-                    }
-                }
-            }]
+            requests.extend(_insert_header_column_requests(sheet_id, insert_at, header))
+            headers.insert(insert_at, header)
+        if requests:
             service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body={'requests': requests},
             ).execute()
-
-            escaped_sheet = escape_sheet_name(sheet_name)
-            col_letter = column_index_to_letter(insert_at)
-            range_name = f"{escaped_sheet}!{col_letter}1"
-            service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body={'values': [[header]]},
-            ).execute()
-
             if invalidate_column_indices_cache_func:
                 invalidate_column_indices_cache_func(sheet_name)
 
@@ -377,35 +396,10 @@ def ensure_primary_id_column(service, spreadsheet_id: str, sheet_name: str, get_
                 print(f"ERROR: Could not find sheet '{sheet_name}'")
                 return False
             
-            # Insert a new column at position 0 (before column A)
-            requests = [{
-                'insertDimension': {
-                    'range': {
-                        'sheetId': sheet_id,
-                        'dimension': 'COLUMNS',
-                        'startIndex': 0,
-                        'endIndex': 1
-                    }
-                }
-            }]
-            
-            body = {'requests': requests}
+            # Insert a new column at position 0 (before column A) and write "Primary ID" to A1
             service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
-            
-            # Now add the header "Primary ID" to cell A1
-            escaped_sheet = escape_sheet_name(sheet_name)
-            range_name = f"{escaped_sheet}!A1"
-            body = {
-                'values': [['Primary ID']]
-            }
-            service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body=body
+                body={'requests': _insert_header_column_requests(sheet_id, 0, 'Primary ID')}
             ).execute()
             if invalidate_column_indices_cache_func:
                 invalidate_column_indices_cache_func(sheet_name)
@@ -422,67 +416,65 @@ def ensure_primary_id_column(service, spreadsheet_id: str, sheet_name: str, get_
         return False
 
 
-def find_row_by_primary_id(service, spreadsheet_id: str, sheet_name: str, primary_id: str, id_column: str, list_sheets_func) -> Optional[int]:
+def get_row_index(service, spreadsheet_id: str, sheet_name: str, id_column: str, list_sheets_func,
+                  get_all_column_indices_func=None) -> Optional[Dict[str, int]]:
     """
-    Find the row index (1-based) for a turtle with a given primary ID.
-    Searches in the "Primary ID" column (not the "ID" column).
+    Map every value of an ID column to its row index (1-based), reading only that column.
     Skips backup sheets.
     
     Args:
         service: Google Sheets API service object
         spreadsheet_id: Google Sheets spreadsheet ID
         sheet_name: Name of the sheet (tab)
-        primary_id: Primary ID to search for
-        id_column: Column header for the Primary ID column (default: 'Primary ID')
+        id_column: Column header to index (e.g. 'Primary ID'; falls back to 'ID' if missing)
         list_sheets_func: Function to list available sheets
+        get_all_column_indices_func: Optional (cached) header lookup; reads row 1 when omitted
         
     Returns:
-        Row index (1-based) or None if not found
+        Dictionary ID -> row index (first row wins on duplicates), or None if the tab could not be read
     """
     # Skip backup sheets - they should not be accessed
     if is_backup_sheet(sheet_name):
-        return None
+        return {}
     
     try:
-        # First, verify the sheet exists
-        available_sheets = list_sheets_func()
-        if sheet_name not in available_sheets:
-            print(f"Warning: Sheet '{sheet_name}' not found. Available sheets: {available_sheets}")
-            return None
-        
-        # Get all values in the sheet
-        escaped_sheet = escape_sheet_name(sheet_name)
-        range_name = f"{escaped_sheet}!A:ZZ"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=range_name
-        ).execute()
-        
-        values = result.get('values', [])
-        if not values or len(values) < 2:
+        if get_all_column_indices_func is not None:
+            column_indices = get_all_column_indices_func(sheet_name)
+        else:
+            column_indices = get_all_column_indices(service, spreadsheet_id, sheet_name, list_sheets_func)
+        if not column_indices:
+            # Missing tab or unreadable header (already logged); don't let the caller cache it
             return None
         
         # Find Primary ID column index
-        headers = values[0]
-        try:
-            id_col_idx = headers.index(id_column)
-        except ValueError:
+        id_col_idx = column_indices.get(id_column)
+        if id_col_idx is None:
             # Primary ID column doesn't exist - try to find in "ID" column as fallback
-            print(f"Warning: Column '{id_column}' not found in sheet '{sheet_name}'. Trying 'ID' column as fallback. Available columns: {headers}")
-            try:
-                id_col_idx = headers.index('ID')
-                # Found ID column - search there as fallback
-                print(f"Found 'ID' column at index {id_col_idx}, searching there (migration recommended)")
-            except ValueError:
+            print(f"Warning: Column '{id_column}' not found in sheet '{sheet_name}'. Trying 'ID' column as fallback. Available columns: {list(column_indices)}")
+            id_col_idx = column_indices.get('ID')
+            if id_col_idx is None:
                 print(f"Error: Neither 'Primary ID' nor 'ID' column found in sheet '{sheet_name}'")
-                return None
+                return {}
+            # Found ID column - search there as fallback
+            print(f"Found 'ID' column at index {id_col_idx}, searching there (migration recommended)")
         
-        # Search for the primary ID (starting from row 2, index 1)
-        for row_idx, row in enumerate(values[1:], start=2):
-            if len(row) > id_col_idx and row[id_col_idx] == primary_id:
-                return row_idx
+        # Just the ID column, column-major: one flat list instead of the whole tab. Blank cells
+        # inside the column keep their position (only trailing blanks are dropped), so list
+        # position i is sheet row i + 2.
+        col_letter = column_index_to_letter(id_col_idx)
+        result = service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id,
+            range=f"{escape_sheet_name(sheet_name)}!{col_letter}2:{col_letter}",
+            majorDimension='COLUMNS',
+            fields='values',
+        ).execute()
+        cells = (result.get('values') or [[]])[0]
         
-        return None
+        row_index = {}
+        for row_idx, value in enumerate(cells, start=2):
+            if value:
+                row_index.setdefault(value, row_idx)
+        return row_index
     except HttpError as e:
         print(f"Error finding row by primary ID in sheet '{sheet_name}': {e}")
         # Try to list available sheets for debugging
@@ -494,6 +486,27 @@ def find_row_by_primary_id(service, spreadsheet_id: str, sheet_name: str, primar
         return None
 
 
+def find_row_by_primary_id(service, spreadsheet_id: str, sheet_name: str, primary_id: str, id_column: str, list_sheets_func) -> Optional[int]:
+    """
+    Find the row index (1-based) for a turtle with a given primary ID.
+    Searches in the "Primary ID" column (not the "ID" column).
+    Skips backup sheets.
+    
+    Args:
+        service: Google Sheets API service object
+        spreadsheet_id: Google Sheets spreadsheet ID
+        sheet_name: Name of the sheet (tab)
+        primary_id: Primary ID to search for
+        id_column: Column header for the Primary ID column (default: 'Primary ID')
+        list_sheets_func: Function to list available sheets
+        
+    Returns:
+        Row index (1-based) or None if not found
+    """
+    row_index = get_row_index(service, spreadsheet_id, sheet_name, id_column, list_sheets_func)
+    return row_index.get(primary_id) if row_index else None
+
+
 def ensure_deceased_column(
     service,
     spreadsheet_id: str,
@@ -525,28 +538,11 @@ def ensure_deceased_column(
         service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={
-                'requests': [
-                    {
-                        'insertDimension': {
-                            'range': {
-                                'sheetId': sheet_id,
-                                'dimension': 'COLUMNS',
-                                'startIndex': insert_at,
-                                'endIndex': insert_at + 1,
-                            },
-                            'inheritFromBefore': False,
-                        }
-                    }
-                ]
+                'requests': _insert_header_column_requests(
+                    sheet_id, insert_at, 'Deceased?', inherit_from_before=False,
+                )
             },
         ).execute()
-        col_letter = column_index_to_letter(insert_at)
-        service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=f'{escaped}!{col_letter}1',
-            valueInputOption='RAW',
-            body={'values': [['Deceased?']]},
-        ).execute()
         if invalidate_column_indices_cache_func:
             invalidate_column_indices_cache_func(sheet_name)
         print(f"Added 'Deceased?' column to sheet '{sheet_name}'")
@@ -590,36 +586,32 @@ def list_sheets(service, spreadsheet_id: str, reinitialize_service_func, max_ret
             
             return filtered_sheets
         except HttpError as e:
-            print(f"Error listing sheets (HttpError): {e}")
             if attempt < max_retries - 1:
-                print(f"Retrying... (attempt {attempt + 1}/{max_retries})")
+                logger.warning("Error listing sheets (HttpError): %s. Retrying... (attempt %d/%d)",
+                               e, attempt + 1, max_retries)
                 try:
                     reinitialize_service_func()
-                    import time
                     time.sleep(1.0)  # Allow new connection to settle before retry
                     continue
                 except:
                     pass
-            import traceback
-            traceback.print_exc()
+            logger.error("Error listing sheets (HttpError): %s", e, exc_info=True)
             return []
         except (ssl.SSLError, AttributeError) as e:
             # SSL errors or connection issues - try reinitializing
             error_msg = str(e)
             if 'SSL' in error_msg or 'BIO' in error_msg or 'NoneType' in error_msg:
-                print(f"SSL/Connection error listing sheets: {e}")
                 if attempt < max_retries - 1:
-                    print(f"Reinitializing service and retrying... (attempt {attempt + 1}/{max_retries})")
+                    logger.warning("SSL/Connection error listing sheets: %s. Reinitializing service and "
+                                   "retrying... (attempt %d/%d)", e, attempt + 1, max_retries)
                     try:
                         reinitialize_service_func()
-                        import time
                         time.sleep(1.0)  # Allow new connection to settle before retry
                         continue
                     except Exception as reinit_error:
-                        print(f"Failed to reinitialize: {reinit_error}")
+                        logger.warning("Failed to reinitialize: %s", reinit_error)
                 else:
-                    # Only print traceback on final failure
-                    print(f"⚠️ Failed to list sheets after {max_retries} attempts")
+                    logger.warning("⚠️ Failed to list sheets after %d attempts: %s", max_retries, e)
                     return []
             else:
                 raise
@@ -627,26 +619,21 @@ def list_sheets(service, spreadsheet_id: str, reinitialize_service_func, max_ret
             error_msg = str(e)
             if 'SSL' in error_msg or 'BIO' in error_msg or 'NoneType' in error_msg or 'read' in error_msg:
                 # Treat as SSL/connection error
-                print(f"Connection error listing sheets: {e}")
                 if attempt < max_retries - 1:
-                    print(f"Reinitializing service and retrying... (attempt {attempt + 1}/{max_retries})")
+                    logger.warning("Connection error listing sheets: %s. Reinitializing service and "
+                                   "retrying... (attempt %d/%d)", e, attempt + 1, max_retries)
                     try:
                         reinitialize_service_func()
-                        import time
                         time.sleep(1.0)  # Allow new connection to settle before retry
                         continue
                     except Exception as reinit_error:
-                        print(f"Failed to reinitialize: {reinit_error}")
+                        logger.warning("Failed to reinitialize: %s", reinit_error)
                 else:
-                    # Only print traceback on final failure
-                    print(f"⚠️ Failed to list sheets after {max_retries} attempts")
+                    logger.warning("⚠️ Failed to list sheets after %d attempts: %s", max_retries, e)
                     return []
             else:
-                print(f"Error listing sheets (Exception): {e}")
-                # Only print traceback for unexpected errors
-                if attempt >= max_retries - 1:
-                    import traceback
-                    traceback.print_exc()
+                # Only log a traceback for unexpected errors
+                logger.error("Error listing sheets (Exception): %s", e, exc_info=attempt >= max_retries - 1)
                 return []
     
     # If we get here, all retries failed
@@ -688,48 +675,34 @@ def create_sheet_with_headers(service, spreadsheet_id: str, sheet_name: str, col
         else:
             headers = list(column_mapping.keys())
         
-        # Create the new sheet
-        requests = [{
-            'addSheet': {
-                'properties': {
-                    'title': sheet_name
+        # One atomic batchUpdate: add the tab, write the header row, set the General Location
+        # dropdown. We pick the new sheetId so the later requests can address the tab.
+        sheet_id = random.randint(1, 2 ** 31 - 1)
+        requests = [
+            {
+                'addSheet': {
+                    'properties': {
+                        'sheetId': sheet_id,
+                        'title': sheet_name,
+                        # updateCells does not grow the grid (default is 26 columns)
+                        'gridProperties': {'columnCount': max(DEFAULT_SHEET_COLUMN_COUNT, len(headers))},
+                    }
                 }
-            }
-        }]
-        
-        body = {'requests': requests}
-        response = service.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body=body
-        ).execute()
-        
-        # Get the new sheet ID
-        sheet_id = None
-        for reply in response.get('replies', []):
-            if 'addSheet' in reply:
-                sheet_id = reply['addSheet']['properties']['sheetId']
-                break
-        
-        if sheet_id is None:
-            print(f"ERROR: Could not get sheet ID for new sheet '{sheet_name}'")
-            return False
+            },
+            _header_cells_request(sheet_id, 0, headers),
+        ]
+        general_location_idx = headers.index('General Location') if 'General Location' in headers else None
+        if apply_general_location_validation and general_location_idx is not None:
+            validation_values = _build_general_location_validation_values(sheet_name)
+            if validation_values:
+                requests.append(
+                    _general_location_validation_request(sheet_id, general_location_idx, validation_values)
+                )
         
-        # Write headers to row 1
-        escaped_sheet = escape_sheet_name(sheet_name)
-        range_name = f"{escaped_sheet}!1:1"
-        body = {
-            'values': [headers]
-        }
-        service.spreadsheets().values().update(
+        service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            range=range_name,
-            valueInputOption='RAW',
-            body=body
+            body={'requests': requests}
         ).execute()
-
-        general_location_idx = headers.index('General Location') if 'General Location' in headers else None
-        if apply_general_location_validation:
-            _apply_general_location_validation(service, spreadsheet_id, sheet_name, sheet_id, general_location_idx)
         
         print(f"✅ Created new sheet '{sheet_name}' with {len(headers)} headers")
         return True
@@ -0,0 +1,45 @@
+"""
+Pooled HTTP transport for the Sheets discovery client.
+
+googleapiclient talks to an ``httplib2.Http``-like object (one ``request()`` method). httplib2
+keeps at most one connection per host and cannot be shared between threads, so each new client
+(and each reconnect) pays a fresh TLS handshake. ``SessionHttp`` routes those calls through a
+``google.auth.transport.requests.AuthorizedSession`` instead: urllib3 keeps a thread-safe pool
+of keep-alive connections that every per-thread client shares, and the session adds the OAuth
+bearer token (refreshing it when needed).
+"""
+
+import httplib2
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+HTTP_TIMEOUT_SEC = 60
+
+
+def authorized_session(credentials) -> AuthorizedSession:
+    """AuthorizedSession with a keep-alive pool sized for concurrent request threads."""
+    session = AuthorizedSession(credentials)
+    session.mount('https://', HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE))
+    return session
+
+
+class SessionHttp:
+    """Minimal ``httplib2.Http`` stand-in for ``googleapiclient.discovery.build(http=...)``."""
+
+    def __init__(self, session, timeout: float = HTTP_TIMEOUT_SEC):
+        self.session = session
+        self.timeout = timeout
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=5, connection_type=None):
+        """Same contract as ``httplib2.Http.request``: returns ``(response, content_bytes)``."""
+        r = self.session.request(
+            method, uri, data=body, headers=headers, timeout=self.timeout,
+            allow_redirects=redirections > 0,
+        )
+        info = dict(r.headers)
+        info['status'] = str(r.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = r.reason
+        return resp, r.content
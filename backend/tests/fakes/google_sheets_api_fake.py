@@ -27,6 +27,18 @@ def _tail_after_bang(range_str: str) -> str:
     return range_str.split('!')[-1].strip("'")
 
 
+def _to_columns(rows: list[list[str]]) -> list[list[str]]:
+    """Column-major view of a row-major range: trailing blanks of each column are dropped."""
+    width = max((len(r) for r in rows), default=0)
+    columns = []
+    for j in range(width):
+        column = [r[j] if j < len(r) else '' for r in rows]
+        while column and not column[-1]:
+            column.pop()
+        columns.append(column)
+    return columns
+
+
 def _pad_row(row: list[str], width: int) -> list[str]:
     out = list(row)
     while len(out) < width:
@@ -48,6 +60,8 @@ class GoogleSheetsValuesFake:
 
     # For assertions: 1-based sheet row number targeted by the last update()
     last_update_sheet_row: int | None = None
+    batch_get_calls: int = 0
+    batch_update_calls: int = 0
 
     def spreadsheets(self) -> GoogleSheetsValuesFake:
         return self
@@ -60,8 +74,35 @@ class GoogleSheetsValuesFake:
         self.last_get_range = range
         tail = _tail_after_bang(range)
         values = self._values_for_range(tail)
+        if kwargs.get('majorDimension') == 'COLUMNS':
+            values = _to_columns(values)
         return _Execute({'values': values})
 
+    def batchGet(self, spreadsheetId: str | None = None, ranges: list[str] | None = None, **kwargs: Any):
+        """Every range reads the single tab: a bare tab name returns the full grid, `tab!A1` ranges a slice."""
+        assert ranges
+        self.batch_get_calls += 1
+        value_ranges = []
+        for r in ranges:
+            values = self._values_for_range(_tail_after_bang(r)) if '!' in r else [list(row) for row in self.grid]
+            if kwargs.get('majorDimension') == 'COLUMNS':
+                values = _to_columns(values)
+            value_ranges.append({'range': r, 'values': values})
+        return _Execute({'valueRanges': value_ranges})
+
+    def batchUpdate(self, spreadsheetId: str | None = None, body: dict[str, Any] | None = None, **kwargs: Any):
+        """values.batchUpdate: applies each ValueRange through update()."""
+        assert body is not None
+        self.batch_update_calls += 1
+        for value_range in body.get('data', []):
+            self.update(
+                spreadsheetId=spreadsheetId,
+                range=value_range['range'],
+                body={'values': value_range['values']},
+                valueInputOption=body.get('valueInputOption'),
+            )
+        return _Execute({})
+
     def update(
         self,
         spreadsheetId: str | None = None,
@@ -105,6 +146,11 @@ class GoogleSheetsValuesFake:
         - `A:A` — **single column A**: header row plus only rows where column A is non-empty.
           Rows with empty Primary ID but biology ID in C are **omitted** (sparse-column bug).
         """
+        # Whole rows, e.g. 1:1 (header row)
+        m_rows = re.match(r'^(\d+):(\d+)$', tail)
+        if m_rows:
+            return [list(row) for row in self.grid[int(m_rows.group(1)) - 1:int(m_rows.group(2))]]
+
         # Unbounded column range starting at a row, e.g. A2:C (used by get_max_biology_id_number)
         m_unbounded = re.match(r'^([A-Z]+)(\d+):([A-Z]+)$', tail)
         if m_unbounded:
@@ -0,0 +1,116 @@
+"""Tests for the short-lived verified-JWT cache in ``auth.verify_jwt_token``."""
+
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+import auth
+import config
+
+
+def _token(**claims):
+    payload = {"sub": "pytest-token-cache", "role": "admin", **claims}
+    token = jwt.encode(payload, config.JWT_SECRET, algorithm="HS256")
+    return token if isinstance(token, str) else token.decode("ascii")
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    auth.clear_token_cache()
+    yield
+    auth.clear_token_cache()
+
+
+def test_repeat_token_is_decoded_once():
+    token = _token(exp=int(time.time()) + 600)
+    with patch("auth.jwt.decode", wraps=jwt.decode) as decode:
+        first = auth.verify_jwt_token(f"Bearer {token}")
+        second = auth.verify_jwt_token(token)
+    assert first[0] and second[0]
+    assert first[1] == second[1]
+    assert decode.call_count == 1
+
+
+def test_cached_payload_is_a_copy():
+    token = _token(exp=int(time.time()) + 600)
+    ok, payload, _ = auth.verify_jwt_token(token)
+    assert ok
+    payload["role"] = "tampered"
+    ok, payload_again, _ = auth.verify_jwt_token(token)
+    assert payload_again["role"] == "admin"
+
+
+def test_invalid_token_is_not_cached():
+    with patch("auth.jwt.decode", side_effect=jwt.InvalidTokenError("bad")) as decode:
+        assert auth.verify_jwt_token("garbage")[0] is False
+        assert auth.verify_jwt_token("garbage")[0] is False
+    assert decode.call_count == 2
+
+
+def test_cache_entry_never_outlives_token_exp():
+    exp = int(time.time()) + 2
+    token = _token(exp=exp)
+    with patch("auth.JWT_CACHE_TTL_SEC", 3600):
+        assert auth.verify_jwt_token(token)[0]
+        # Once the cache's clock passes exp the entry is dropped and the token re-verified
+        with patch("auth.time.time", return_value=exp + 1):
+            with patch("auth.jwt.decode", wraps=jwt.decode) as decode:
+                auth.verify_jwt_token(token)
+    assert decode.call_count == 1
+
+
+def test_ttl_zero_disables_cache():
+    token = _token(exp=int(time.time()) + 600)
+    with patch("auth.JWT_CACHE_TTL_SEC", 0):
+        with patch("auth.jwt.decode", wraps=jwt.decode) as decode:
+            auth.verify_jwt_token(token)
+            auth.verify_jwt_token(token)
+    assert decode.call_count == 2
+
+
+def test_get_user_from_request_verifies_once_per_request():
+    from flask import Flask
+
+    token = _token(exp=int(time.time()) + 600)
+    app = Flask(__name__)
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        with patch("auth.verify_jwt_token", wraps=auth.verify_jwt_token) as verify:
+            first = auth.get_user_from_request()
+            second = auth.get_user_from_request()
+    assert first[0] and second[0]
+    assert second[1] is first[1]
+    assert verify.call_count == 1
+
+
+def test_cache_keeps_only_identity_claims():
+    exp = int(time.time()) + 600
+    token = _token(exp=exp, email="a@b.org", name="Big Payload", iat=1)
+    expected = {"sub": "pytest-token-cache", "role": "admin", "email": "a@b.org", "exp": exp}
+    cold = auth.verify_jwt_token(token)[1]
+    ctx, _ = next(iter(auth._token_cache.values()))
+    assert isinstance(ctx, auth.AuthCtx)
+    warm = auth.verify_jwt_token(token)[1]
+    # Same claims whether or not the cache answered, so routes can't depend on a cold cache
+    assert cold == warm == expected
+
+
+def test_user_full_re_decodes_every_claim_on_demand():
+    from flask import Flask
+
+    token = _token(exp=int(time.time()) + 600, email_verified=True, name="Big Payload")
+    app = Flask(__name__)
+    app.request_class = auth.AuthRequest
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        from flask import request
+
+        assert "email_verified" not in auth.get_user_from_request()[1]
+        with patch("auth.jwt.decode", wraps=jwt.decode) as decode:
+            assert request.user_full["email_verified"] is True
+            assert request.user_full["name"] == "Big Payload"
+        assert decode.call_count == 1
+    with app.test_request_context(headers={"Authorization": "Bearer garbage"}):
+        from flask import request
+
+        assert request.user_full is None
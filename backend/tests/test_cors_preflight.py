@@ -0,0 +1,34 @@
+"""
+Unit tests: CORS preflights are answered before routing/auth, with exactly one set of headers.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def app_client():
+    from app import app
+
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def test_preflight_on_admin_route_skips_auth(app_client):
+    r = app_client.options(
+        "/api/review-queue",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "authorization",
+        },
+    )
+    assert r.status_code == 204
+    assert r.headers.getlist("Access-Control-Allow-Origin") == ["*"]
+    assert "Authorization" in r.headers["Access-Control-Allow-Headers"]
+    assert r.headers["Access-Control-Max-Age"] == "86400"
+
+
+def test_regular_response_still_gets_cors_header_once(app_client):
+    r = app_client.get("/api/health", headers={"Origin": "http://localhost:5173"})
+    assert r.status_code == 200
+    assert r.headers.getlist("Access-Control-Allow-Origin") == ["*"]
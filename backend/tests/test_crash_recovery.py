@@ -6,7 +6,6 @@ Tests staged file recovery, temp file cleanup, and atomic reference replacement.
 
 import os
 import time
-import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -151,12 +150,20 @@ class TestStagedFileRecovery:
 # Test: Temp file cleanup
 # ---------------------------------------------------------------------------
 
+def _spool_dir(tmp_path, monkeypatch):
+    """Per-test UPLOAD_FOLDER, which _cleanup_temp_files scans instead of the system temp dir."""
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    monkeypatch.setenv("UPLOAD_FOLDER", str(spool))
+    return str(spool)
+
+
 class TestTempFileCleanup:
     """Tests _cleanup_temp_files on startup."""
 
-    def test_removes_old_extra_files(self, tmp_path, mock_brain):
+    def test_removes_old_extra_files(self, tmp_path, mock_brain, monkeypatch):
         """Old extra_ prefixed temp files are removed on startup."""
-        temp_dir = tempfile.gettempdir()
+        temp_dir = _spool_dir(tmp_path, monkeypatch)
         # Create a fake old temp file
         old_temp = os.path.join(temp_dir, "extra_admin_123_microhabitat_999.jpg")
         with open(old_temp, 'w') as f:
@@ -174,9 +181,9 @@ class TestTempFileCleanup:
 
         assert not os.path.exists(old_temp)
 
-    def test_keeps_recent_extra_files(self, tmp_path, mock_brain):
+    def test_keeps_recent_extra_files(self, tmp_path, mock_brain, monkeypatch):
         """Recent extra_ temp files (< 1 hour old) are kept."""
-        temp_dir = tempfile.gettempdir()
+        temp_dir = _spool_dir(tmp_path, monkeypatch)
         recent_temp = os.path.join(temp_dir, "extra_admin_456_condition_888.jpg")
         with open(recent_temp, 'w') as f:
             f.write("fake")
@@ -193,9 +200,9 @@ class TestTempFileCleanup:
         # Clean up
         os.remove(recent_temp)
 
-    def test_ignores_non_matching_files(self, tmp_path, mock_brain):
+    def test_ignores_non_matching_files(self, tmp_path, mock_brain, monkeypatch):
         """Files without extra_/review_extra_ prefix are never touched."""
-        temp_dir = tempfile.gettempdir()
+        temp_dir = _spool_dir(tmp_path, monkeypatch)
         unrelated = os.path.join(temp_dir, "my_photo_backup.jpg")
         with open(unrelated, 'w') as f:
             f.write("not ours")
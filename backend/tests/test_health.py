@@ -0,0 +1,28 @@
+"""Health endpoints answer from prebuilt JSON bodies."""
+
+from flask import Flask
+
+import routes.health as health
+from services import manager_service
+
+
+def _client():
+    app = Flask(__name__)
+    health.register_health_routes(app)
+    return app.test_client()
+
+
+def test_health_reports_manager_state(monkeypatch):
+    client = _client()
+    monkeypatch.setattr(manager_service, 'manager', None)
+    r = client.get('/api/health')
+    assert r.status_code == 200 and r.mimetype == 'application/json'
+    assert r.get_json() == {'status': 'ok', 'message': 'PicTur API is running', 'manager': 'loading'}
+
+    monkeypatch.setattr(manager_service, 'manager', object())
+    assert client.get('/api/health').get_json()['manager'] == 'ready'
+
+
+def test_root_is_plain_ok():
+    r = _client().get('/')
+    assert r.status_code == 200 and r.get_json() == {'status': 'ok'}
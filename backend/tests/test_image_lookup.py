@@ -156,3 +156,18 @@ def test_find_image_in_dir_ignores_pt_and_other_extensions(tmp_path):
     img = tmp_path / 'F128.JPG'
     _write_empty_file(img)
     assert _find_image_in_dir(str(tmp_path), 'F128') == str(img)
+
+
+def test_find_image_for_pt_cache_follows_renames(tmp_path):
+    """Resolved paths are cached per directory mtime; a renamed image must be re-resolved."""
+    pt = tmp_path / 'F128.pt'
+    _write_empty_file(pt)
+    img = tmp_path / 'F128.jpg'
+    _write_empty_file(img)
+    assert find_image_for_pt(str(pt)) == str(img)
+
+    renamed = tmp_path / 'F128.PNG'
+    os.rename(img, renamed)
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert find_image_for_pt(str(pt)) == str(renamed)
@@ -0,0 +1,123 @@
+"""Cache validators and X-Accel-Redirect hand-off for ``/api/images``."""
+
+import os
+
+from flask import Flask
+from werkzeug.http import http_date
+
+import routes.images as images
+
+
+def _write(path, data=b'img'):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def test_file_etag_changes_when_file_is_rewritten(tmp_path):
+    p = tmp_path / 'F1.jpg'
+    _write(p)
+    before = images._file_etag(os.stat(p))
+    os.utime(p, ns=(0, os.stat(p).st_mtime_ns + 1_000_000))
+    assert images._file_etag(os.stat(p)) != before
+    assert images._file_etag(os.stat(p), 'w400').endswith('-w400')
+
+
+def test_accel_redirect_points_at_internal_location(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, 'IMAGE_ACCEL_REDIRECT_PREFIX', '/internal-images')
+    sub = tmp_path / 'Kansas' / 'Lawrence Site'
+    sub.mkdir(parents=True)
+    p = sub / 'F1.jpg'
+    _write(p)
+    app = Flask(__name__)
+    with app.test_request_context('/api/images'):
+        resp = images._accel_redirect_response(str(p), str(tmp_path), os.stat(p))
+    assert resp.status_code == 200
+    assert resp.headers['X-Accel-Redirect'] == '/internal-images/Kansas/Lawrence%20Site/F1.jpg'
+    assert resp.get_data() == b''
+    assert resp.mimetype == 'image/jpeg'
+    assert 'max-age=3600' in resp.headers['Cache-Control']
+
+
+def test_accel_redirect_download_sets_attachment_filename(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, 'IMAGE_ACCEL_REDIRECT_PREFIX', '/internal-images')
+    p = tmp_path / 'Schildkröte F1.png'
+    _write(p)
+    app = Flask(__name__)
+    with app.test_request_context('/api/images'):
+        resp = images._accel_redirect_response(str(p), str(tmp_path), os.stat(p), as_attachment=True)
+    disposition = resp.headers['Content-Disposition']
+    assert disposition.startswith('attachment;')
+    assert "filename*=UTF-8''Schildkr%C3%B6te%20F1.png" in disposition
+    assert resp.mimetype == 'image/png'
+
+
+def test_accel_redirect_answers_304_for_matching_etag(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, 'IMAGE_ACCEL_REDIRECT_PREFIX', '/internal-images')
+    p = tmp_path / 'F1.jpg'
+    _write(p)
+    st = os.stat(p)
+    app = Flask(__name__)
+    headers = {'If-None-Match': f'"{images._file_etag(st)}"'}
+    with app.test_request_context('/api/images', headers=headers):
+        resp = images._accel_redirect_response(str(p), str(tmp_path), st)
+    assert resp.status_code == 304
+
+
+def test_accel_redirect_honours_if_modified_since(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, 'IMAGE_ACCEL_REDIRECT_PREFIX', '/internal-images')
+    p = tmp_path / 'F1.jpg'
+    _write(p)
+    st = os.stat(p)
+    app = Flask(__name__)
+    with app.test_request_context('/api/images', headers={'If-Modified-Since': http_date(st.st_mtime + 60)}):
+        resp = images._accel_redirect_response(str(p), str(tmp_path), st)
+    assert resp.status_code == 304
+
+
+def test_is_path_within_base_rejects_traversal_and_prefix_siblings(tmp_path):
+    base = os.path.abspath(str(tmp_path / 'data'))
+    assert images.is_path_within_base(os.path.join(base, 'Kansas', 'F1.jpg'), base)
+    assert not images.is_path_within_base(os.path.join(base, '..', 'secret.jpg'), base)
+    # startswith() would accept this one
+    assert not images.is_path_within_base(base + '_backup' + os.sep + 'F1.jpg', base)
+
+
+def test_mimetype_by_extension_covers_heic():
+    assert images._mimetype('/data/Kansas/F1.JPG') == 'image/jpeg'
+    assert images._mimetype('/data/Kansas/F1.heic') == 'image/heic'
+    assert images._mimetype('/data/Kansas/notes') == 'application/octet-stream'
+
+
+def _preview_app(tmp_path, monkeypatch):
+    """App serving /api/images from tmp_path as the upload temp dir (no manager needed)."""
+    from PIL import Image
+
+    monkeypatch.setattr(images, '_TEMP_DIR_ABS', str(tmp_path))
+    p = tmp_path / 'F1.jpg'
+    Image.new('RGB', (400, 200), (10, 120, 60)).save(p, format='JPEG')
+    app = Flask(__name__)
+    images.register_image_routes(app)
+    return app, f'/api/images?path={p}&max_dim=100'
+
+
+def _dispatch(app, url, headers):
+    # The view's response object: werkzeug strips Last-Modified from a 304 on the wire
+    with app.test_request_context(url, headers=headers):
+        return app.full_dispatch_request()
+
+
+def test_preview_is_served_then_revalidated_with_304(tmp_path, monkeypatch):
+    app, url = _preview_app(tmp_path, monkeypatch)
+
+    first = app.test_client().get(url)
+    assert first.status_code == 200
+    assert first.mimetype == 'image/jpeg'
+    assert first.headers['ETag'] and first.headers['Last-Modified']
+
+    for validator in ({'If-None-Match': first.headers['ETag']},
+                      {'If-Modified-Since': first.headers['Last-Modified']}):
+        assert app.test_client().get(url, headers=validator).status_code == 304
+        resp = _dispatch(app, url, validator)
+        assert resp.status_code == 304
+        assert resp.headers['Last-Modified'] == first.headers['Last-Modified']
+        assert resp.headers['ETag'] == first.headers['ETag']
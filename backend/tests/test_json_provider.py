@@ -0,0 +1,46 @@
+"""``json_provider``: orjson-backed Flask JSON output must match the stdlib provider's."""
+
+import datetime
+import json
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from json_provider import OrjsonProvider, read_json_file
+
+
+@pytest.fixture
+def providers():
+    app = Flask(__name__)
+    return OrjsonProvider(app), DefaultJSONProvider(app)
+
+
+@pytest.mark.parametrize("obj", [
+    {"b": 1, "a": [1, 2.5, None, True], "c": {"z": "ü", "y": ""}},
+    {"when": datetime.date(2024, 5, 1)},
+    [{"rank": 1, "turtle_id": "T42", "confidence": 85}],
+])
+def test_output_parses_to_same_value_as_stdlib(providers, obj):
+    fast, std = providers
+    assert json.loads(fast.dumps(obj)) == json.loads(std.dumps(obj))
+
+
+def test_keys_stay_sorted(providers):
+    fast, _ = providers
+    assert fast.dumps({"b": 1, "a": 2}).replace(" ", "") == '{"a":2,"b":1}'
+
+
+def test_unsupported_type_falls_back_instead_of_raising(providers):
+    fast, _ = providers
+    with pytest.raises(TypeError):
+        fast.dumps({"x": object()})  # same contract as the default provider
+
+
+def test_read_json_file(tmp_path):
+    p = tmp_path / "metadata.json"
+    p.write_bytes(json.dumps({"finder": "Zoë", "photo_type": "plastron"}).encode("utf-8"))
+    assert read_json_file(str(p)) == {"finder": "Zoë", "photo_type": "plastron"}
+    p.write_text("{not json")
+    with pytest.raises(json.JSONDecodeError):
+        read_json_file(str(p))
@@ -0,0 +1,75 @@
+"""``/api/locations`` rescans the data folder only when its folder mtimes change."""
+
+import os
+
+import routes.locations as locations
+
+
+class _CountingManager:
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.scans = 0
+
+    def get_all_locations(self):
+        self.scans += 1
+        return sorted(os.listdir(self.base_dir))
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_locations_are_rescanned_only_after_folder_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(locations, '_locations_cache', None)
+    (tmp_path / 'Kansas').mkdir()
+    manager = _CountingManager(str(tmp_path))
+
+    assert locations._get_locations(manager) == ['Kansas']
+    assert locations._get_locations(manager) == ['Kansas']
+    assert manager.scans == 1
+
+    (tmp_path / 'Kansas' / 'Lawrence').mkdir()
+    _bump_mtime(tmp_path / 'Kansas')  # coarse-mtime filesystems: make the change visible
+    locations._get_locations(manager)
+    assert manager.scans == 2
+
+    (tmp_path / 'Nebraska').mkdir()
+    _bump_mtime(tmp_path)
+    assert locations._get_locations(manager) == ['Kansas', 'Nebraska']
+    assert manager.scans == 3
+
+
+def test_turtle_folder_drops_out_once_its_plastron_folder_appears(tmp_path, monkeypatch):
+    """A turtle folder looks like a location until plastron/ exists; that must not stay cached."""
+    monkeypatch.setattr(locations, '_locations_cache', None)
+    (tmp_path / 'Kansas' / 'T1').mkdir(parents=True)
+    manager = _CountingManager(str(tmp_path))
+
+    def _classify():
+        # Same rule as TurtleManager.get_all_locations
+        manager.scans += 1
+        found = []
+        for state in sorted(os.listdir(tmp_path)):
+            found.append(state)
+            for sub in sorted(os.listdir(tmp_path / state)):
+                if not (tmp_path / state / sub / 'plastron').is_dir():
+                    found.append(f'{state}/{sub}')
+        return found
+
+    manager.get_all_locations = _classify
+    assert locations._get_locations(manager) == ['Kansas', 'Kansas/T1']
+
+    (tmp_path / 'Kansas' / 'T1' / 'plastron').mkdir()
+    _bump_mtime(tmp_path / 'Kansas' / 'T1')
+    assert locations._get_locations(manager) == ['Kansas']
+    assert manager.scans == 2
+
+
+def test_missing_data_dir_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(locations, '_locations_cache', None)
+    manager = _CountingManager(str(tmp_path / 'missing'))
+    manager.get_all_locations = lambda: ['Community_Uploads']
+
+    assert locations._get_locations(manager) == ['Community_Uploads']
+    assert locations._locations_cache is None
@@ -0,0 +1,37 @@
+"""``manager_service.wait_for_manager``: bounded waiting while TurtleManager warms up.
+
+Each test passes its own event: the module's ``manager_ready`` is set by the real
+init thread started on import, whenever that thread happens to finish.
+"""
+
+import threading
+import time
+
+from services import manager_service
+
+
+def test_returns_immediately_once_ready(monkeypatch):
+    ready = threading.Event()
+    ready.set()
+    monkeypatch.setattr(manager_service, "_manager_wait_slots", threading.BoundedSemaphore(1))
+    assert manager_service.wait_for_manager(timeout=30, ready=ready) is True
+
+
+def test_extra_waiters_fail_fast_while_slots_are_taken(monkeypatch):
+    ready = threading.Event()
+    monkeypatch.setattr(manager_service, "_manager_wait_slots", threading.BoundedSemaphore(1))
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(manager_service.wait_for_manager(timeout=5, ready=ready)))
+    waiter.start()
+    time.sleep(0.1)  # let the first caller take the only slot
+
+    t0 = time.perf_counter()
+    assert manager_service.wait_for_manager(timeout=5, ready=ready) is False
+    assert time.perf_counter() - t0 < 1.0
+
+    ready.set()
+    waiter.join(timeout=5)
+    assert results == [True]
+    # Slot was released: later callers see the ready event straight away.
+    assert manager_service.wait_for_manager(timeout=0, ready=ready) is True
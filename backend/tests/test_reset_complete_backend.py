@@ -0,0 +1,81 @@
+"""Tests for reset_complete_backend.py deletion helpers (no Flask or Sheets import)."""
+
+import os
+from unittest.mock import patch
+
+import reset_complete_backend
+from reset_complete_backend import _fast_rmtree, _iter_npz, _remove_files
+
+
+def _make_tree(root):
+    for sub in ("Kansas/Topeka/F001/plastron", "Kansas/Topeka/M002"):
+        os.makedirs(root / sub, exist_ok=True)
+    (root / "Kansas" / "Topeka" / "F001" / "plastron" / "a.jpg").write_bytes(b"x")
+    (root / "Kansas" / "Topeka" / "M002" / "b.jpg").write_bytes(b"x")
+
+
+def test_fast_rmtree_removes_whole_tree(tmp_path):
+    _make_tree(tmp_path)
+    _fast_rmtree(str(tmp_path / "Kansas"))
+    assert not (tmp_path / "Kansas").exists()
+
+
+def test_fast_rmtree_falls_back_without_rm(tmp_path):
+    _make_tree(tmp_path)
+    with patch.object(reset_complete_backend.shutil, "which", return_value=None):
+        _fast_rmtree(str(tmp_path / "Kansas"))
+    assert not (tmp_path / "Kansas").exists()
+
+
+def test_iter_npz_finds_nested_npz_only(tmp_path):
+    _make_tree(tmp_path)
+    (tmp_path / "Kansas" / "Topeka" / "F001" / "plastron" / "a.npz").write_bytes(b"x")
+    (tmp_path / "top.npz").write_bytes(b"x")
+    found = sorted(os.path.relpath(p, tmp_path).replace(os.sep, "/") for p in _iter_npz(str(tmp_path)))
+    assert found == ["Kansas/Topeka/F001/plastron/a.npz", "top.npz"]
+
+
+def test_remove_files_batches_and_counts(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"{i}.npz"
+        path.write_bytes(b"x")
+        paths.append(str(path))
+    with patch.object(reset_complete_backend, "RM_BATCH_SIZE", 2):
+        assert _remove_files(paths) == 5
+    assert not any(os.path.exists(p) for p in paths)
+
+
+def test_remove_files_without_rm(tmp_path):
+    path = tmp_path / "a.npz"
+    path.write_bytes(b"x")
+    with patch.object(reset_complete_backend.shutil, "which", return_value=None):
+        assert _remove_files([str(path)]) == 1
+    assert not path.exists()
+
+
+def test_clear_official_turtle_data_keeps_upload_folders(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    _make_tree(data)
+    _make_tree(data / "Nebraska")
+    (data / "Review_Queue" / "req1").mkdir(parents=True)
+    (data / "Community_Uploads").mkdir()
+    monkeypatch.setattr(reset_complete_backend, "base_dir", str(tmp_path))
+
+    reset_complete_backend.clear_official_turtle_data()
+
+    assert sorted(os.listdir(data)) == ["Community_Uploads", "Review_Queue"]
+    assert (data / "Review_Queue" / "req1").is_dir()
+
+
+def test_clear_uploaded_data_empties_upload_folders(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    (data / "Review_Queue" / "req1").mkdir(parents=True)
+    (data / "Review_Queue" / "note.json").write_text("{}")
+    (data / "Community_Uploads" / "Kansas").mkdir(parents=True)
+    monkeypatch.setattr(reset_complete_backend, "base_dir", str(tmp_path))
+
+    reset_complete_backend.clear_uploaded_data()
+
+    assert os.listdir(data / "Review_Queue") == []
+    assert os.listdir(data / "Community_Uploads") == []
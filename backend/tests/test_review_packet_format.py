@@ -7,7 +7,7 @@ import os
 
 import pytest
 
-from routes.review import format_review_packet_item
+from routes.review import format_review_packet_item, format_review_queue_items, review_queue_body
 
 
 def _write_minimal_jpeg(path: str) -> None:
@@ -99,3 +99,116 @@ def test_candidate_uppercase_jpg_extension_parsed(packet_dir):
     assert item["candidates"][0]["rank"] == 1
     assert item["candidates"][0]["turtle_id"] == "T42"
     assert item["candidates"][0]["confidence"] == 85
+
+
+def test_candidate_turtle_id_containing_id_tag_is_kept_whole(packet_dir):
+    """Only the leading 'ID' tag is stripped from the ID part of a candidate filename."""
+    packet_dir.mkdir()
+    cm = packet_dir / "candidate_matches"
+    cm.mkdir()
+    _write_minimal_jpeg(str(packet_dir / "query.jpg"))
+    _write_minimal_jpeg(str(cm / "Rank3_IDFID12_Conf70.jpg"))
+    item = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+    assert item["candidates"][0]["turtle_id"] == "FID12"
+    assert item["candidates"][0]["rank"] == 3
+    assert item["candidates"][0]["confidence"] == 70
+
+
+def test_candidates_are_returned_in_rank_order(packet_dir):
+    """Rank10 sorts before Rank2 by name; the response must still be ordered by rank."""
+    packet_dir.mkdir()
+    cm = packet_dir / "candidate_matches"
+    cm.mkdir()
+    _write_minimal_jpeg(str(packet_dir / "query.jpg"))
+    _write_minimal_jpeg(str(cm / "Rank10_IDT1_Conf20.jpg"))
+    _write_minimal_jpeg(str(cm / "Rank2_IDT2_Conf80.jpg"))
+    for _ in range(2):  # cold listing, then the cached one
+        item = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+        assert [c["rank"] for c in item["candidates"]] == [2, 10]
+
+
+def test_candidate_listing_refreshes_when_directory_changes(packet_dir):
+    """Parsed candidates are cached by directory mtime; a new candidate file must still show up."""
+    packet_dir.mkdir()
+    cm = packet_dir / "candidate_matches"
+    cm.mkdir()
+    _write_minimal_jpeg(str(packet_dir / "query.jpg"))
+    _write_minimal_jpeg(str(cm / "Rank1_IDT42_Conf85.jpg"))
+    first = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+    assert [c["turtle_id"] for c in first["candidates"]] == ["T42"]
+
+    _write_minimal_jpeg(str(cm / "Rank2_IDT7_Conf60.jpg"))
+    # Coarse-mtime filesystems may not tick between the two writes; force a visible change.
+    st = os.stat(cm)
+    os.utime(cm, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+    assert [c["turtle_id"] for c in second["candidates"]] == ["T42", "T7"]
+
+
+def test_additional_images_manifest_and_loose_files(packet_dir):
+    """Manifest entries keep their type/labels; unlisted images are reported as 'other'."""
+    packet_dir.mkdir()
+    _write_minimal_jpeg(str(packet_dir / "query.jpg"))
+    add = packet_dir / "additional_images"
+    _write_minimal_jpeg(str(add / "micro.jpg"))
+    _write_minimal_jpeg(str(add / "loose.png"))
+    with open(add / "manifest.json", "w") as f:
+        json.dump([{"filename": "micro.jpg", "type": "microhabitat"}, {"filename": "gone.jpg"}], f)
+    item = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+    assert [(a["filename"], a["type"]) for a in item["additional_images"]] == [
+        ("micro.jpg", "microhabitat"),
+        ("loose.png", "other"),
+    ]
+    assert item["uploaded_image"] == str(packet_dir / "query.jpg")
+
+
+def test_metadata_is_parsed_once_until_file_changes(packet_dir, monkeypatch):
+    """metadata.json is served from cache on repeat polls and re-read after it is rewritten."""
+    import routes.review as review
+
+    packet_dir.mkdir()
+    _write_minimal_jpeg(str(packet_dir / "query.jpg"))
+    meta = packet_dir / "metadata.json"
+    meta.write_text(json.dumps({"finder": "first"}))
+    calls = []
+    real_read = review.read_json_file
+    monkeypatch.setattr(review, "read_json_file", lambda p: calls.append(p) or real_read(p))
+
+    first = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+    first["metadata"]["finder"] = "mutated by caller"
+    second = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+    assert second["metadata"]["finder"] == "first"
+    assert calls.count(str(meta)) == 1
+
+    meta.write_text(json.dumps({"finder": "second", "photo_type": "carapace"}))
+    third = format_review_packet_item(str(packet_dir), "Req_unit_test_packet")
+    assert third["metadata"]["finder"] == "second"
+    assert third["photo_type"] == "carapace"
+
+
+def test_format_review_queue_items_keeps_queue_order(tmp_path):
+    """Packets are formatted concurrently but returned in the manager's order."""
+    queue = []
+    for i in range(12):
+        d = tmp_path / f"Req_{i:02d}"
+        d.mkdir()
+        _write_minimal_jpeg(str(d / "query.jpg"))
+        queue.append({"request_id": d.name, "path": str(d)})
+    items = format_review_queue_items(queue)
+    assert [it["request_id"] for it in items] == [q["request_id"] for q in queue]
+
+
+def test_review_queue_body_matches_jsonify_shape(tmp_path):
+    """The incrementally built body parses to the same object jsonify would have sent."""
+    queue = []
+    for name in ("Req_a", "Req_b", "Req_c"):
+        d = tmp_path / name
+        d.mkdir()
+        _write_minimal_jpeg(str(d / "query.jpg"))
+        queue.append({"path": str(d), "request_id": name})
+    dumps = lambda obj: json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+    body = review_queue_body(queue, dumps)
+
+    assert body == dumps({"success": True, "items": format_review_queue_items(queue)})
+    assert json.loads(review_queue_body([], dumps)) == {"items": [], "success": True}
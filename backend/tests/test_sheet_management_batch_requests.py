@@ -0,0 +1,52 @@
+"""Structural edits (new tab, column inserts) go out as one spreadsheets.batchUpdate."""
+
+from unittest.mock import MagicMock, patch
+
+from sheets import sheet_management as sm
+from sheets.columns import CANONICAL_COLUMN_ORDER
+
+
+def _service():
+    service = MagicMock()
+    service.spreadsheets.return_value.get.return_value.execute.return_value = {
+        'sheets': [{'properties': {'title': 'Kansas', 'sheetId': 7}}],
+    }
+    return service
+
+
+@patch.object(sm, '_build_general_location_validation_values', return_value=['', 'Pond'])
+def test_create_sheet_adds_tab_headers_and_dropdown_in_one_call(_mock_values):
+    service = _service()
+    headers = list(CANONICAL_COLUMN_ORDER)
+
+    assert sm.create_sheet_with_headers(service, 'sid', 'Nebraska', {}, lambda: ['Kansas'], header_order=headers)
+
+    batch_update = service.spreadsheets.return_value.batchUpdate
+    batch_update.assert_called_once()
+    requests = batch_update.call_args.kwargs['body']['requests']
+    assert [next(iter(r)) for r in requests] == ['addSheet', 'updateCells', 'setDataValidation']
+    props = requests[0]['addSheet']['properties']
+    assert props['gridProperties']['columnCount'] >= len(headers)
+    # Every request addresses the tab by the sheetId chosen for addSheet
+    assert requests[1]['updateCells']['start']['sheetId'] == props['sheetId']
+    assert requests[2]['setDataValidation']['range']['sheetId'] == props['sheetId']
+    cells = requests[1]['updateCells']['rows'][0]['values']
+    assert [c['userEnteredValue']['stringValue'] for c in cells] == headers
+    service.spreadsheets.return_value.values.return_value.update.assert_not_called()
+
+
+@patch.object(sm, '_read_header_row_list', return_value=['Primary ID', 'Name', 'ID'])
+def test_missing_columns_are_inserted_with_headers_in_one_call(_mock_headers):
+    service = _service()
+    invalidate = MagicMock()
+
+    assert sm.ensure_missing_columns_for_turtle_write(
+        service, 'sid', 'Kansas', {'notes': 'x', 'transmitter_type': 'VHF'},
+        lambda _n: {'Primary ID': 0, 'Name': 1, 'ID': 2}, invalidate,
+    )
+
+    batch_update = service.spreadsheets.return_value.batchUpdate
+    batch_update.assert_called_once()
+    requests = batch_update.call_args.kwargs['body']['requests']
+    assert [next(iter(r)) for r in requests] == ['insertDimension', 'updateCells'] * 2
+    invalidate.assert_called_once_with('Kansas')
@@ -4,13 +4,17 @@ Ensures COLUMN_MAPPING and FIELD_TO_COLUMN include the new fields so that
 GET/POST/PUT turtle data can read/write them when the sheet has those columns.
 """
 
+import pytest
+
 from sheets.columns import (
+    CANONICAL_COLUMN_INDICES,
     CANONICAL_COLUMN_ORDER,
     COLUMN_MAPPING,
     FIELD_TO_COLUMN,
     collect_missing_headers_for_turtle_data,
     compute_insert_index_for_missing_column,
 )
+from sheets.helpers import header_column_indices
 
 # Current sheet morphometrics (short headers) + mass
 CANONICAL_MORPH_HEADERS = {
@@ -76,3 +80,19 @@ def test_collect_missing_headers_skips_empty_values():
     miss = collect_missing_headers_for_turtle_data(td, existing)
     assert 'Species' in miss
     assert 'Name' not in miss
+
+
+def test_mappings_are_read_only():
+    with pytest.raises(TypeError):
+        COLUMN_MAPPING['Name'] = 'x'
+    with pytest.raises(TypeError):
+        FIELD_TO_COLUMN['name'] = 'x'
+
+
+def test_canonical_header_row_shares_precomputed_indices():
+    assert header_column_indices(list(CANONICAL_COLUMN_ORDER)) is CANONICAL_COLUMN_INDICES
+    assert CANONICAL_COLUMN_INDICES['ID'] == 2
+
+
+def test_non_canonical_header_row_strips_and_keeps_first_duplicate():
+    assert header_column_indices([' Primary ID ', '', 'ID', 'Primary ID']) == {'Primary ID': 0, 'ID': 2}
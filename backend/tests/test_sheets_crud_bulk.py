@@ -0,0 +1,160 @@
+"""Bulk turtle reads/writes: one values.batchGet / values.batchUpdate for many turtles."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from sheets.crud import (
+    create_turtle_data_bulk,
+    find_turtle_sheet,
+    get_turtle_data,
+    get_turtle_data_bulk,
+    update_turtle_data_bulk,
+)
+
+from tests.fakes.google_sheets_api_fake import GoogleSheetsValuesFake
+
+
+def _grid():
+    return [
+        ['Primary ID', 'Name', 'ID'],
+        ['T1', 'Shelly', 'F001'],
+        ['', 'NoPrimary', 'M002'],
+        ['T3', 'Third', 'U003'],
+    ]
+
+
+def _ensure_pi(_name):
+    return True
+
+
+def _sheets():
+    return ['Kansas']
+
+
+def test_bulk_get_reads_tab_once_and_maps_rows():
+    fake = GoogleSheetsValuesFake(grid=_grid())
+
+    found = get_turtle_data_bulk(fake, 'sid', {'Kansas': ['T1', 'T3', 'M002', 'missing']}, _ensure_pi, _sheets)
+
+    assert fake.batch_get_calls == 1
+    kansas = found['Kansas']
+    assert set(kansas) == {'T1', 'T3', 'M002'}
+    assert kansas['T1']['name'] == 'Shelly' and kansas['T1']['row_index'] == 2
+    # Matched via biology ID column: requested id stands in for the empty Primary ID
+    assert kansas['M002']['primary_id'] == 'M002' and kansas['M002']['row_index'] == 3
+
+
+def test_single_get_goes_through_bulk_path():
+    fake = GoogleSheetsValuesFake(grid=_grid())
+
+    data = get_turtle_data(fake, 'sid', 'F001', 'Kansas', ensure_primary_id_column_func=_ensure_pi, list_sheets_func=_sheets)
+
+    assert data['primary_id'] == 'T1' and data['sheet_name'] == 'Kansas'
+    assert fake.batch_get_calls == 1
+
+
+def test_missing_sheet_is_skipped_without_failing_the_batch():
+    fake = GoogleSheetsValuesFake(grid=_grid())
+
+    found = get_turtle_data_bulk(fake, 'sid', {'Kansas': ['T1'], 'Nowhere': ['T9']}, _ensure_pi, _sheets)
+
+    assert list(found) == ['Kansas']
+
+
+@patch('sheets.crud.apply_deceased_row_background')
+@patch('sheets.crud.sheet_management.ensure_missing_columns_for_turtle_write')
+def test_bulk_update_writes_all_rows_in_one_call(_mock_missing, _mock_deceased):
+    fake = GoogleSheetsValuesFake(grid=_grid())
+
+    results = update_turtle_data_bulk(
+        fake, 'sid',
+        [('T1', 'Kansas', {'name': 'Renamed'}), ('M002', 'Kansas', {'name': 'Second'}), ('nope', 'Kansas', {'name': 'x'})],
+        _ensure_pi, _sheets, lambda _n: {},
+    )
+
+    assert results == [True, True, False]
+    assert fake.batch_get_calls == 1 and fake.batch_update_calls == 1
+    assert fake.grid[1][:3] == ['T1', 'Renamed', 'F001']
+    # Row matched by biology ID and no Primary ID in payload: falls back to the requested id
+    assert fake.grid[2][:3] == ['M002', 'Second', 'M002']
+    assert fake.grid[3][1] == 'Third'
+
+
+@patch('sheets.crud.apply_deceased_row_background')
+@patch('sheets.crud.sheet_management.ensure_missing_columns_for_turtle_write')
+def test_two_updates_to_the_same_row_are_merged(_mock_missing, mock_deceased):
+    fake = GoogleSheetsValuesFake(grid=_grid())
+
+    results = update_turtle_data_bulk(
+        fake, 'sid',
+        [('T3', 'Kansas', {'name': 'First'}), ('U003', 'Kansas', {'id': 'U004'})],
+        _ensure_pi, _sheets, lambda _n: {},
+    )
+
+    assert results == [True, True]
+    assert fake.grid[3][:3] == ['T3', 'First', 'U004']
+    assert mock_deceased.call_count == 1
+
+
+def test_header_from_batch_get_skips_primary_id_check():
+    fake = GoogleSheetsValuesFake(grid=_grid())
+    calls = []
+
+    get_turtle_data_bulk(fake, 'sid', {'Kansas': ['T1']}, calls.append, _sheets)
+
+    assert calls == []
+    assert fake.batch_get_calls == 1
+
+
+def test_tab_without_primary_id_is_reread_after_the_column_is_added():
+    fake = GoogleSheetsValuesFake(grid=[['Name', 'ID'], ['Shelly', 'F001']])
+
+    def _add_primary_id(_name):
+        fake.grid = [['Primary ID', 'Name', 'ID'], ['', 'Shelly', 'F001']]
+        return True
+
+    found = get_turtle_data_bulk(fake, 'sid', {'Kansas': ['F001']}, _add_primary_id, _sheets)
+
+    assert fake.batch_get_calls == 2
+    assert found['Kansas']['F001']['row_index'] == 2
+
+
+@patch('sheets.crud.apply_deceased_row_background')
+@patch('sheets.crud.sheet_management.ensure_missing_columns_for_turtle_write')
+def test_update_skips_column_insert_when_header_has_every_field(mock_missing, _mock_deceased):
+    fake = GoogleSheetsValuesFake(grid=_grid())
+
+    update_turtle_data_bulk(fake, 'sid', [('T1', 'Kansas', {'name': 'Renamed'})], _ensure_pi, _sheets, lambda _n: {})
+
+    mock_missing.assert_not_called()
+    assert fake.batch_get_calls == 1
+
+
+@patch('sheets.crud.apply_deceased_row_background')
+@patch('sheets.crud.sheet_management.ensure_missing_columns_for_turtle_write')
+def test_bulk_create_writes_consecutive_rows_in_one_call(_mock_missing, mock_deceased):
+    fake = GoogleSheetsValuesFake(grid=_grid())
+
+    created = create_turtle_data_bulk(
+        fake, 'sid',
+        [{'primary_id': 'T4', 'name': 'Four'}, {'primary_id': 'T5', 'name': 'Five', 'deceased': 'Yes'}],
+        'Kansas', ensure_primary_id_column_func=_ensure_pi,
+        get_all_column_indices_func=lambda _n: {'Primary ID': 0, 'Name': 1, 'ID': 2},
+    )
+
+    assert created == ['T4', 'T5']
+    assert fake.batch_update_calls == 1
+    assert [row[:2] for row in fake.grid[4:]] == [['T4', 'Four'], ['T5', 'Five']]
+    mock_deceased.assert_called_once_with(fake, 'sid', 'Kansas', 6, True)
+
+
+def test_find_turtle_sheet_reads_every_tab_in_two_batch_gets():
+    fake = GoogleSheetsValuesFake(grid=_grid())
+    tabs = lambda: ['Kansas', 'Nebraska', 'Iowa']
+
+    assert find_turtle_sheet(fake, 'sid', 'T3', tabs) == 'Kansas'
+    # Biology ID column is the fallback; the empty Primary ID cell doesn't hide row 3
+    assert find_turtle_sheet(fake, 'sid', 'M002', tabs) == 'Kansas'
+    assert find_turtle_sheet(fake, 'sid', 'missing', tabs) is None
+    assert fake.batch_get_calls == 6
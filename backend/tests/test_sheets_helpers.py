@@ -0,0 +1,18 @@
+"""A1-notation helpers: column letters (lookup table + fallback) and sheet-name escaping."""
+
+from sheets.helpers import _column_letter, column_index_to_letter, escape_sheet_name
+
+
+def test_column_letters_match_a1_notation():
+    assert [column_index_to_letter(i) for i in (0, 25, 26, 51, 701, 702, 18277)] == [
+        'A', 'Z', 'AA', 'AZ', 'ZZ', 'AAA', 'ZZZ',
+    ]
+
+
+def test_lookup_table_agrees_with_arithmetic():
+    assert all(column_index_to_letter(i) == _column_letter(i) for i in range(800))
+
+
+def test_escape_sheet_name_quotes_names_with_spaces_only():
+    assert escape_sheet_name('Kansas') == 'Kansas'
+    assert escape_sheet_name('North Topeka') == "'North Topeka'"
@@ -0,0 +1,58 @@
+"""sheets.retry: jittered exponential backoff around one Sheets API attempt."""
+
+import ssl
+from unittest.mock import MagicMock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from sheets import retry
+
+
+def _http_error(status):
+    return HttpError(MagicMock(status=status), b'')
+
+
+def test_backoff_grows_and_is_capped():
+    with patch.object(retry.random, 'uniform', return_value=0):
+        delays = [retry.backoff_delay(attempt) for attempt in range(8)]
+    assert delays[:3] == [0.2, 0.4, 0.8]
+    assert max(delays) == retry.RETRY_MAX_WAIT_SEC
+
+
+@patch.object(retry.time, 'sleep')
+def test_connection_error_reconnects_and_retries(mock_sleep):
+    func = MagicMock(side_effect=[ssl.SSLError('DECRYPTION_FAILED_OR_BAD_RECORD_MAC'), 'ok'])
+    reconnect = MagicMock()
+
+    assert retry.call_with_retry(func, 'test', on_connection_error=reconnect) == 'ok'
+    assert reconnect.call_count == 1 and mock_sleep.call_count == 1
+
+
+@patch.object(retry.time, 'sleep')
+def test_rate_limit_retries_without_reconnecting(mock_sleep):
+    func = MagicMock(side_effect=[_http_error(429), _http_error(503), 'ok'])
+    reconnect = MagicMock()
+
+    assert retry.call_with_retry(func, 'test', on_connection_error=reconnect) == 'ok'
+    reconnect.assert_not_called()
+    assert mock_sleep.call_count == 2
+
+
+@patch.object(retry.time, 'sleep')
+def test_client_errors_are_not_retried(mock_sleep):
+    func = MagicMock(side_effect=_http_error(400))
+
+    with pytest.raises(HttpError):
+        retry.call_with_retry(func, 'test')
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch.object(retry.time, 'sleep')
+def test_gives_up_after_max_attempts(_mock_sleep):
+    func = MagicMock(side_effect=ConnectionResetError('reset by peer'))
+
+    with pytest.raises(ConnectionResetError):
+        retry.call_with_retry(func, 'test', max_attempts=3)
+    assert func.call_count == 3
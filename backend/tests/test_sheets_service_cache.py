@@ -0,0 +1,166 @@
+"""GoogleSheetsService in-process caches: dropped by our own writes, misses fetched once."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import google_sheets_service
+from google_sheets_service import GoogleSheetsService
+
+
+@pytest.fixture
+def sheets_service(tmp_path):
+    creds = tmp_path / 'creds.json'
+    creds.write_text('{}')
+    with patch.object(google_sheets_service.service_account.Credentials, 'from_service_account_file', return_value=MagicMock()), \
+            patch.object(google_sheets_service, 'authorized_session', return_value=MagicMock()), \
+            patch.object(google_sheets_service, '_sheets_discovery_document', return_value={}), \
+            patch.object(google_sheets_service, 'build_from_document', return_value=MagicMock()):
+        yield GoogleSheetsService(spreadsheet_id='sid', credentials_path=str(creds))
+
+
+def test_list_sheets_is_cached_until_invalidated(sheets_service):
+    svc = sheets_service
+    with patch.object(google_sheets_service.sheet_management, 'list_sheets', return_value=['Kansas']) as fetch:
+        assert svc.list_sheets() == ['Kansas']
+        assert svc.list_sheets() == ['Kansas']
+        assert fetch.call_count == 1
+        svc._invalidate_list_sheets_cache()
+        svc.list_sheets()
+        assert fetch.call_count == 2
+
+
+def test_header_read_that_raced_a_column_insert_is_not_served(sheets_service):
+    svc = sheets_service
+
+    def _read_during_insert(*_args):
+        svc._invalidate_column_indices_cache('Kansas')  # another thread inserted a column mid-read
+        return {'Name': 0}
+
+    with patch.object(google_sheets_service.helpers, 'get_all_column_indices', side_effect=_read_during_insert) as fetch:
+        svc._get_all_column_indices('Kansas')
+        fetch.side_effect = None
+        fetch.return_value = {'Primary ID': 0, 'Name': 1}
+        assert svc._get_all_column_indices('Kansas') == {'Primary ID': 0, 'Name': 1}
+        assert svc._get_all_column_indices('Kansas') == {'Primary ID': 0, 'Name': 1}
+        assert fetch.call_count == 2
+
+
+def test_turtle_reads_are_cached_until_the_tab_is_written(sheets_service):
+    svc = sheets_service
+    row = {'primary_id': 'T1', 'name': 'Shelly', 'sheet_name': 'Kansas', 'row_index': 2}
+    with patch.object(google_sheets_service.crud, 'get_turtle_data', return_value=dict(row)) as fetch, \
+            patch.object(google_sheets_service.crud, 'update_turtle_data_bulk', return_value=[True]):
+        first = svc.get_turtle_data('T1', 'Kansas')
+        first['name'] = 'mutated by caller'
+        assert svc.get_turtle_data('T1', 'Kansas')['name'] == 'Shelly'
+        assert fetch.call_count == 1
+
+        svc.update_turtle_data('T1', {'name': 'Renamed'}, 'Kansas')
+        svc.get_turtle_data('T1', 'Kansas')
+        assert fetch.call_count == 2
+
+
+def test_update_with_empty_sheet_name_is_rejected_before_any_write(sheets_service, caplog):
+    with patch.object(google_sheets_service.crud, 'update_turtle_data_bulk') as write:
+        with pytest.raises(ValueError):
+            sheets_service.update_turtle_data('T1', {'name': 'Renamed'}, '  ')
+    write.assert_not_called()
+    assert 'sheet_name is empty' in caplog.text
+
+
+def test_turtle_read_that_raced_a_write_is_not_cached(sheets_service):
+    svc = sheets_service
+
+    def _read_during_delete(*_args):
+        svc._drop_cached_turtles(['Kansas'])
+        return {'primary_id': 'T1', 'row_index': 5}
+
+    with patch.object(google_sheets_service.crud, 'get_turtle_data', side_effect=_read_during_delete) as fetch:
+        svc.get_turtle_data('T1', 'Kansas')
+        svc.get_turtle_data('T1', 'Kansas')
+        assert fetch.call_count == 2
+
+
+def test_delete_locates_the_row_fresh_not_from_the_cached_map(sheets_service):
+    svc = sheets_service
+    # A researcher inserted a row above T2 in the Sheets UI, so T2 moved from row 3 to row 4
+    service = MagicMock()
+    service.spreadsheets.return_value.get.return_value.execute.return_value = {
+        'sheets': [{'properties': {'title': 'Kansas', 'sheetId': 7}}]
+    }
+    with patch.object(GoogleSheetsService, 'service', new=service), \
+            patch.object(google_sheets_service.sheet_management, 'get_row_index',
+                         return_value={'T1': 2, 'NEW': 3, 'T2': 4}) as fresh_read:
+        assert svc.delete_turtle_data('T2', 'Kansas') is True
+        assert fresh_read.call_count == 1
+
+    body = service.spreadsheets.return_value.batchUpdate.call_args.kwargs['body']
+    assert body['requests'][0]['deleteDimension']['range'] == {
+        'sheetId': 7, 'dimension': 'ROWS', 'startIndex': 3, 'endIndex': 4,
+    }
+
+
+def test_concurrent_misses_share_one_fetch(sheets_service):
+    svc = sheets_service
+    release = threading.Event()
+    calls = []
+
+    def _slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return ['Kansas']
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(svc._single_flight('k', _slow_fetch))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)  # let every thread reach the in-flight call
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert results == [['Kansas']] * 4
+    assert svc._inflight == {}
+
+
+def test_cached_column_indices_are_read_only(sheets_service):
+    svc = sheets_service
+    with patch.object(google_sheets_service.helpers, 'get_all_column_indices', return_value={'Primary ID': 0}):
+        indices = svc._get_all_column_indices('Kansas')
+        with pytest.raises(TypeError):
+            indices['Name'] = 1
+        assert dict(svc._get_all_column_indices('Kansas')) == {'Primary ID': 0}
+
+
+def test_header_ttl_grows_while_unchanged_and_resets_on_change(sheets_service):
+    svc = sheets_service
+    clock = [1000.0]
+    with patch.object(google_sheets_service.time, 'time', side_effect=lambda: clock[0]), \
+            patch.object(google_sheets_service.helpers, 'get_all_column_indices', return_value={'Primary ID': 0}) as fetch:
+        svc._get_all_column_indices('Kansas')
+        for _ in range(5):
+            clock[0] += svc._column_indices_cache['Kansas'][3]
+            svc._get_all_column_indices('Kansas')
+        assert svc._column_indices_cache['Kansas'][3] == svc.COLUMN_INDICES_CACHE_MAX_TTL_SEC
+        assert fetch.call_count == 6
+
+        fetch.return_value = {'Name': 0, 'Primary ID': 1}  # columns moved in the Sheets UI
+        clock[0] += svc.COLUMN_INDICES_CACHE_MAX_TTL_SEC
+        assert svc._get_all_column_indices('Kansas') == {'Name': 0, 'Primary ID': 1}
+        assert svc._column_indices_cache['Kansas'][3] == svc.COLUMN_INDICES_CACHE_TTL_SEC
+
+
+def test_created_sheet_is_written_through_to_the_caches(sheets_service):
+    svc = sheets_service
+    with patch.object(google_sheets_service.sheet_management, 'list_sheets', return_value=['Kansas']) as list_fetch, \
+            patch.object(google_sheets_service.sheet_management, 'create_sheet_with_headers', return_value=True), \
+            patch.object(google_sheets_service.helpers, 'get_all_column_indices') as header_fetch:
+        assert svc.create_sheet_with_headers('Nebraska')
+        assert svc.list_sheets() == ['Kansas', 'Nebraska']
+        assert svc._get_all_column_indices('Nebraska')['Primary ID'] == 0
+        assert list_fetch.call_count == 1
+        header_fetch.assert_not_called()
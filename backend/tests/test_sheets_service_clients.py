@@ -0,0 +1,75 @@
+"""GoogleSheetsService hands each thread its own API client (httplib2 is not thread-safe)."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import google_sheets_service
+from google_sheets_service import GoogleSheetsService
+
+
+@pytest.fixture
+def sheets_service(tmp_path):
+    creds = tmp_path / 'creds.json'
+    creds.write_text('{}')
+    with patch.object(google_sheets_service.service_account.Credentials, 'from_service_account_file', return_value=MagicMock()), \
+            patch.object(google_sheets_service, 'authorized_session', side_effect=lambda creds: MagicMock(name='session')), \
+            patch.object(google_sheets_service, '_sheets_discovery_document', return_value={}), \
+            patch.object(google_sheets_service, 'build_from_document', side_effect=lambda *a, **kw: MagicMock(name='client')) as build:
+        svc = GoogleSheetsService(spreadsheet_id='sid', credentials_path=str(creds))
+        yield svc, build
+
+
+def test_same_thread_reuses_client(sheets_service):
+    svc, build = sheets_service
+    assert svc.service is svc.service
+    assert build.call_count == 1  # built once in __init__
+
+
+def test_each_thread_gets_its_own_client(sheets_service):
+    svc, _ = sheets_service
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(svc.service)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(c) for c in seen + [svc.service]}) == 4
+
+
+def test_reinitialize_rebuilds_client(sheets_service):
+    svc, build = sheets_service
+    before = svc.service
+    svc._reinitialize_service()
+    assert svc.service is not before
+    assert build.call_count == 2
+
+
+def test_reinitialize_reuses_parsed_credentials(sheets_service):
+    svc, _ = sheets_service
+    credentials = svc._credentials
+    with patch.object(google_sheets_service.service_account.Credentials, 'from_service_account_file') as load:
+        svc._reinitialize_service()
+    load.assert_not_called()
+    assert svc._credentials is credentials
+
+
+def test_clients_share_one_pooled_session(sheets_service):
+    svc, build = sheets_service
+    t = threading.Thread(target=lambda: svc.service)
+    t.start()
+    t.join()
+    sessions = {id(call.kwargs['http'].session) for call in build.call_args_list}
+    assert sessions == {id(svc._session)}
+
+
+def test_discovery_document_is_parsed_once():
+    google_sheets_service._sheets_discovery_document.cache_clear()
+    try:
+        with patch.object(google_sheets_service, 'get_static_doc', return_value='{"name": "sheets"}') as get_doc:
+            first = google_sheets_service._sheets_discovery_document()
+            assert google_sheets_service._sheets_discovery_document() is first
+        assert first == {'name': 'sheets'} and get_doc.call_count == 1
+    finally:
+        google_sheets_service._sheets_discovery_document.cache_clear()
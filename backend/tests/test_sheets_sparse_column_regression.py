@@ -20,6 +20,7 @@ from unittest.mock import patch
 import pytest
 
 from sheets import migration
+from sheets.sheet_management import get_row_index
 from sheets.crud import create_turtle_data
 
 from tests.fakes.google_sheets_api_fake import (
@@ -103,6 +104,23 @@ def test_new_turtle_does_not_overwrite_existing_row_when_primary_id_missing_on_s
     assert (fake.grid[4][0] or '').strip() == 'T177643381185133868'
 
 
+
+def test_row_index_keeps_sheet_rows_when_primary_id_is_sparse(canonical_indices):
+    """The column-major ID read keeps blank cells in place, so rows after a gap map to the right row."""
+    grid = [
+        ['Primary ID', 'Frequency', 'ID'],
+        ['T1', '', 'M617'],
+        ['', '', 'M618'],
+        ['T3', '', 'M619'],
+    ]
+    fake = GoogleSheetsValuesFake(grid=[row[:] for row in grid])
+
+    primary = get_row_index(fake, 'sid', 'Kansas', 'Primary ID', lambda: ['Kansas'], lambda _n: dict(canonical_indices))
+    biology = get_row_index(fake, 'sid', 'Kansas', 'ID', lambda: ['Kansas'], lambda _n: dict(canonical_indices))
+
+    assert primary == {'T1': 2, 'T3': 4}
+    assert biology == {'M617': 2, 'M618': 3, 'M619': 4}
+
 # ── Chat scenario: biology ID U667 vs U637 ─────────────────────────────────────────────
 
 
@@ -0,0 +1,34 @@
+"""``sheets.transport.SessionHttp``: httplib2-style responses from a requests session."""
+
+from unittest.mock import MagicMock
+
+from sheets.transport import SessionHttp
+
+
+def _session(status=200, headers=None, content=b'{"ok": true}'):
+    session = MagicMock()
+    session.request.return_value = MagicMock(
+        status_code=status, headers=headers or {'Content-Type': 'application/json'},
+        content=content, reason='OK',
+    )
+    return session
+
+
+def test_request_returns_httplib2_style_response():
+    session = _session()
+    resp, content = SessionHttp(session, timeout=5).request(
+        'https://sheets.googleapis.com/v4/x', 'POST', body=b'{}', headers={'a': 'b'},
+    )
+
+    assert resp.status == 200
+    assert resp['content-type'] == 'application/json'  # googleapiclient reads lower-case keys
+    assert content == b'{"ok": true}'
+    session.request.assert_called_once_with(
+        'POST', 'https://sheets.googleapis.com/v4/x', data=b'{}', headers={'a': 'b'},
+        timeout=5, allow_redirects=True,
+    )
+
+
+def test_error_status_is_passed_through():
+    resp, _ = SessionHttp(_session(status=429)).request('https://x')
+    assert resp.status == 429
@@ -0,0 +1,207 @@
+"""Tests for streaming upload saves (``upload_utils.save_upload_limited``)."""
+
+import hashlib
+import io
+import os
+import time
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+import upload_utils
+from upload_utils import has_image_magic, save_upload_limited, upload_looks_like_image
+
+_JPEG_HEAD = b'\xff\xd8\xff\xe0'
+
+
+def _upload(data, filename='photo.jpg'):
+    return FileStorage(stream=io.BytesIO(data), filename=filename)
+
+
+def test_saves_whole_file_and_returns_size(tmp_path):
+    data = b'x' * (200 * 1024 + 7)  # spans several copy chunks
+    dest = tmp_path / 'out.jpg'
+
+    written = save_upload_limited(_upload(data), str(dest), max_size=len(data))
+
+    assert written == len(data)
+    assert dest.read_bytes() == data
+
+
+def test_oversize_upload_returns_none_and_leaves_no_file(tmp_path):
+    dest = tmp_path / 'out.jpg'
+
+    written = save_upload_limited(_upload(b'x' * 1025), str(dest), max_size=1024)
+
+    assert written is None
+    assert not dest.exists()
+
+
+def test_empty_upload_writes_empty_file(tmp_path):
+    dest = tmp_path / 'out.jpg'
+
+    assert save_upload_limited(_upload(b''), str(dest), max_size=1024) == 0
+    assert dest.read_bytes() == b''
+
+
+@pytest.mark.parametrize('head', [
+    b'\xff\xd8\xff\xe1' + b'\x00' * 28,
+    b'\x89PNG\r\n\x1a\n' + b'\x00' * 24,
+    b'GIF89a' + b'\x00' * 26,
+    b'RIFF\x10\x00\x00\x00WEBPVP8 ',
+    b'\x00\x00\x00\x18ftypheic' + b'\x00' * 20,
+    b'\x00\x00\x00\x1cftypmif1' + b'\x00' * 20,
+])
+def test_has_image_magic_accepts_allowed_formats(head):
+    assert has_image_magic(head)
+
+
+@pytest.mark.parametrize('head', [b'', b'hello world', b'<html>', b'\x00\x00\x00\x18ftypmp42', b'RIFF\x00\x00\x00\x00WAVE'])
+def test_has_image_magic_rejects_other_content(head):
+    assert not has_image_magic(head)
+
+
+def test_upload_looks_like_image_does_not_consume_stream():
+    upload = _upload(_JPEG_HEAD + b'rest of file')
+    assert upload_looks_like_image(upload)
+    assert upload.stream.read() == _JPEG_HEAD + b'rest of file'
+
+
+# ---- resumable (chunked) uploads ----
+
+
+@pytest.fixture
+def chunk_dir(tmp_path, monkeypatch):
+    d = tmp_path / 'chunked'
+    monkeypatch.setattr(upload_utils, 'CHUNKED_UPLOAD_DIR', str(d))
+    return d
+
+
+def test_chunked_upload_out_of_order_assembles_file(chunk_dir, tmp_path):
+    data = _JPEG_HEAD + bytes(range(256)) * 5000  # ~1.28 MB
+    upload_id = upload_utils.create_chunked_upload('F1.jpg', len(data))
+    size = 512 * 1024
+    ranges = [(s, min(s + size, len(data)) - 1) for s in range(0, len(data), size)]
+    for start, end in reversed(ranges):
+        upload_utils.write_upload_chunk(upload_id, start, end, len(data), data[start:end + 1])
+
+    dest = tmp_path / 'F1.jpg'
+    assert upload_utils.finish_chunked_upload(upload_id, str(dest)) == 'F1.jpg'
+    assert dest.read_bytes() == data
+    assert list(chunk_dir.iterdir()) == []
+
+
+def test_chunked_upload_refuses_to_finish_with_gaps(chunk_dir, tmp_path):
+    upload_id = upload_utils.create_chunked_upload('F1.jpg', 10)
+    upload_utils.write_upload_chunk(upload_id, 0, 4, 10, _JPEG_HEAD + b'a')
+    with pytest.raises(upload_utils.ChunkedUploadError) as exc:
+        upload_utils.finish_chunked_upload(upload_id, str(tmp_path / 'out.jpg'))
+    assert exc.value.status == 409
+    chunks = upload_utils.get_chunked_upload(upload_id)['chunks']
+    assert chunks == {'0': {'end': 4, 'sha256': hashlib.sha256(_JPEG_HEAD + b'a').hexdigest()}}
+
+
+def test_chunked_upload_rejects_bad_ranges_and_ids(chunk_dir):
+    upload_id = upload_utils.create_chunked_upload('F1.jpg', 10)
+    with pytest.raises(upload_utils.ChunkedUploadError):
+        upload_utils.write_upload_chunk(upload_id, 0, 4, 10, _JPEG_HEAD)  # short body
+    with pytest.raises(upload_utils.ChunkedUploadError):
+        upload_utils.write_upload_chunk(upload_id, 0, 4, 10, b'<?php')  # not an image
+    with pytest.raises(upload_utils.ChunkedUploadError) as exc:
+        upload_utils.write_upload_chunk(upload_id, 8, 11, 12, b'abcd')  # wrong total
+    assert exc.value.status == 416
+    with pytest.raises(upload_utils.ChunkedUploadError) as exc:
+        upload_utils.get_chunked_upload('../../etc/passwd')
+    assert exc.value.status == 400
+    with pytest.raises(upload_utils.ChunkedUploadError) as exc:
+        upload_utils.create_chunked_upload('big.jpg', upload_utils.MAX_FILE_SIZE + 1)
+    assert exc.value.status == 413
+
+
+def test_chunked_upload_caps_open_sessions_and_bytes(chunk_dir, monkeypatch):
+    monkeypatch.setattr(upload_utils, 'CHUNKED_UPLOAD_MAX_SESSIONS', 2)
+    monkeypatch.setattr(upload_utils, 'CHUNKED_UPLOAD_MAX_TOTAL_BYTES', 100)
+    upload_utils.create_chunked_upload('a.jpg', 40)
+    with pytest.raises(upload_utils.ChunkedUploadError) as exc:
+        upload_utils.create_chunked_upload('b.jpg', 61)  # would exceed the byte budget
+    assert exc.value.status == 429
+    upload_utils.create_chunked_upload('b.jpg', 60)
+    with pytest.raises(upload_utils.ChunkedUploadError) as exc:
+        upload_utils.create_chunked_upload('c.jpg', 1)  # session cap
+    assert exc.value.status == 429
+
+
+def test_sessions_without_chunks_expire_after_the_idle_ttl(chunk_dir):
+    idle = upload_utils.create_chunked_upload('idle.jpg', 10)
+    busy = upload_utils.create_chunked_upload('busy.jpg', 10)
+    upload_utils.write_upload_chunk(busy, 0, 4, 10, _JPEG_HEAD + b'a')
+
+    later = time.time() + upload_utils.CHUNKED_UPLOAD_IDLE_TTL_SEC + 1
+    assert upload_utils._sweep_stale_sessions(later) == (1, 10)
+    with pytest.raises(upload_utils.ChunkedUploadError):
+        upload_utils.get_chunked_upload(idle)
+    assert upload_utils.get_chunked_upload(busy)['chunks']
+
+
+def test_chunk_racing_finish_is_a_404(chunk_dir, tmp_path, monkeypatch):
+    upload_id = upload_utils.create_chunked_upload('F1.jpg', 10)
+    upload_utils.write_upload_chunk(upload_id, 0, 9, 10, _JPEG_HEAD + b'abcdef')
+    real_read = upload_utils._read_sidecar
+
+    def _finish_after_read(meta_path):
+        meta = real_read(meta_path)
+        monkeypatch.setattr(upload_utils, '_read_sidecar', real_read)
+        upload_utils.finish_chunked_upload(upload_id, str(tmp_path / 'out.jpg'))
+        return meta
+
+    monkeypatch.setattr(upload_utils, '_read_sidecar', _finish_after_read)
+    with pytest.raises(upload_utils.ChunkedUploadError) as exc:
+        upload_utils.write_upload_chunk(upload_id, 0, 9, 10, _JPEG_HEAD + b'abcdef')
+    assert exc.value.status == 404
+
+
+def test_parse_content_range():
+    assert upload_utils.parse_content_range('bytes 0-524287/1048576') == (0, 524287, 1048576)
+    with pytest.raises(upload_utils.ChunkedUploadError):
+        upload_utils.parse_content_range('bytes=0-1')
+
+
+# ---- upload spool files ----
+
+
+def test_temp_upload_path_is_unique_and_keeps_display_name(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_utils, 'UPLOAD_FOLDER', str(tmp_path))
+    a = upload_utils.temp_upload_path('IMG_0001.jpg')
+    b = upload_utils.temp_upload_path('IMG_0001.jpg')
+
+    assert a != b
+    assert os.path.dirname(a) == str(tmp_path)
+    assert upload_utils.upload_display_name(a) == 'IMG_0001.jpg'
+    # after HEIC -> JPEG normalization the prefix is still stripped
+    assert upload_utils.upload_display_name(os.path.splitext(a)[0] + '.jpg') == 'IMG_0001.jpg'
+    assert upload_utils.upload_display_name('/x/photo.jpg') == 'photo.jpg'
+
+
+def test_sweep_temp_uploads_removes_only_old_spool_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_utils, 'UPLOAD_FOLDER', str(tmp_path))
+    monkeypatch.setattr(upload_utils, 'CHUNKED_UPLOAD_DIR', str(tmp_path / 'chunked'))
+    monkeypatch.setattr(upload_utils, 'TEMP_UPLOAD_TTL_SEC', 600)
+    now = time.time()
+    old = now - 3600
+
+    def make(name, mtime):
+        p = tmp_path / name
+        p.write_bytes(_JPEG_HEAD)
+        os.utime(p, (mtime, mtime))
+        return p
+
+    stale_upload = make('turtle_upload_' + 'a' * 32 + '_IMG.jpg', old)
+    stale_extra = make('extra_Req_1_condition_1.png', old)
+    fresh_upload = make('turtle_upload_' + 'b' * 32 + '_IMG.jpg', now)
+    unrelated = make('my_photo_backup.jpg', old)
+    not_image = make('extra_notes.txt', old)
+
+    assert upload_utils.sweep_temp_uploads(now=now) == 2
+
+    assert not stale_upload.exists() and not stale_extra.exists()
+    assert fresh_upload.exists() and unrelated.exists() and not_image.exists()
@@ -561,11 +561,12 @@ class TurtleManager:
     def _cleanup_temp_files(self):
         """Remove orphaned temp files from uploads that were interrupted by a crash.
 
-        Only deletes files in the system temp directory that match TurtleTracker
-        naming patterns and are older than 1 hour.
+        Only deletes files in the upload temp directory (``UPLOAD_FOLDER``, else the
+        system temp directory) that match TurtleTracker naming patterns and are older
+        than 1 hour.
         """
         import tempfile
-        temp_dir = tempfile.gettempdir()
+        temp_dir = os.environ.get('UPLOAD_FOLDER') or tempfile.gettempdir()
         threshold = time.time() - 3600  # 1 hour ago
         cleaned = 0
         # Patterns from upload.py: extra_{request_id}_{type}_{timestamp}{ext},
@@ -1050,9 +1051,11 @@ class TurtleManager:
         self.create_review_packet(saved_path, user_info={"finder": finder_name})
 
     # MERGE FIX: Uses your AI candidate generation, but adds partner's 'additional_images' folder.
-    def create_review_packet(self, image_path, user_info=None, req_id=None):
+    def create_review_packet(self, image_path, user_info=None, req_id=None, query_filename=None):
         """Creates a pending packet in Review Queue, generates candidates, preps extra dirs.
 
+        query_filename names the image's copy inside the packet (default: its basename).
+
         photo_type in user_info controls which VRAM cache to search:
         - 'plastron' (default) or 'carapace' runs matching immediately.
         - 'unclassified' skips matching — admin must classify first via the review queue.
@@ -1067,7 +1070,7 @@ class TurtleManager:
             os.makedirs(packet_dir, exist_ok=True)
 
             # 1. Copy the raw uploaded image into the packet
-            shutil.copy2(image_path, packet_dir)
+            shutil.copy2(image_path, os.path.join(packet_dir, query_filename) if query_filename else packet_dir)
 
             # 2. Determine photo_type from user_info
             meta = user_info if user_info else {}
@@ -2137,7 +2140,7 @@ class TurtleManager:
                 print(f"⚠️ Error deleting packet: {e}")
         elif query_image:
             import tempfile
-            temp_dir = tempfile.gettempdir()
+            temp_dir = os.environ.get('UPLOAD_FOLDER') or tempfile.gettempdir()
             if query_image.startswith(temp_dir):
                 try:
                     os.remove(query_image)
@@ -2793,7 +2796,8 @@ class TurtleManager:
                 into the result list — which also avoids the expensive full-cache pass when
                 a small location has few above-threshold matches.
         """
-        t_start = time.time()
+        # Monotonic, integer-ns clock: wall-clock time.time() jitters with NTP adjustments
+        t_start = time.perf_counter_ns()
         filename = os.path.basename(query_image_path)
 
         # Build location filter: selected location always includes Community_Uploads + Incidental Places
@@ -2813,7 +2817,7 @@ class TurtleManager:
         query_feats = brain.extract_query_features(query_image_path)
         if query_feats is None:
             print(f"⚠️ Could not read query image")
-            return [], time.time() - t_start
+            return [], (time.perf_counter_ns() - t_start) / 1e9
 
         results = brain.match_against_cache(query_feats, loc_filter, photo_type=photo_type)
 
@@ -2826,7 +2830,7 @@ class TurtleManager:
             print(f"📢 Only {len(results)} match(es) in scope — expanding to all locations...")
             results = brain.match_against_cache(query_feats, None, photo_type=photo_type)
 
-        t_elapsed = time.time() - t_start
+        t_elapsed = (time.perf_counter_ns() - t_start) / 1e9
 
         if results:
             print(f"✅ Found {len(results)} matches in {t_elapsed:.2f}s")
@@ -221,22 +221,28 @@ class TurtleDeepMatcher:
     def extract_query_features(self, query_path):
         """Extract SuperPoint features for 4 rotations of a query image.
         Returns list of 4 feature dicts, or None if image can't be read."""
+        # Decode + CLAHE + rotations are CPU-only (OpenCV releases the GIL), so they run
+        # outside the GPU lock and overlap with another thread's inference.
+        rotations = self._load_query_rotations(query_path)
+        if rotations is None:
+            return None
         with self._gpu_lock:
-            return self._extract_query_features_unlocked(query_path)
+            return self._extract_query_features_unlocked(rotations)
 
-    def _extract_query_features_unlocked(self, query_path):
+    def _load_query_rotations(self, query_path):
         img_raw = cv2.imread(query_path, cv2.IMREAD_GRAYSCALE)
         if img_raw is None:
             return None
 
         img_base = self.preprocess_image_robust(img_raw)
-        rotations = [
+        return [
             img_base,
             cv2.rotate(img_base, cv2.ROTATE_90_CLOCKWISE),
             cv2.rotate(img_base, cv2.ROTATE_180),
             cv2.rotate(img_base, cv2.ROTATE_90_COUNTERCLOCKWISE)
         ]
 
+    def _extract_query_features_unlocked(self, rotations):
         query_feats_list = []
         with torch.inference_mode(), torch.autocast(
             device_type=self.device.type, dtype=torch.float16, enabled=self.use_amp
@@ -0,0 +1,289 @@
+"""Helpers for writing uploaded files (werkzeug ``FileStorage`` or resumable chunks) to disk."""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+
+from config import MAX_FILE_SIZE, TEMP_UPLOAD_TTL_SEC, UPLOAD_FOLDER, allowed_file
+
+_COPY_CHUNK_SIZE = 64 * 1024
+
+# Spool files written to UPLOAD_FOLDER: the main upload gets a unique TEMP_UPLOAD_PREFIX name
+# (two users uploading IMG_0001.jpg at once must not share a path); the others are the
+# per-route names for extra / replacement images. sweep_temp_uploads only touches these.
+TEMP_UPLOAD_PREFIX = 'turtle_upload_'
+_TEMP_UPLOAD_PREFIXES = (TEMP_UPLOAD_PREFIX, 'extra_', 'review_extra_', 'turtle_extra_', 'replace_', 'turtle_idplastron_')
+_TEMP_UPLOAD_NAME_RE = re.compile(r'^' + TEMP_UPLOAD_PREFIX + r'[0-9a-f]{32}_')
+
+# Resumable uploads: one ``<upload_id>.part`` data file (pre-sized) plus a ``<upload_id>.json``
+# sidecar per session, so a client on a flaky link re-sends only the ranges that failed.
+# Sessions can sit for up to a day, so they stay on the disk temp dir even when UPLOAD_FOLDER
+# is a (small) tmpfs; the finished file is moved into UPLOAD_FOLDER.
+CHUNKED_UPLOAD_DIR = os.path.join(tempfile.gettempdir(), 'chunked_uploads')
+CHUNK_SIZE_HINT = 512 * 1024
+CHUNKED_UPLOAD_TTL_SEC = 24 * 3600
+# A session that never received a chunk is dropped much sooner, and open sessions are capped
+# in number and in declared bytes (each .part is pre-sized), so init alone can't fill the disk.
+CHUNKED_UPLOAD_IDLE_TTL_SEC = 10 * 60
+CHUNKED_UPLOAD_MAX_SESSIONS = 32
+CHUNKED_UPLOAD_MAX_TOTAL_BYTES = 128 * 1024 * 1024
+_UPLOAD_ID_RE = re.compile(r'^[0-9a-f]{32}\Z')
+_CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)\Z')
+# Sidecar read-modify-write; chunk bodies themselves go to disjoint offsets without it.
+_sidecar_lock = threading.Lock()
+# Sweep + quota check + create as one step, so concurrent inits can't overshoot the caps.
+_session_create_lock = threading.Lock()
+
+
+_SNIFF_BYTES = 32
+# ISO-BMFF major brands used by HEIC/HEIF stills (iPhone photos are ``heic``/``mif1``).
+_HEIF_BRANDS = frozenset((b'heic', b'heix', b'hevc', b'hevx', b'heim', b'heis', b'hevm', b'hevs', b'mif1', b'msf1'))
+
+
+def has_image_magic(head):
+    """True when ``head`` (the first bytes of a file) starts like a JPEG/PNG/GIF/WebP/HEIC image."""
+    if head.startswith((b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'GIF87a', b'GIF89a')):
+        return True
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return True
+    return head[4:8] == b'ftyp' and head[8:12] in _HEIF_BRANDS
+
+
+def upload_looks_like_image(file_storage):
+    """Sniff the upload's magic bytes without consuming it, so garbage is rejected before any disk write."""
+    stream = file_storage.stream
+    head = stream.read(_SNIFF_BYTES)
+    stream.seek(0)
+    return has_image_magic(head)
+
+
+def temp_upload_path(filename):
+    """Unique spool path in UPLOAD_FOLDER for an upload named ``filename`` (already secure_filename'd)."""
+    return os.path.join(UPLOAD_FOLDER, f"{TEMP_UPLOAD_PREFIX}{uuid.uuid4().hex}_{filename}")
+
+
+def upload_display_name(temp_path):
+    """Basename of a temp_upload_path() file without the spool prefix (the name the user uploaded)."""
+    return _TEMP_UPLOAD_NAME_RE.sub('', os.path.basename(temp_path), count=1)
+
+
+def sweep_temp_uploads(now=None):
+    """Delete spool images in UPLOAD_FOLDER older than TEMP_UPLOAD_TTL_SEC, plus stale chunked sessions.
+
+    Returns the number of spool files removed.
+    """
+    now = time.time() if now is None else now
+    removed = 0
+    try:
+        entries = list(os.scandir(UPLOAD_FOLDER))
+    except OSError:
+        entries = []
+    for entry in entries:
+        if not entry.name.startswith(_TEMP_UPLOAD_PREFIXES) or not allowed_file(entry.name):
+            continue
+        try:
+            if entry.is_file(follow_symlinks=False) and now - entry.stat().st_mtime > TEMP_UPLOAD_TTL_SEC:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass
+    _sweep_stale_sessions(now)
+    return removed
+
+
+def save_upload_limited(file_storage, dest_path, max_size=MAX_FILE_SIZE):
+    """Stream ``file_storage`` to ``dest_path`` in one pass, counting bytes as they are copied.
+
+    Replaces the ``seek(0, SEEK_END)`` / ``tell()`` / ``seek(0)`` / ``save()`` sequence, which
+    walks the spooled upload twice. Stops as soon as ``max_size`` is exceeded.
+
+    Returns the number of bytes written, or ``None`` when the upload is larger than
+    ``max_size`` (the partial file is removed).
+    """
+    stream = file_storage.stream
+    total = 0
+    too_large = False
+    with open(dest_path, 'wb') as out:
+        while True:
+            chunk = stream.read(_COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > max_size:
+                too_large = True
+                break
+            out.write(chunk)
+    if too_large:
+        try:
+            os.remove(dest_path)
+        except OSError:
+            pass
+        return None
+    return total
+
+
+class ChunkedUploadError(Exception):
+    """Invalid resumable-upload request; ``status`` is the HTTP code to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _session_paths(upload_id):
+    if not upload_id or not _UPLOAD_ID_RE.match(upload_id):
+        raise ChunkedUploadError('Invalid upload_id')
+    base = os.path.join(CHUNKED_UPLOAD_DIR, upload_id)
+    return base + '.part', base + '.json'
+
+
+def _read_sidecar(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        raise ChunkedUploadError('Unknown or expired upload_id', 404)
+
+
+def _write_sidecar(meta_path, meta):
+    tmp = meta_path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(tmp, meta_path)
+
+
+def _session_expired(files, now):
+    """True when a session's files should go: untouched for CHUNKED_UPLOAD_TTL_SEC, or no chunk
+    within CHUNKED_UPLOAD_IDLE_TTL_SEC of init."""
+    age = now - max(st.st_mtime for st in files.values())
+    if age > CHUNKED_UPLOAD_TTL_SEC:
+        return True
+    if age <= CHUNKED_UPLOAD_IDLE_TTL_SEC:
+        return False
+    meta_path = next((p for p in files if p.endswith('.json')), None)
+    if meta_path is None:
+        return True  # orphaned .part / .tmp
+    try:
+        return not _read_sidecar(meta_path).get('chunks')
+    except ChunkedUploadError:
+        return True
+
+
+def _sweep_stale_sessions(now):
+    """Remove expired sessions; returns ``(sessions, declared_bytes)`` still open."""
+    try:
+        entries = list(os.scandir(CHUNKED_UPLOAD_DIR))
+    except OSError:
+        return 0, 0
+    sessions = {}  # upload_id -> {path: stat}
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        sessions.setdefault(entry.name.split('.', 1)[0], {})[entry.path] = st
+    open_sessions = declared_bytes = 0
+    for files in sessions.values():
+        if _session_expired(files, now):
+            for path in files:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            continue
+        open_sessions += 1
+        declared_bytes += sum(st.st_size for p, st in files.items() if p.endswith('.part'))
+    return open_sessions, declared_bytes
+
+
+def parse_content_range(header):
+    """``'bytes 0-524287/1048576'`` -> ``(0, 524287, 1048576)``."""
+    m = _CONTENT_RANGE_RE.match((header or '').strip())
+    if not m:
+        raise ChunkedUploadError('Content-Range header must be "bytes <start>-<end>/<total>"')
+    start, end, total = (int(g) for g in m.groups())
+    if end < start:
+        raise ChunkedUploadError('Content-Range end before start')
+    return start, end, total
+
+
+def create_chunked_upload(filename, size, max_size=MAX_FILE_SIZE):
+    """Start a session for a ``size``-byte file; returns the new ``upload_id``."""
+    if size <= 0:
+        raise ChunkedUploadError('size must be a positive integer')
+    if size > max_size:
+        raise ChunkedUploadError(f'File too large (max {max_size // (1024 * 1024)}MB)', 413)
+    os.makedirs(CHUNKED_UPLOAD_DIR, exist_ok=True)
+    now = time.time()
+    with _session_create_lock:
+        open_sessions, declared_bytes = _sweep_stale_sessions(now)
+        if (open_sessions >= CHUNKED_UPLOAD_MAX_SESSIONS
+                or declared_bytes + size > CHUNKED_UPLOAD_MAX_TOTAL_BYTES):
+            raise ChunkedUploadError('Too many uploads in progress. Please try again in a few minutes.', 429)
+        upload_id = uuid.uuid4().hex
+        data_path, meta_path = _session_paths(upload_id)
+        with open(data_path, 'wb') as f:
+            f.truncate(size)
+        _write_sidecar(meta_path, {'filename': filename, 'size': size, 'created': now, 'chunks': {}})
+    return upload_id
+
+
+def write_upload_chunk(upload_id, start, end, total, data):
+    """Write bytes ``start..end`` (inclusive) of the file; returns the chunk's sha256 hex digest."""
+    data_path, meta_path = _session_paths(upload_id)
+    meta = _read_sidecar(meta_path)
+    if total != meta['size'] or end >= total:
+        raise ChunkedUploadError('Content-Range does not match the declared file size', 416)
+    if len(data) != end - start + 1:
+        raise ChunkedUploadError('Chunk body length does not match Content-Range')
+    if start == 0 and not has_image_magic(data[:_SNIFF_BYTES]):
+        raise ChunkedUploadError('File content is not a supported image')
+    try:
+        with open(data_path, 'r+b') as f:
+            f.seek(start)
+            f.write(data)
+    except FileNotFoundError:
+        # finish_chunked_upload moved the file (or the sweep expired it) after the sidecar read
+        raise ChunkedUploadError('Unknown or expired upload_id', 404)
+    digest = hashlib.sha256(data).hexdigest()
+    with _sidecar_lock:
+        meta = _read_sidecar(meta_path)
+        meta['chunks'][str(start)] = {'end': end, 'sha256': digest}
+        _write_sidecar(meta_path, meta)
+    return digest
+
+
+def get_chunked_upload(upload_id):
+    """Session state for resume: ``{'filename', 'size', 'chunks': {start: {'end', 'sha256'}}}``."""
+    _, meta_path = _session_paths(upload_id)
+    return _read_sidecar(meta_path)
+
+
+def _covers(chunks, size):
+    pos = 0
+    for start, end in sorted((int(s), c['end']) for s, c in chunks.items()):
+        if start > pos:
+            return False
+        pos = max(pos, end + 1)
+    return pos >= size
+
+
+def finish_chunked_upload(upload_id, dest_path):
+    """Move the assembled file to ``dest_path`` and drop the session; returns the original filename."""
+    data_path, meta_path = _session_paths(upload_id)
+    with _sidecar_lock:
+        meta = _read_sidecar(meta_path)
+        if not _covers(meta['chunks'], meta['size']):
+            raise ChunkedUploadError('Upload incomplete: not all byte ranges were received', 409)
+        shutil.move(data_path, dest_path)  # rename, or copy when UPLOAD_FOLDER is another filesystem
+        try:
+            os.remove(meta_path)
+        except OSError:
+            pass
+    return meta['filename']